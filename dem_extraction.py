@@ -18,9 +18,17 @@ References:
 """
 
 import os
+import sys
 import math
 import traceback
-from typing import Optional, Tuple, List, Dict, Any, Callable
+from collections import OrderedDict
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import IntFlag
+from typing import Optional, Tuple, List, Dict, Any, Callable, Iterable, Sequence, Union
+
+import numpy as np
 
 from qgis.PyQt.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
@@ -28,12 +36,14 @@ from qgis.PyQt.QtWidgets import (
     QSpinBox, QComboBox, QTableWidget, QTableWidgetItem,
     QProgressBar, QRadioButton, QButtonGroup
 )
-from qgis.PyQt.QtCore import Qt, pyqtSignal
+from qgis.PyQt.QtCore import Qt, pyqtSignal, QObject, QThread
 
 from qgis.core import (
     QgsProject, QgsVectorLayer, QgsRasterLayer, QgsFeature,
     QgsGeometry, QgsPointXY, QgsWkbTypes, QgsCoordinateTransform,
-    QgsCoordinateReferenceSystem, QgsRectangle, QgsField
+    QgsCoordinateReferenceSystem, QgsRectangle, QgsField, QgsUnitTypes,
+    QgsLineString, QgsFeatureRequest, QgsSpatialIndex, QgsCsException,
+    QgsVectorLayerFeatureSource, Qgis
 )
 from qgis.analysis import QgsZonalStatistics
 
@@ -43,6 +53,35 @@ try:
 except ImportError:
     HAS_PROCESSING = False
 
+try:
+    from osgeo import gdal
+    HAS_GDAL = True
+except ImportError:
+    HAS_GDAL = False
+
+try:
+    import shapely
+    from shapely import wkb as shapely_wkb
+    try:
+        from shapely import contains_xy as _contains_xy  # Shapely 2.x
+    except ImportError:
+        from shapely.vectorized import contains as _contains_xy  # Shapely 1.8
+    HAS_SHAPELY = True
+except ImportError:
+    HAS_SHAPELY = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 
 # =============================================================================
 # CONSTANTS - INDUSTRY STANDARD THRESHOLDS
@@ -61,6 +100,41 @@ MIN_TC_DEFAULT = 6.0  # minutes - NRCS default (0.1 hour)
 # Sheet flow maximum length per TR-55
 MAX_SHEET_FLOW_LENGTH = 300.0  # feet
 
+# Adaptive high-point search grid (extract_flowpath_simple)
+COARSE_GRID_SIZE = 5  # Initial n x n scan of the subbasin bounding box
+MAX_GRID_SIZE = 64  # Upper bound on effective grid resolution per axis
+
+# DEMs up to this size (as float32) are read into memory once per extractor
+DEM_IN_MEMORY_MAX_BYTES = 1024 ** 3  # 1 GiB
+
+# Outlet points within this fraction of a subbasin's bounding-box diagonal
+# count as that subbasin's outlet (they are usually digitised on the boundary)
+OUTLET_SNAP_FRACTION = 0.01
+
+# Larger DEMs are read in square tiles on demand, keeping the most recent ones
+DEM_TILE_SIZE = 512  # pixels per tile side
+DEM_TILE_CACHE_SIZE = 16  # tiles (16 x 512 x 512 float32 = 16 MiB)
+
+# Minimum GDAL block cache while a tiled DEM is open (GDAL's default is 5% of RAM)
+GDAL_CACHE_MIN_BYTES = 512 * 1024 * 1024
+
+# Subbasins handed to DEMFlowpathExtractor.extract_all per batch by the widget
+EXTRACTION_CHUNK_SIZE = 256
+
+# Widget progress/status is refreshed once per this many subbasins (power of two)
+PROGRESS_UPDATE_INTERVAL = 64
+
+# Unit-square coarse grid (x-major), scaled to each subbasin's bounding box
+_COARSE_U, _COARSE_V = (a.ravel() for a in np.meshgrid(
+    np.linspace(0.0, 1.0, COARSE_GRID_SIZE),
+    np.linspace(0.0, 1.0, COARSE_GRID_SIZE),
+    indexing='ij'
+))
+
+# 3x3 neighbourhood offsets (centre excluded) used to refine the high point
+_NEIGHBOUR_DI = np.array([-1, -1, -1, 0, 0, 1, 1, 1], dtype=np.float64)
+_NEIGHBOUR_DJ = np.array([-1, 0, 1, -1, 1, -1, 0, 1], dtype=np.float64)
+
 # Shallow concentrated flow velocity coefficients (TR-55 Figure 3-1)
 SHALLOW_CONC_COEFFICIENTS = {
     'paved': 20.328,
@@ -86,11 +160,69 @@ SHEET_FLOW_N_VALUES = {
     'woods_dense': 0.80,
 }
 
+# Land type groupings (lower-case) used to pick TC minimums and surface parameters
+_TC_MIN_PAVED_TYPES = frozenset({'paved', 'urban', 'impervious'})
+_TC_MIN_RURAL_TYPES = frozenset({'rural', 'undeveloped', 'natural'})
+_SMOOTH_SURFACE_TYPES = frozenset({'paved', 'urban', 'commercial'})
+_DENSE_GRASS_TYPES = frozenset({'residential', 'suburban'})
+_WOODS_TYPES = frozenset({'woods', 'forest'})
+_KERBY_GRASS_TYPES = frozenset({'rural', 'grass'})
+
+
+# Slope adjustment outcome codes (see _slope_adjustment)
+SLOPE_OK = 0
+SLOPE_ADVERSE = 1
+SLOPE_LOW = 2
+SLOPE_TRANSITIONAL = 3
+
+
+@njit(cache=True)
+def _slope_adjustment(slope_ftft: float) -> Tuple[float, int]:
+    """
+    TxDOT/Cleveland low-slope adjustment without any message formatting
+
+    Returns: (adjusted_slope, code) where code is one of SLOPE_OK,
+    SLOPE_ADVERSE, SLOPE_LOW or SLOPE_TRANSITIONAL.
+    """
+    if slope_ftft < 0:
+        return LOW_SLOPE_ADJUSTMENT, SLOPE_ADVERSE
+    if slope_ftft < MIN_SLOPE_THRESHOLD:
+        return slope_ftft + LOW_SLOPE_ADJUSTMENT, SLOPE_LOW
+    if slope_ftft < TRANSITIONAL_SLOPE_UPPER:
+        return slope_ftft, SLOPE_TRANSITIONAL
+    return slope_ftft, SLOPE_OK
+
+
+def _slope_adjustment_message(slope_ftft: float, adjusted_slope: float, code: int) -> Optional[str]:
+    """Warning text for a _slope_adjustment() outcome (None for SLOPE_OK)"""
+    if code == SLOPE_ADVERSE:
+        return f"Adverse slope detected ({slope_ftft*100:.3f}%). Applied minimum slope of {LOW_SLOPE_ADJUSTMENT*100:.2f}%"
+    if code == SLOPE_LOW:
+        return f"Low slope ({slope_ftft*100:.3f}%). Applied TxDOT adjustment: S + 0.0005 = {adjusted_slope*100:.3f}%"
+    if code == SLOPE_TRANSITIONAL:
+        return f"Transitional slope ({slope_ftft*100:.3f}%). Consider reviewing."
+    return None
+
 
 # =============================================================================
 # DEM EXTRACTION FUNCTIONS
 # =============================================================================
 
+def _block_dtype(data_type) -> Optional[np.dtype]:
+    """NumPy dtype for a QGIS raster block data type (None if unsupported)"""
+    dtypes = {
+        Qgis.DataType.Byte: np.uint8,
+        Qgis.DataType.UInt16: np.uint16,
+        Qgis.DataType.Int16: np.int16,
+        Qgis.DataType.UInt32: np.uint32,
+        Qgis.DataType.Int32: np.int32,
+        Qgis.DataType.Float32: np.float32,
+        Qgis.DataType.Float64: np.float64,
+    }
+    dtype = dtypes.get(data_type)
+    return np.dtype(dtype) if dtype is not None else None
+
+
 class DEMFlowpathExtractor:
     """
     Extract flowpath properties from DEM for TC calculation
@@ -102,7 +234,9 @@ class DEMFlowpathExtractor:
     """
     
     def __init__(self, dem_layer: QgsRasterLayer, subbasin_layer: QgsVectorLayer,
-                 outlet_layer: Optional[QgsVectorLayer] = None):
+                 outlet_layer: Optional[QgsVectorLayer] = None,
+                 outlet_index: Optional[QgsSpatialIndex] = None,
+                 dem_meta: Optional[Dict[str, Any]] = None):
         self.dem = dem_layer
         self.subbasins = subbasin_layer
         self.outlets = outlet_layer
@@ -110,21 +244,271 @@ class DEMFlowpathExtractor:
         # Ensure CRS match
         self.dem_crs = dem_layer.crs()
         self.target_crs = subbasin_layer.crs()
-        
-        # Get DEM properties
+
+        # Outlet points indexed once (geometries stored, in subbasin CRS)
+        if outlet_index is None and outlet_layer is not None:
+            outlet_index = self.build_outlet_index(outlet_layer, self.target_crs)
+        self.outlet_index = outlet_index
+        
+        # Build the subbasin -> DEM transform once; the PROJ pipeline is
+        # expensive to set up and every elevation sample would otherwise pay it
+        self._need_xform = self.target_crs != self.dem_crs
+        self._xform = QgsCoordinateTransform(
+            self.target_crs, self.dem_crs, QgsProject.instance().transformContext()
+        ) if self._need_xform else None
+
+        # Subbasin CRS units -> feet (elevations are assumed to share the unit)
+        meters = self.target_crs.mapUnits() == QgsUnitTypes.DistanceMeters
+        self._to_ft = 3.28084 if meters else 1.0
+
+        # Get DEM properties (read here, on the GUI thread, so worker
+        # threads never have to touch the layer)
         self.dem_extent = dem_layer.extent()
+        self.dem_res = dem_layer.rasterUnitsPerPixelX()
         self.dem_provider = dem_layer.dataProvider()
-        
+
+        # Direct DEM access through GDAL (_dem_gt is None = sample through
+        # the provider). Small DEMs live in _dem_array; larger ones are read
+        # tile by tile from _dem_band into the _dem_tiles LRU cache.
+        self._dem_array = None
+        self._dem_gt = None
+        self._dem_shape = None
+        self._dem_ds = None
+        self._dem_band = None
+        self._dem_nodata = None
+        self._dem_tiles = OrderedDict()
+        self.dem_meta = self._load_dem_array(dem_meta)
+        if self._dem_gt is None:
+            self._load_provider_array()
+
+    @property
+    def direct_sampling(self) -> bool:
+        """True when elevations come from DEM arrays rather than provider.sample()"""
+        return self._dem_gt is not None
+
+    def _load_dem_array(self, dem_meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Set up direct reads of DEM band 1 as float32, with nodata as NaN
+
+        Only done for north-up GDAL rasters. Rasters no larger than
+        DEM_IN_MEMORY_MAX_BYTES are read into memory once; bigger ones keep
+        the dataset open for tiled reads. Anything else keeps using provider
+        sampling.
+
+        Args:
+            dem_meta: Metadata returned by an earlier call for the same DEM
+                file; skips re-querying it (and re-opening unusable DEMs)
+
+        Returns: Metadata dict with 'geotransform' (None when the DEM cannot
+        be read directly), 'shape' (rows, cols) and 'nodata'
+        """
+        unusable = {'geotransform': None, 'shape': None, 'nodata': None}
+        if not HAS_GDAL or self.dem.providerType() != 'gdal':
+            return unusable
+        if dem_meta is not None and dem_meta.get('geotransform') is None:
+            return unusable
+        try:
+            ds = gdal.Open(self.dem.source(), gdal.GA_ReadOnly)
+            if ds is None:
+                return unusable
+            if dem_meta is not None:
+                gt = dem_meta['geotransform']
+                nodata = dem_meta['nodata']
+            else:
+                gt = ds.GetGeoTransform()
+                if gt[2] != 0 or gt[4] != 0:  # Rotated rasters need full affine math
+                    return unusable
+                nodata = ds.GetRasterBand(1).GetNoDataValue()
+            band = ds.GetRasterBand(1)
+            if ds.RasterXSize * ds.RasterYSize * 4 > DEM_IN_MEMORY_MAX_BYTES:
+                # Keep one dataset handle for the extractor's lifetime so tile
+                # reads share GDAL's block cache instead of re-opening the file
+                self._dem_ds = ds
+                self._dem_band = band
+                if gdal.GetCacheMax() < GDAL_CACHE_MIN_BYTES:
+                    gdal.SetCacheMax(GDAL_CACHE_MIN_BYTES)
+            else:
+                arr = band.ReadAsArray(buf_type=gdal.GDT_Float32)
+                if arr is None:
+                    return unusable
+                arr = np.ascontiguousarray(arr, dtype=np.float32)
+                if nodata is not None:
+                    arr[arr == np.float32(nodata)] = np.nan
+                self._dem_array = arr
+        except RuntimeError:
+            return unusable
+        self._dem_nodata = nodata
+        self._dem_shape = (ds.RasterYSize, ds.RasterXSize)
+        self._dem_gt = gt
+        return {'geotransform': gt, 'shape': self._dem_shape, 'nodata': nodata}
+
+    @staticmethod
+    def build_outlet_index(outlet_layer: QgsVectorLayer,
+                           target_crs: QgsCoordinateReferenceSystem) -> QgsSpatialIndex:
+        """Spatial index of outlet points, reprojected to target_crs, with geometries stored"""
+        request = QgsFeatureRequest().setNoAttributes()
+        request.setDestinationCrs(target_crs, QgsProject.instance().transformContext())
+        return QgsSpatialIndex(outlet_layer.getFeatures(request),
+                               flags=QgsSpatialIndex.FlagStoreFeatureGeometries)
+
+    def _find_outlet(self, geom: QgsGeometry) -> Optional[QgsPointXY]:
+        """Lowest indexed outlet point on or near the subbasin; None if there is none"""
+        bbox = geom.boundingBox()
+        tol = OUTLET_SNAP_FRACTION * math.hypot(bbox.width(), bbox.height())
+        search = QgsRectangle(bbox)
+        search.grow(tol)
+
+        points = []
+        for fid in self.outlet_index.intersects(search):
+            pt_geom = self.outlet_index.geometry(fid)
+            if pt_geom.isEmpty() or geom.distance(pt_geom) > tol:
+                continue
+            points.append(pt_geom.asPoint())
+        if not points:
+            return None
+        if len(points) == 1:
+            return points[0]
+
+        elevs = self.sample_elevations(np.array([p.x() for p in points]),
+                                       np.array([p.y() for p in points]))
+        return points[int(np.nanargmin(elevs))] if not np.isnan(elevs).all() else points[0]
+
+    def clone_provider(self):
+        """Sample through a private copy of the DEM provider (for use off the GUI thread)"""
+        self.dem_provider = self.dem.dataProvider().clone()
+
+    def close(self):
+        """Release the DEM dataset handle and any cached DEM data"""
+        self._dem_tiles.clear()
+        self._dem_band = None
+        self._dem_ds = None
+        self._dem_array = None
+        self._dem_gt = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except AttributeError:  # __init__ did not get far enough
+            pass
+
+    def _load_provider_array(self):
+        """
+        Read DEMs that GDAL cannot open directly with one provider.block()
+
+        The block is copied into the same float32/NaN array as the GDAL
+        path, so no per-point provider.sample() calls and no temporary
+        rasters are needed. Skipped for providers without a native raster
+        size (e.g. WMS) or above DEM_IN_MEMORY_MAX_BYTES.
+        """
+        provider = self.dem_provider
+        width, height = provider.xSize(), provider.ySize()
+        if width <= 0 or height <= 0 or width * height * 4 > DEM_IN_MEMORY_MAX_BYTES:
+            return
+        dtype = _block_dtype(provider.dataType(1))
+        if dtype is None:
+            return
+
+        block = provider.block(1, self.dem_extent, width, height)
+        if block is None or not block.isValid():
+            return
+        raw = bytes(block.data())
+        if len(raw) != width * height * dtype.itemsize:
+            return
+        arr = np.frombuffer(raw, dtype=dtype).reshape(height, width).astype(np.float32)
+        if block.hasNoDataValue():
+            arr[arr == np.float32(block.noDataValue())] = np.nan
+
+        extent = self.dem_extent
+        self._dem_array = arr
+        self._dem_shape = (height, width)
+        self._dem_gt = (extent.xMinimum(), extent.width() / width, 0.0,
+                        extent.yMaximum(), 0.0, -extent.height() / height)
+
+    def _read_tile(self, ti: int, tj: int) -> np.ndarray:
+        """DEM tile (ti, tj) as float32 with nodata as NaN, via the LRU cache"""
+        key = (ti, tj)
+        tile = self._dem_tiles.get(key)
+        if tile is not None:
+            self._dem_tiles.move_to_end(key)
+            return tile
+
+        yoff, xoff = ti * DEM_TILE_SIZE, tj * DEM_TILE_SIZE
+        ysize = min(DEM_TILE_SIZE, self._dem_shape[0] - yoff)
+        xsize = min(DEM_TILE_SIZE, self._dem_shape[1] - xoff)
+        try:
+            tile = self._dem_band.ReadAsArray(xoff, yoff, xsize, ysize,
+                                              buf_type=gdal.GDT_Float32)
+        except RuntimeError:
+            tile = None
+        if tile is None:
+            tile = np.full((ysize, xsize), np.nan, dtype=np.float32)
+        else:
+            tile = np.ascontiguousarray(tile, dtype=np.float32)
+            if self._dem_nodata is not None:
+                tile[tile == np.float32(self._dem_nodata)] = np.nan
+
+        self._dem_tiles[key] = tile
+        if len(self._dem_tiles) > DEM_TILE_CACHE_SIZE:
+            self._dem_tiles.popitem(last=False)
+        return tile
+
+    def _sample_indices(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """DEM values at pixel indices; NaN for nodata or indices off the raster"""
+        n_rows, n_cols = self._dem_shape
+        elevs = np.full(len(rows), np.nan)
+        valid = (rows >= 0) & (rows < n_rows) & (cols >= 0) & (cols < n_cols)
+        if self._dem_array is not None:
+            elevs[valid] = self._dem_array[rows[valid], cols[valid]]
+            return elevs
+
+        # Tiled DEM: one lookup per distinct tile touched
+        idx = np.flatnonzero(valid)
+        rows, cols = rows[idx], cols[idx]
+        tile_i, tile_j = rows // DEM_TILE_SIZE, cols // DEM_TILE_SIZE
+        keys = tile_i * (n_cols // DEM_TILE_SIZE + 1) + tile_j
+        for key in np.unique(keys):
+            sel = keys == key
+            ti, tj = int(tile_i[sel][0]), int(tile_j[sel][0])
+            tile = self._read_tile(ti, tj)
+            elevs[idx[sel]] = tile[rows[sel] - ti * DEM_TILE_SIZE,
+                                   cols[sel] - tj * DEM_TILE_SIZE]
+        return elevs
+
+    def _sample_array(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Sample the in-memory DEM at DEM-CRS coordinates"""
+        gt = self._dem_gt
+        with np.errstate(invalid='ignore'):
+            cols = np.floor((xs - gt[0]) / gt[1])
+            rows = np.floor((ys - gt[3]) / gt[5])
+        # Untransformable (NaN) points map to -1, i.e. off the raster
+        cols = np.where(np.isfinite(cols), cols, -1).astype(np.int64)
+        rows = np.where(np.isfinite(rows), rows, -1).astype(np.int64)
+        return self._sample_indices(rows, cols)
+
+    def _transform_coords(self, xs: np.ndarray, ys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Transform subbasin-CRS coordinates to DEM CRS; NaN where the transform fails"""
+        out_x = np.full(len(xs), np.nan)
+        out_y = np.full(len(ys), np.nan)
+        for k, (x, y) in enumerate(zip(xs, ys)):
+            try:
+                pt = self._xform.transform(QgsPointXY(float(x), float(y)))
+            except Exception:
+                continue
+            out_x[k] = pt.x()
+            out_y[k] = pt.y()
+        return out_x, out_y
+
     def get_elevation_at_point(self, point: QgsPointXY) -> Optional[float]:
         """Sample DEM elevation at a point"""
         try:
             # Transform point to DEM CRS if needed
-            if self.target_crs != self.dem_crs:
-                transform = QgsCoordinateTransform(
-                    self.target_crs, self.dem_crs, QgsProject.instance()
-                )
-                point = transform.transform(point)
-            
+            if self._need_xform:
+                point = self._xform.transform(point)
+
+            if self._dem_gt is not None:
+                elev = self._sample_array(np.array([point.x()]), np.array([point.y()]))[0]
+                return None if np.isnan(elev) else float(elev)
+
             # Sample raster value
             result = self.dem_provider.sample(point, 1)
             if result[1]:  # Valid sample
@@ -132,6 +516,31 @@ class DEMFlowpathExtractor:
             return None
         except Exception:
             return None
+
+    def sample_elevations(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Sample DEM elevations at many points (subbasin CRS); NaN where no data"""
+        if self._dem_gt is not None:
+            xs = np.asarray(xs, dtype=np.float64)
+            ys = np.asarray(ys, dtype=np.float64)
+            if self._need_xform:
+                xs, ys = self._transform_coords(xs, ys)
+            return self._sample_array(xs, ys)
+
+        elevs = np.full(len(xs), np.nan)
+        for k, (x, y) in enumerate(zip(xs, ys)):
+            elev = self.get_elevation_at_point(QgsPointXY(float(x), float(y)))
+            if elev is not None:
+                elevs[k] = elev
+        return elevs
+
+    def _sample_inside(self, geom: QgsGeometry, sh_geom, xs: np.ndarray,
+                       ys: np.ndarray) -> np.ndarray:
+        """Elevations at (xs, ys); NaN outside the subbasin or off the DEM"""
+        elevs = np.full(len(xs), np.nan)
+        inside = self._inside_mask(geom, sh_geom, xs, ys)
+        if inside.any():
+            elevs[inside] = self.sample_elevations(xs[inside], ys[inside])
+        return elevs
     
     def extract_flowpath_simple(self, subbasin_feature: QgsFeature,
                                 outlet_point: Optional[QgsPointXY] = None) -> Dict:
@@ -147,6 +556,17 @@ class DEMFlowpathExtractor:
         - method: Extraction method used
         - warnings: List of any warnings/adjustments
         """
+        return self._extract_endpoints(subbasin_feature, outlet_point)[0]
+
+    def _extract_endpoints(self, subbasin_feature: QgsFeature,
+                           outlet_point: Optional[QgsPointXY] = None
+                           ) -> Tuple[Dict, Optional[QgsPointXY], Optional[QgsPointXY]]:
+        """
+        extract_flowpath_simple() that also returns the high and outlet points
+
+        Returns: (result, highest_point, outlet_point); the points are None
+        when no elevations could be extracted.
+        """
         result = {
             'subbasin_id': None,
             'length_ft': 0.0,
@@ -162,74 +582,39 @@ class DEMFlowpathExtractor:
         geom = subbasin_feature.geometry()
         if geom.isEmpty():
             result['warnings'].append("Empty geometry")
-            return result
+            return result, None, None
         
         # Get subbasin centroid
         centroid = geom.centroid().asPoint()
+        sh_geom = self._to_shapely(geom)
         
         # Determine outlet point
+        if outlet_point is None and self.outlet_index is not None:
+            outlet_point = self._find_outlet(geom)
         if outlet_point is None:
-            # Use lowest point on subbasin boundary
-            boundary = geom.convertToType(QgsWkbTypes.LineGeometry, False)
-            if boundary:
-                # Sample points along boundary to find lowest
-                boundary_line = boundary.asPolyline() if boundary.type() == QgsWkbTypes.LineGeometry else []
-                if not boundary_line:
-                    # Try multiline
-                    boundary_multi = boundary.asMultiPolyline()
-                    boundary_line = boundary_multi[0] if boundary_multi else []
-                
-                lowest_elev = float('inf')
-                lowest_point = centroid
-                
-                for pt in boundary_line:
-                    elev = self.get_elevation_at_point(pt)
-                    if elev is not None and elev < lowest_elev:
-                        lowest_elev = elev
-                        lowest_point = pt
-                
-                outlet_point = lowest_point
-            else:
-                outlet_point = centroid
-        
-        # Get highest point (sample grid within subbasin)
-        bbox = geom.boundingBox()
-        highest_elev = float('-inf')
-        highest_point = centroid
-        
-        # Sample at regular intervals
-        x_step = bbox.width() / 10.0
-        y_step = bbox.height() / 10.0
-        
-        for i in range(11):
-            for j in range(11):
-                pt = QgsPointXY(bbox.xMinimum() + i * x_step,
-                               bbox.yMinimum() + j * y_step)
-                if geom.contains(QgsGeometry.fromPointXY(pt)):
-                    elev = self.get_elevation_at_point(pt)
-                    if elev is not None and elev > highest_elev:
-                        highest_elev = elev
-                        highest_point = pt
-        
+            # Use lowest vertex on the subbasin's outer boundary
+            outlet_point = centroid
+            xs, ys = self._exterior_ring_coords(geom, sh_geom)
+            if len(xs):
+                elevs = self.sample_elevations(xs, ys)
+                if not np.isnan(elevs).all():
+                    k = int(np.nanargmin(elevs))
+                    outlet_point = QgsPointXY(float(xs[k]), float(ys[k]))
+        
+        # Get highest point (adaptive grid search within subbasin)
+        highest_point, highest_elev = self._find_high_point(geom, centroid, sh_geom)
+
         # Get outlet elevation
         low_elev = self.get_elevation_at_point(outlet_point)
         
         if highest_elev == float('-inf') or low_elev is None:
             result['warnings'].append("Could not extract elevations from DEM")
-            return result
+            return result, None, None
         
-        # Calculate length (simple straight-line distance)
-        # Convert to feet if CRS is in meters
-        length = highest_point.distance(outlet_point)
-        
-        # Check CRS units - convert to feet if needed
-        unit = self.target_crs.mapUnits()
-        if unit == 0:  # Meters
-            length = length * 3.28084
-            highest_elev = highest_elev * 3.28084
-            low_elev = low_elev * 3.28084
-        elif unit == 2:  # Feet - already in feet
-            pass
+        # Calculate length (simple straight-line distance), converted to feet
+        length = highest_point.distance(outlet_point) * self._to_ft
+        highest_elev *= self._to_ft
+        low_elev *= self._to_ft
         
         result['length_ft'] = length
         result['high_elev_ft'] = highest_elev
@@ -252,9 +637,165 @@ class DEMFlowpathExtractor:
         
         result['slope_ftft'] = slope_ftft
         result['slope_pct'] = slope_ftft * 100.0
-        
-        return result
-    
+
+        return result, highest_point, outlet_point
+
+    def extract_all(self, features: Iterable[QgsFeature],
+                    workers: Optional[int] = None) -> List[Dict]:
+        """
+        Run extract_flowpath_simple over many subbasins, in input order
+
+        Subbasins are spread over a thread pool when sampling is thread
+        safe, i.e. the DEM is held in memory and no coordinate transform is
+        involved (provider sampling and PROJ transforms are not shared
+        across threads). Otherwise they are processed sequentially; for a
+        tiled DEM they are visited tile by tile so that neighbouring
+        subbasins hit the same cached tiles.
+
+        Args:
+            features: Subbasin features
+            workers: Thread count (default: os.cpu_count())
+        """
+        features = list(features)
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if self._dem_band is not None and len(features) > 1:
+            results = [None] * len(features)
+            for k in self._tile_order(features):
+                results[k] = self.extract_flowpath_simple(features[k])
+            return results
+
+        parallel_safe = self._dem_array is not None and not self._need_xform
+        if not parallel_safe or workers <= 1 or len(features) < 2:
+            return [self.extract_flowpath_simple(f) for f in features]
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(features))) as pool:
+            return list(pool.map(self.extract_flowpath_simple, features))
+
+    def _tile_order(self, features: Sequence[QgsFeature]) -> List[int]:
+        """Feature indices sorted by the DEM tile under each bounding box centre"""
+        centres = [f.geometry().boundingBox().center() for f in features]
+        xs = np.array([c.x() for c in centres])
+        ys = np.array([c.y() for c in centres])
+        if self._need_xform:
+            xs, ys = self._transform_coords(xs, ys)
+        gt = self._dem_gt
+        with np.errstate(invalid='ignore'):
+            tile_i = np.floor((ys - gt[3]) / gt[5] / DEM_TILE_SIZE)
+            tile_j = np.floor((xs - gt[0]) / gt[1] / DEM_TILE_SIZE)
+        tile_i = np.nan_to_num(tile_i, nan=-1.0)
+        tile_j = np.nan_to_num(tile_j, nan=-1.0)
+        return np.lexsort((tile_j, tile_i)).tolist()
+
+    def _grid_size(self, bbox: QgsRectangle) -> int:
+        """Grid points per axis so sample spacing tracks DEM resolution"""
+        dem_res = self.dem_res
+        if dem_res <= 0:
+            return COARSE_GRID_SIZE
+        n = int(math.sqrt(bbox.area()) / dem_res / 4)
+        return max(COARSE_GRID_SIZE, min(MAX_GRID_SIZE, n))
+
+    @staticmethod
+    def _to_shapely(geom: QgsGeometry):
+        """Prepared shapely copy of a QGIS geometry, or None without shapely"""
+        if not HAS_SHAPELY:
+            return None
+        sh_geom = shapely_wkb.loads(bytes(geom.asWkb()))
+        if hasattr(shapely, 'prepare'):
+            shapely.prepare(sh_geom)
+        return sh_geom
+
+    @staticmethod
+    def _inside_mask(geom: QgsGeometry, sh_geom, xs: np.ndarray,
+                     ys: np.ndarray) -> np.ndarray:
+        """Boolean mask of the (xs, ys) points that lie inside the subbasin"""
+        if sh_geom is not None:
+            return np.asarray(_contains_xy(sh_geom, xs, ys), dtype=bool)
+        return np.array([geom.contains(QgsGeometry.fromPointXY(QgsPointXY(x, y)))
+                         for x, y in zip(xs, ys)], dtype=bool)
+
+    @staticmethod
+    def _exterior_ring_coords(geom: QgsGeometry, sh_geom=None) -> Tuple[np.ndarray, np.ndarray]:
+        """Vertex coordinates of the exterior ring (first part of a multipolygon)"""
+        if sh_geom is not None:
+            polygon = sh_geom.geoms[0] if hasattr(sh_geom, 'geoms') else sh_geom
+            if polygon.is_empty:
+                return np.empty(0), np.empty(0)
+            coords = np.asarray(polygon.exterior.coords)
+            return coords[:, 0], coords[:, 1]
+
+        polygon = geom.constGet()
+        if geom.isMultipart():
+            if polygon.numGeometries() == 0:
+                return np.empty(0), np.empty(0)
+            polygon = polygon.geometryN(0)
+        ring = polygon.exteriorRing()
+        if ring is None:
+            return np.empty(0), np.empty(0)
+        if not isinstance(ring, QgsLineString):
+            ring = ring.curveToLine()
+        return np.array(ring.xVector()), np.array(ring.yVector())
+
+    def _find_high_point(self, geom: QgsGeometry, default_point: QgsPointXY,
+                         sh_geom=None) -> Tuple[QgsPointXY, float]:
+        """
+        Locate the highest DEM cell inside a subbasin
+
+        Runs a coarse COARSE_GRID_SIZE x COARSE_GRID_SIZE scan of the bounding
+        box. If the elevation range found is below what the low-slope
+        adjustment would add over the basin length, the basin is treated as
+        flat and the coarse maximum is returned. Otherwise the search is
+        refined around the current maximum with successively halved 3x3
+        neighbourhoods until the spacing reaches the adaptive grid size.
+
+        Point-in-polygon tests run in one vectorized call per pass against
+        sh_geom, the prepared shapely copy of geom, when one is given.
+
+        Returns: (highest_point, highest_elev); elevation is -inf if no
+        sample inside the subbasin could be read from the DEM.
+        """
+        bbox = geom.boundingBox()
+
+        # Coarse pass over the whole bounding box
+        xs = bbox.xMinimum() + _COARSE_U * bbox.width()
+        ys = bbox.yMinimum() + _COARSE_V * bbox.height()
+        elevs = self._sample_inside(geom, sh_geom, xs, ys)
+
+        if np.isnan(elevs).all():
+            return default_point, float('-inf')
+
+        k = int(np.nanargmax(elevs))
+        highest_elev = float(elevs[k])
+        highest_point = QgsPointXY(float(xs[k]), float(ys[k]))
+
+        # Flat basin - the TxDOT adjustment will dominate the slope anyway
+        diagonal = math.hypot(bbox.width(), bbox.height())
+        if highest_elev - float(np.nanmin(elevs)) < LOW_SLOPE_ADJUSTMENT * diagonal:
+            return highest_point, highest_elev
+
+        # Local 3x3 refinement around the current maximum
+        n = self._grid_size(bbox)
+        x_step = bbox.width() / (COARSE_GRID_SIZE - 1)
+        y_step = bbox.height() / (COARSE_GRID_SIZE - 1)
+        target_x = bbox.width() / (n - 1)
+        target_y = bbox.height() / (n - 1)
+
+        while x_step > target_x or y_step > target_y:
+            x_step /= 2.0
+            y_step /= 2.0
+            xs = highest_point.x() + _NEIGHBOUR_DI * x_step
+            ys = highest_point.y() + _NEIGHBOUR_DJ * y_step
+            elevs = self._sample_inside(geom, sh_geom, xs, ys)
+            if np.isnan(elevs).all():
+                continue
+            k = int(np.nanargmax(elevs))
+            if elevs[k] > highest_elev:
+                highest_elev = float(elevs[k])
+                highest_point = QgsPointXY(float(xs[k]), float(ys[k]))
+
+        return highest_point, highest_elev
+
     def extract_flowpath_profile(self, subbasin_feature: QgsFeature,
                                  outlet_point: Optional[QgsPointXY] = None,
                                  num_samples: int = 50) -> Dict:
@@ -266,20 +807,36 @@ class DEMFlowpathExtractor:
         - Zero/flat sections
         - Applies appropriate adjustments
         """
-        result = self.extract_flowpath_simple(subbasin_feature, outlet_point)
+        result, high_pt, low_pt = self._extract_endpoints(subbasin_feature, outlet_point)
         result['method'] = 'profile_sampled'
         result['profile'] = []
         
-        if result['length_ft'] <= 0:
+        if result['length_ft'] <= 0 or num_samples < 2:
             return result
         
-        # Create line from high point to outlet for profile sampling
-        geom = subbasin_feature.geometry()
-        centroid = geom.centroid().asPoint()
-        
-        # Use high/low points from simple extraction
-        # Sample along the line
-        # This is a simplified approach - full implementation would trace actual flow path
+        # Sample evenly along the straight high point -> outlet line
+        # (a full implementation would trace the actual flow path)
+        t = np.linspace(0.0, 1.0, num_samples)
+        xs = high_pt.x() + t * (low_pt.x() - high_pt.x())
+        ys = high_pt.y() + t * (low_pt.y() - high_pt.y())
+        elevs = self.sample_elevations(xs, ys) * self._to_ft
+        dists = t * result['length_ft']
+        result['profile'] = list(zip(dists.tolist(), elevs.tolist()))
+        
+        # Segment slopes along the profile, positive when falling toward the outlet
+        valid = ~np.isnan(elevs)
+        if valid.sum() < 2:
+            result['warnings'].append("Could not sample elevation profile from DEM")
+            return result
+        seg_slopes = -np.diff(elevs[valid]) / np.diff(dists[valid])
+        n_adverse = int((seg_slopes < 0).sum())
+        n_flat = int((np.abs(seg_slopes) < MIN_SLOPE_THRESHOLD).sum())
+        if n_adverse:
+            result['warnings'].append(
+                f"Adverse profile slope in {n_adverse} of {len(seg_slopes)} segments")
+        if n_flat:
+            result['warnings'].append(
+                f"Flat profile (S < {MIN_SLOPE_THRESHOLD*100:.1f}%) in {n_flat} of {len(seg_slopes)} segments")
         
         return result
     
@@ -295,32 +852,11 @@ class DEMFlowpathExtractor:
         
         Returns: (adjusted_slope, was_adjusted, warning_message)
         """
-        adjusted = False
-        warning = None
-        
-        if slope_ftft < 0:
-            # Adverse slope - physically impossible for gravity flow
-            # Use minimum slope
-            adjusted_slope = LOW_SLOPE_ADJUSTMENT
-            adjusted = True
-            warning = f"Adverse slope detected ({slope_ftft*100:.3f}%). Applied minimum slope of {LOW_SLOPE_ADJUSTMENT*100:.2f}%"
-        
-        elif slope_ftft < MIN_SLOPE_THRESHOLD:
-            # Low slope condition - apply TxDOT adjustment
-            adjusted_slope = slope_ftft + LOW_SLOPE_ADJUSTMENT
-            adjusted = True
-            warning = f"Low slope ({slope_ftft*100:.3f}%). Applied TxDOT adjustment: S + 0.0005 = {adjusted_slope*100:.3f}%"
-        
-        elif slope_ftft < TRANSITIONAL_SLOPE_UPPER:
-            # Transitional - flag but don't adjust
-            adjusted_slope = slope_ftft
-            warning = f"Transitional slope ({slope_ftft*100:.3f}%). Consider reviewing."
-        
-        else:
-            # Normal slope - no adjustment needed
-            adjusted_slope = slope_ftft
-        
-        return adjusted_slope, adjusted, warning
+        adjusted_slope, code = _slope_adjustment(slope_ftft)
+        if code == SLOPE_OK:
+            return adjusted_slope, False, None
+        adjusted = code != SLOPE_TRANSITIONAL
+        return adjusted_slope, adjusted, _slope_adjustment_message(slope_ftft, adjusted_slope, code)
     
     @staticmethod
     def apply_tc_minimum(tc_minutes: float, land_type: str = 'rural') -> Tuple[float, bool, str]:
@@ -329,9 +865,10 @@ class DEMFlowpathExtractor:
         
         Returns: (adjusted_tc, was_adjusted, warning_message)
         """
-        if land_type.lower() in ['paved', 'urban', 'impervious']:
+        lt = land_type.lower()
+        if lt in _TC_MIN_PAVED_TYPES:
             min_tc = MIN_TC_PAVED
-        elif land_type.lower() in ['rural', 'undeveloped', 'natural']:
+        elif lt in _TC_MIN_RURAL_TYPES:
             min_tc = MIN_TC_RURAL
         else:
             min_tc = MIN_TC_DEFAULT
@@ -343,10 +880,246 @@ class DEMFlowpathExtractor:
         return tc_minutes, False, None
 
 
+# =============================================================================
+# TC RESULT CONTAINER
+# =============================================================================
+
+class TCWarning(IntFlag):
+    """Warning conditions raised by the DEM-mode TC calculators"""
+    NONE = 0
+    ZERO_LENGTH = 1
+    CN_LOW = 2
+    CN_HIGH = 4
+    LENGTH_SHORT = 8
+    LENGTH_LONG = 16
+    ADVERSE_SLOPE = 32
+    LOW_SLOPE = 64
+    SLOPE_BELOW_RANGE = 128
+    SLOPE_ABOVE_RANGE = 256
+    RETENTION_MIN = 512
+    TC_ZERO = 1024
+    TC_MIN_APPLIED = 2048
+
+
+# Plain-int copies of the TCWarning bits for the numba kernels
+_W_CN_LOW = int(TCWarning.CN_LOW)
+_W_CN_HIGH = int(TCWarning.CN_HIGH)
+_W_LENGTH_SHORT = int(TCWarning.LENGTH_SHORT)
+_W_LENGTH_LONG = int(TCWarning.LENGTH_LONG)
+_W_ADVERSE_SLOPE = int(TCWarning.ADVERSE_SLOPE)
+_W_LOW_SLOPE = int(TCWarning.LOW_SLOPE)
+_W_SLOPE_BELOW_RANGE = int(TCWarning.SLOPE_BELOW_RANGE)
+_W_SLOPE_ABOVE_RANGE = int(TCWarning.SLOPE_ABOVE_RANGE)
+_W_RETENTION_MIN = int(TCWarning.RETENTION_MIN)
+_W_TC_ZERO = int(TCWarning.TC_ZERO)
+_W_TC_MIN_APPLIED = int(TCWarning.TC_MIN_APPLIED)
+
+
+# dataclass(slots=...) needs Python 3.10; 3.9 still gets a plain dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class TCResult:
+    """
+    Result of a single DEM-mode TC calculation
+
+    Warnings are recorded as TCWarning bits and only formatted into
+    messages when the `warnings` property is read, so batch callers that
+    never look at them pay nothing for the strings.
+    """
+    method: str
+    length_ft: float
+    slope_pct: float
+    input_slope_pct: float
+    cn: Optional[float] = None
+    tc_min: Optional[float] = None
+    raw_tc_min: Optional[float] = None
+    lag_hr: Optional[float] = None
+    tt_sheet_min: float = 0.0
+    tt_shallow_min: float = 0.0
+    tt_channel_min: float = 0.0
+    sheet_length_ft: Optional[float] = None
+    shallow_length_ft: Optional[float] = None
+    channel_length_ft: Optional[float] = None
+    land_category: str = 'rural'
+    adjusted_slope: bool = False
+    adjusted_tc: bool = False
+    valid: bool = True
+    warning_bits: int = 0
+
+    @property
+    def warnings(self) -> List[str]:
+        """Warning messages, in the order the calculation raised them"""
+        bits = self.warning_bits
+        if not bits:
+            return []
+
+        messages = []
+        if bits & TCWarning.ZERO_LENGTH:
+            messages.append("Zero or negative length")
+        if bits & TCWarning.CN_LOW:
+            messages.append(f"CN ({self.cn}) below minimum ({SCSLagDEMCalculator.MIN_CN}). Results may be unreliable.")
+        if bits & TCWarning.CN_HIGH:
+            messages.append(f"CN ({self.cn}) above maximum ({SCSLagDEMCalculator.MAX_CN}). Results may be unreliable.")
+        if bits & TCWarning.LENGTH_SHORT:
+            messages.append(f"Length ({self.length_ft:.0f} ft) below minimum ({SCSLagDEMCalculator.MIN_LENGTH_FT} ft). Consider alternative method.")
+        if bits & TCWarning.LENGTH_LONG:
+            messages.append(f"Length ({self.length_ft:.0f} ft) above maximum ({SCSLagDEMCalculator.MAX_LENGTH_FT} ft). Consider WinTR-20.")
+        if bits & (TCWarning.ADVERSE_SLOPE | TCWarning.LOW_SLOPE):
+            input_ftft = self.input_slope_pct / 100.0
+            code = SLOPE_ADVERSE if bits & TCWarning.ADVERSE_SLOPE else SLOPE_LOW
+            messages.append(_slope_adjustment_message(input_ftft, self.slope_pct / 100.0, code))
+        if bits & TCWarning.SLOPE_BELOW_RANGE:
+            messages.append(f"Slope ({self.slope_pct:.2f}%) below minimum ({SCSLagDEMCalculator.MIN_SLOPE_PCT}%). Use alternative procedure per NRCS.")
+        if bits & TCWarning.SLOPE_ABOVE_RANGE:
+            messages.append(f"Slope ({self.slope_pct:.2f}%) above maximum ({SCSLagDEMCalculator.MAX_SLOPE_PCT}%). Use alternative procedure per NRCS.")
+        if bits & TCWarning.RETENTION_MIN:
+            messages.append("Retention term ≤ 0. Using minimum value.")
+        if bits & TCWarning.TC_ZERO:
+            messages.append("Calculated TC = 0. Using minimum value.")
+        if bits & TCWarning.TC_MIN_APPLIED:
+            messages.append(DEMFlowpathExtractor.apply_tc_minimum(self.raw_tc_min, self.land_category)[2])
+        return messages
+
+    def to_dict(self) -> Dict:
+        """Dict form matching the calculators' original result layout"""
+        if self.method == 'SCS_Lag':
+            result = {
+                'method': self.method,
+                'lag_hr': self.lag_hr,
+                'tc_min': self.tc_min,
+                'length_ft': self.length_ft,
+                'slope_pct': self.slope_pct,
+                'cn': self.cn,
+            }
+        else:
+            result = {
+                'method': self.method,
+                'tc_min': self.tc_min,
+                'tt_sheet_min': self.tt_sheet_min,
+                'tt_shallow_min': self.tt_shallow_min,
+                'tt_channel_min': self.tt_channel_min,
+                'length_ft': self.length_ft,
+                'slope_pct': self.slope_pct,
+            }
+        result['adjusted_slope'] = self.adjusted_slope
+        result['adjusted_tc'] = self.adjusted_tc
+        result['warnings'] = self.warnings
+        result['valid'] = self.valid
+        if self.sheet_length_ft is not None:
+            result['sheet_length_ft'] = self.sheet_length_ft
+            result['shallow_length_ft'] = self.shallow_length_ft
+            result['channel_length_ft'] = self.channel_length_ft
+        return result
+
+
 # =============================================================================
 # SCS LAG METHOD WITH DEM EXTRACTION
 # =============================================================================
 
+# Valid ranges per NRCS WinTR-55 (module level so the kernel can see them)
+SCS_MIN_CN = 50
+SCS_MAX_CN = 95
+SCS_MIN_SLOPE_PCT = 0.5
+SCS_MAX_SLOPE_PCT = 64.0
+SCS_MIN_LENGTH_FT = 200
+SCS_MAX_LENGTH_FT = 26000
+
+
+@njit(cache=True)
+def _scs_lag_kernel(length_ft: float, slope_pct: float, cn: float, apply_adjustments: int
+                    ) -> Tuple[float, float, float, float, int, bool, bool, bool]:
+    """
+    Numeric core of SCSLagDEMCalculator.compute()
+
+    Returns: (lag_hr, raw_tc_min, tc_min, slope_pct, warning_bits,
+    adjusted_slope, adjusted_tc, valid)
+    """
+    bits = 0
+    adjusted_slope = False
+    adjusted_tc = False
+    valid = True
+
+    # Validate inputs
+    if cn < SCS_MIN_CN:
+        bits |= _W_CN_LOW
+        if cn <= 0:
+            cn = SCS_MIN_CN
+    elif cn > SCS_MAX_CN:
+        bits |= _W_CN_HIGH
+        if cn > 100:
+            cn = SCS_MAX_CN
+
+    if length_ft < SCS_MIN_LENGTH_FT:
+        bits |= _W_LENGTH_SHORT
+    elif length_ft > SCS_MAX_LENGTH_FT:
+        bits |= _W_LENGTH_LONG
+
+    # Apply slope adjustments if needed
+    if apply_adjustments:
+        adj_slope, code = _slope_adjustment(slope_pct / 100.0)
+        if code == SLOPE_ADVERSE or code == SLOPE_LOW:
+            adjusted_slope = True
+            bits |= _W_ADVERSE_SLOPE if code == SLOPE_ADVERSE else _W_LOW_SLOPE
+            slope_pct = adj_slope * 100.0
+
+    # Check slope range
+    if slope_pct < SCS_MIN_SLOPE_PCT:
+        bits |= _W_SLOPE_BELOW_RANGE
+    elif slope_pct > SCS_MAX_SLOPE_PCT:
+        bits |= _W_SLOPE_ABOVE_RANGE
+
+    # Calculate retention term
+    if cn > 0:
+        s_retention = (1000.0 / cn) - 9.0
+    else:
+        s_retention = 1.0
+
+    if s_retention <= 0:
+        s_retention = 0.1
+        bits |= _W_RETENTION_MIN
+
+    # Calculate lag (hours)
+    if slope_pct > 0 and length_ft > 0:
+        lag_hr = ((length_ft ** 0.8) * (s_retention ** 0.7)) / (1900.0 * ((slope_pct / 100.0) ** 0.5))
+    else:
+        lag_hr = 0.0
+        valid = False
+
+    # Convert to TC
+    if lag_hr > 0:
+        tc_min = (lag_hr / 0.6) * 60.0
+    else:
+        tc_min = MIN_TC_DEFAULT
+        bits |= _W_TC_ZERO
+
+    # Apply minimum TC if needed (SCS lag is treated as rural)
+    raw_tc_min = tc_min
+    if apply_adjustments and tc_min < MIN_TC_RURAL:
+        adjusted_tc = True
+        bits |= _W_TC_MIN_APPLIED
+        tc_min = MIN_TC_RURAL
+
+    return lag_hr, raw_tc_min, tc_min, slope_pct, bits, adjusted_slope, adjusted_tc, valid
+
+
+# Result layout of SCSLagDEMCalculator.compute_batch (one row per subbasin)
+SCS_BATCH_DTYPE = np.dtype([
+    ('length_ft', 'f8'),
+    ('input_slope_pct', 'f8'),
+    ('slope_pct', 'f8'),
+    ('cn', 'f8'),
+    ('lag_hr', 'f8'),
+    ('raw_tc_min', 'f8'),
+    ('tc_min', 'f8'),
+    ('warning_bits', 'u2'),
+    ('adjusted_slope', '?'),
+    ('adjusted_tc', '?'),
+    ('valid', '?'),
+])
+
+
 class SCSLagDEMCalculator:
     """
     SCS Lag Method with DEM-extracted parameters
@@ -366,12 +1139,12 @@ class SCSLagDEMCalculator:
     """
     
     # Valid ranges per NRCS WinTR-55
-    MIN_CN = 50
-    MAX_CN = 95
-    MIN_SLOPE_PCT = 0.5
-    MAX_SLOPE_PCT = 64.0
-    MIN_LENGTH_FT = 200
-    MAX_LENGTH_FT = 26000
+    MIN_CN = SCS_MIN_CN
+    MAX_CN = SCS_MAX_CN
+    MIN_SLOPE_PCT = SCS_MIN_SLOPE_PCT
+    MAX_SLOPE_PCT = SCS_MAX_SLOPE_PCT
+    MIN_LENGTH_FT = SCS_MIN_LENGTH_FT
+    MAX_LENGTH_FT = SCS_MAX_LENGTH_FT
     
     def __init__(self):
         self.warnings = []
@@ -390,95 +1163,216 @@ class SCSLagDEMCalculator:
         Returns:
             Dict with lag_hr, tc_min, and any warnings
         """
-        self.warnings = []
-        result = {
-            'method': 'SCS_Lag',
-            'lag_hr': None,
-            'tc_min': None,
-            'length_ft': length_ft,
-            'slope_pct': slope_pct,
-            'cn': cn,
-            'adjusted_slope': False,
-            'adjusted_tc': False,
-            'warnings': [],
-            'valid': True,
-        }
-        
-        # Validate inputs
-        if cn < self.MIN_CN:
-            result['warnings'].append(f"CN ({cn}) below minimum ({self.MIN_CN}). Results may be unreliable.")
-            if cn <= 0:
-                cn = self.MIN_CN
-        elif cn > self.MAX_CN:
-            result['warnings'].append(f"CN ({cn}) above maximum ({self.MAX_CN}). Results may be unreliable.")
-            if cn > 100:
-                cn = self.MAX_CN
-        
-        if length_ft < self.MIN_LENGTH_FT:
-            result['warnings'].append(f"Length ({length_ft:.0f} ft) below minimum ({self.MIN_LENGTH_FT} ft). Consider alternative method.")
-        elif length_ft > self.MAX_LENGTH_FT:
-            result['warnings'].append(f"Length ({length_ft:.0f} ft) above maximum ({self.MAX_LENGTH_FT} ft). Consider WinTR-20.")
-        
-        # Apply slope adjustments if needed
-        slope_ftft = slope_pct / 100.0
-        
-        if apply_adjustments:
-            adj_slope, was_adjusted, adj_warning = DEMFlowpathExtractor.apply_slope_adjustment(slope_ftft)
-            if was_adjusted:
-                result['adjusted_slope'] = True
-                result['warnings'].append(adj_warning)
-                slope_pct = adj_slope * 100.0
-        
-        # Check slope range
-        if slope_pct < self.MIN_SLOPE_PCT:
-            result['warnings'].append(f"Slope ({slope_pct:.2f}%) below minimum ({self.MIN_SLOPE_PCT}%). Use alternative procedure per NRCS.")
-        elif slope_pct > self.MAX_SLOPE_PCT:
-            result['warnings'].append(f"Slope ({slope_pct:.2f}%) above maximum ({self.MAX_SLOPE_PCT}%). Use alternative procedure per NRCS.")
-        
-        # Calculate retention term
-        if cn > 0:
-            s_retention = (1000.0 / cn) - 9.0
-        else:
-            s_retention = 1.0
-        
-        if s_retention <= 0:
-            s_retention = 0.1
-            result['warnings'].append("Retention term ≤ 0. Using minimum value.")
-        
-        # Calculate lag (hours)
-        if slope_pct > 0 and length_ft > 0:
-            lag_hr = ((length_ft ** 0.8) * (s_retention ** 0.7)) / (1900.0 * ((slope_pct / 100.0) ** 0.5))
-        else:
-            lag_hr = 0.0
-            result['valid'] = False
-        
-        # Convert to TC
-        if lag_hr > 0:
-            tc_hr = lag_hr / 0.6
-            tc_min = tc_hr * 60.0
-        else:
-            tc_min = MIN_TC_DEFAULT
-            result['warnings'].append("Calculated TC = 0. Using minimum value.")
-        
-        # Apply minimum TC if needed
-        if apply_adjustments:
-            adj_tc, tc_adjusted, tc_warning = DEMFlowpathExtractor.apply_tc_minimum(tc_min, 'rural')
-            if tc_adjusted:
-                result['adjusted_tc'] = True
-                result['warnings'].append(tc_warning)
-                tc_min = adj_tc
-        
-        result['lag_hr'] = lag_hr
-        result['tc_min'] = tc_min
-        result['slope_pct'] = slope_pct
-        
+        return self.compute(length_ft, slope_pct, cn, apply_adjustments).to_dict()
+
+    def compute(self, length_ft: float, slope_pct: float, cn: float,
+                apply_adjustments: bool = True) -> TCResult:
+        """Same as calculate() but returns a TCResult (no per-call dict/list allocation)"""
+        result = TCResult('SCS_Lag', length_ft, slope_pct, slope_pct, cn=cn)
+        (result.lag_hr, result.raw_tc_min, result.tc_min, result.slope_pct,
+         result.warning_bits, result.adjusted_slope, result.adjusted_tc,
+         result.valid) = _scs_lag_kernel(float(length_ft), float(slope_pct), float(cn),
+                                         int(apply_adjustments))
         return result
 
+    @staticmethod
+    def compute_batch(lengths_ft: Sequence[float], slopes_pct: Sequence[float],
+                      cns: Union[float, Sequence[float]],
+                      apply_adjustments: bool = True) -> np.ndarray:
+        """
+        compute() for many subbasins in one branch-free NumPy pass
+
+        Slope adjustment, CN clamping, range checks and the minimum TC are
+        applied with np.where masks, giving the same numbers and warning
+        bits as compute() row for row.
+
+        Returns: Structured array with SCS_BATCH_DTYPE fields
+        """
+        length, slope_in, cn = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(lengths_ft, dtype=np.float64)),
+            np.atleast_1d(np.asarray(slopes_pct, dtype=np.float64)),
+            np.atleast_1d(np.asarray(cns, dtype=np.float64)),
+        )
+        out = np.zeros(length.shape, dtype=SCS_BATCH_DTYPE)
+        out['length_ft'] = length
+        out['input_slope_pct'] = slope_in
+        out['cn'] = cn
+
+        bits = np.zeros(length.shape, dtype=np.uint16)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Validate inputs
+            bits |= np.where(cn < SCS_MIN_CN, _W_CN_LOW, 0).astype(np.uint16)
+            bits |= np.where(cn > SCS_MAX_CN, _W_CN_HIGH, 0).astype(np.uint16)
+            cn_used = np.where(cn <= 0, SCS_MIN_CN, np.where(cn > 100, SCS_MAX_CN, cn))
+            bits |= np.where(length < SCS_MIN_LENGTH_FT, _W_LENGTH_SHORT, 0).astype(np.uint16)
+            bits |= np.where(length > SCS_MAX_LENGTH_FT, _W_LENGTH_LONG, 0).astype(np.uint16)
+
+            # TxDOT slope adjustment
+            slope_pct = slope_in
+            if apply_adjustments:
+                slope_ftft = slope_in / 100.0
+                adverse = slope_ftft < 0
+                low = ~adverse & (slope_ftft < MIN_SLOPE_THRESHOLD)
+                slope_pct = np.where(adverse, LOW_SLOPE_ADJUSTMENT * 100.0,
+                                     np.where(low, (slope_ftft + LOW_SLOPE_ADJUSTMENT) * 100.0,
+                                              slope_in))
+                bits |= np.where(adverse, _W_ADVERSE_SLOPE, 0).astype(np.uint16)
+                bits |= np.where(low, _W_LOW_SLOPE, 0).astype(np.uint16)
+                out['adjusted_slope'] = adverse | low
+
+            # Slope range
+            below = slope_pct < SCS_MIN_SLOPE_PCT
+            bits |= np.where(below, _W_SLOPE_BELOW_RANGE, 0).astype(np.uint16)
+            bits |= np.where(~below & (slope_pct > SCS_MAX_SLOPE_PCT),
+                             _W_SLOPE_ABOVE_RANGE, 0).astype(np.uint16)
+
+            # Retention, lag and TC
+            s_retention = np.where(cn_used > 0, 1000.0 / cn_used - 9.0, 1.0)
+            retention_min = s_retention <= 0
+            s_retention = np.where(retention_min, 0.1, s_retention)
+            bits |= np.where(retention_min, _W_RETENTION_MIN, 0).astype(np.uint16)
+
+            valid = (slope_pct > 0) & (length > 0)
+            lag_hr = np.where(valid,
+                              (length ** 0.8) * (s_retention ** 0.7) /
+                              (1900.0 * ((slope_pct / 100.0) ** 0.5)),
+                              0.0)
+            tc_ok = lag_hr > 0
+            tc_min = np.where(tc_ok, (lag_hr / 0.6) * 60.0, MIN_TC_DEFAULT)
+            bits |= np.where(tc_ok, 0, _W_TC_ZERO).astype(np.uint16)
+
+        out['raw_tc_min'] = tc_min
+        if apply_adjustments:
+            tc_applied = tc_min < MIN_TC_RURAL
+            tc_min = np.where(tc_applied, MIN_TC_RURAL, tc_min)
+            bits |= np.where(tc_applied, _W_TC_MIN_APPLIED, 0).astype(np.uint16)
+            out['adjusted_tc'] = tc_applied
+
+        out['slope_pct'] = slope_pct
+        out['lag_hr'] = lag_hr
+        out['tc_min'] = tc_min
+        out['warning_bits'] = bits
+        out['valid'] = valid
+        return out
+
+    @staticmethod
+    def result_from_batch(row: np.void) -> TCResult:
+        """TCResult for one row of compute_batch()"""
+        return TCResult(
+            'SCS_Lag', float(row['length_ft']), float(row['slope_pct']),
+            float(row['input_slope_pct']), cn=float(row['cn']),
+            tc_min=float(row['tc_min']), raw_tc_min=float(row['raw_tc_min']),
+            lag_hr=float(row['lag_hr']), adjusted_slope=bool(row['adjusted_slope']),
+            adjusted_tc=bool(row['adjusted_tc']), valid=bool(row['valid']),
+            warning_bits=int(row['warning_bits'])
+        )
+
 
 # =============================================================================
 # TR-55 VELOCITY METHOD WITH DEM EXTRACTION
 # =============================================================================
 
+@njit(cache=True)
+def _travel_times(sheet_length_ft: float, shallow_length_ft: float,
+                  channel_length_ft: float, slope_pct: float, sheet_n: float,
+                  shallow_cp: float, channel_n: float, hydraulic_radius: float,
+                  p2_rainfall: float) -> Tuple[float, float, float]:
+    """
+    Fused TR-55 sheet, shallow concentrated, and channel travel times
+
+    Slope conversion and the low-slope adjustment are done once and shared
+    by all three segments. A segment with zero length (or a non-positive
+    roughness) contributes 0.0 minutes.
+
+    Returns: (tt_sheet_min, tt_shallow_min, tt_channel_min)
+    """
+    if slope_pct <= 0:
+        return 0.0, 0.0, 0.0
+
+    slope_ftft = slope_pct / 100.0
+
+    # Apply low-slope adjustment
+    if slope_ftft < MIN_SLOPE_THRESHOLD:
+        slope_ftft = slope_ftft + LOW_SLOPE_ADJUSTMENT
+
+    sqrt_s = math.sqrt(slope_ftft)
+
+    # Sheet flow - TR-55 Equation 3-3 (length capped per TR-55)
+    sheet_length_ft = min(sheet_length_ft, MAX_SHEET_FLOW_LENGTH)
+    tt_sheet = 0.0
+    if sheet_length_ft > 0 and sheet_n > 0:
+        tt_sheet = 60.0 * (0.007 * ((sheet_n * sheet_length_ft) ** 0.8)) / \
+                   ((p2_rainfall ** 0.5) * (slope_ftft ** 0.4))
+
+    # Shallow concentrated flow - V = Cp x S^0.5
+    tt_shallow = 0.0
+    velocity_fps = shallow_cp * sqrt_s
+    if shallow_length_ft > 0 and velocity_fps > 0:
+        tt_shallow = (shallow_length_ft / velocity_fps) / 60.0
+
+    # Channel flow - Manning's equation
+    tt_channel = 0.0
+    if channel_length_ft > 0 and channel_n > 0:
+        velocity_fps = (1.49 / channel_n) * (hydraulic_radius ** (2.0 / 3.0)) * sqrt_s
+        if velocity_fps > 0:
+            tt_channel = (channel_length_ft / velocity_fps) / 60.0
+
+    return tt_sheet, tt_shallow, tt_channel
+
+
+@njit(cache=True)
+def _tr55_simplified_kernel(total_length_ft: float, slope_pct: float, sheet_n: float,
+                            shallow_cp: float, min_tc: float, p2_rainfall: float,
+                            apply_adjustments: int):
+    """
+    Numeric core of TR55VelocityDEMCalculator.compute_simplified()
+
+    Expects total_length_ft > 0. Returns: (tt_sheet, tt_shallow, tt_channel,
+    sheet_length_ft, shallow_length_ft, channel_length_ft, raw_tc_min,
+    tc_min, slope_pct, warning_bits, adjusted_slope, adjusted_tc)
+    """
+    bits = 0
+    adjusted_slope = False
+    adjusted_tc = False
+
+    # Apply slope adjustments
+    slope_ftft = slope_pct / 100.0
+    if apply_adjustments and slope_ftft < MIN_SLOPE_THRESHOLD:
+        adj_slope, code = _slope_adjustment(slope_ftft)
+        adjusted_slope = True
+        bits |= _W_ADVERSE_SLOPE if code == SLOPE_ADVERSE else _W_LOW_SLOPE
+        slope_pct = adj_slope * 100.0
+
+    # Calculate flow segments
+    sheet_length = min(100.0, total_length_ft)  # First 100 ft is sheet flow
+    remaining_length = total_length_ft - sheet_length
+
+    # Assume 80% shallow concentrated, 20% channel for longer paths
+    if remaining_length > 1000:
+        shallow_length = remaining_length * 0.8
+        channel_length = remaining_length * 0.2
+    else:
+        shallow_length = remaining_length
+        channel_length = 0.0
+
+    # Calculate travel times (channel flow uses conservative n = 0.035, R = 1 ft)
+    tt_sheet, tt_shallow, tt_channel = _travel_times(
+        sheet_length, shallow_length, channel_length, slope_pct,
+        sheet_n, shallow_cp, 0.035, 1.0, p2_rainfall
+    )
+    tc_min = tt_sheet + tt_shallow + tt_channel
+
+    # Apply minimum TC
+    raw_tc_min = tc_min
+    if apply_adjustments and tc_min < min_tc:
+        adjusted_tc = True
+        bits |= _W_TC_MIN_APPLIED
+        tc_min = min_tc
+
+    return (tt_sheet, tt_shallow, tt_channel, sheet_length, shallow_length, channel_length,
+            raw_tc_min, tc_min, slope_pct, bits, adjusted_slope, adjusted_tc)
+
+
 class TR55VelocityDEMCalculator:
     """
     TR-55 Velocity Method with DEM-extracted parameters
@@ -508,22 +1402,8 @@ class TR55VelocityDEMCalculator:
         - Length ≤ 300 ft (100 ft recommended)
         - S should be > 0
         """
-        # Enforce maximum length
-        length_ft = min(length_ft, MAX_SHEET_FLOW_LENGTH)
-        
-        if length_ft <= 0 or slope_pct <= 0 or mannings_n <= 0:
-            return 0.0
-        
-        slope_ftft = slope_pct / 100.0
-        
-        # Apply low-slope adjustment
-        if slope_ftft < MIN_SLOPE_THRESHOLD:
-            slope_ftft = slope_ftft + LOW_SLOPE_ADJUSTMENT
-        
-        tt_hours = (0.007 * ((mannings_n * length_ft) ** 0.8)) / \
-                   ((p2_rainfall ** 0.5) * (slope_ftft ** 0.4))
-        
-        return tt_hours * 60.0  # Return minutes
+        return _travel_times(length_ft, 0.0, 0.0, slope_pct, mannings_n,
+                             0.0, 0.0, 0.0, p2_rainfall)[0]
     
     def calculate_shallow_conc_time(self, length_ft: float, slope_pct: float,
                                     surface_type: str = 'unpaved') -> float:
@@ -533,24 +1413,9 @@ class TR55VelocityDEMCalculator:
         V = Cp × S^0.5
         Tt = L / V / 60
         """
-        if length_ft <= 0 or slope_pct <= 0:
-            return 0.0
-        
-        slope_ftft = slope_pct / 100.0
-        
-        # Apply low-slope adjustment
-        if slope_ftft < MIN_SLOPE_THRESHOLD:
-            slope_ftft = slope_ftft + LOW_SLOPE_ADJUSTMENT
-        
-        # Get velocity coefficient
         cp = SHALLOW_CONC_COEFFICIENTS.get(surface_type.lower(), 16.1345)
-        
-        velocity_fps = cp * (slope_ftft ** 0.5)
-        
-        if velocity_fps <= 0:
-            return 0.0
-        
-        return (length_ft / velocity_fps) / 60.0  # Return minutes
+        return _travel_times(0.0, length_ft, 0.0, slope_pct, 0.0,
+                             cp, 0.0, 0.0, 0.0)[1]
     
     def calculate_channel_time(self, length_ft: float, slope_pct: float,
                                mannings_n: float, hydraulic_radius: float = 1.0) -> float:
@@ -560,22 +1425,26 @@ class TR55VelocityDEMCalculator:
         V = (1.49/n) × R^(2/3) × S^0.5
         Tt = L / V / 60
         """
-        if length_ft <= 0 or slope_pct <= 0 or mannings_n <= 0:
-            return 0.0
-        
-        slope_ftft = slope_pct / 100.0
-        
-        # Apply low-slope adjustment
-        if slope_ftft < MIN_SLOPE_THRESHOLD:
-            slope_ftft = slope_ftft + LOW_SLOPE_ADJUSTMENT
-        
-        velocity_fps = (1.49 / mannings_n) * (hydraulic_radius ** (2.0/3.0)) * (slope_ftft ** 0.5)
-        
-        if velocity_fps <= 0:
-            return 0.0
-        
-        return (length_ft / velocity_fps) / 60.0  # Return minutes
+        return _travel_times(0.0, 0.0, length_ft, slope_pct, 0.0,
+                             0.0, mannings_n, hydraulic_radius, 0.0)[2]
     
+    @staticmethod
+    def surface_parameters(land_type: str) -> Tuple[float, str, str]:
+        """
+        Surface characteristics assumed for a land type
+
+        Returns: (sheet_flow_n, shallow_surface_type, land_category)
+        """
+        lt = land_type.lower()
+        if lt in _SMOOTH_SURFACE_TYPES:
+            return 0.011, 'paved', 'paved'  # Smooth surface
+        elif lt in _DENSE_GRASS_TYPES:
+            return 0.24, 'unpaved', 'rural'  # Dense grass
+        elif lt in _WOODS_TYPES:
+            return 0.80, 'forest_heavy_litter', 'rural'  # Dense woods
+        else:  # rural, agricultural
+            return 0.15, 'unpaved', 'rural'  # Short grass
+
     def calculate_simplified(self, total_length_ft: float, slope_pct: float, cn: float,
                              land_type: str = 'rural', p2_rainfall: float = 3.5,
                              apply_adjustments: bool = True) -> Dict:
@@ -587,93 +1456,33 @@ class TR55VelocityDEMCalculator:
         - Remainder: Shallow concentrated flow
         - Land type determines surface characteristics
         """
-        result = {
-            'method': 'TR55_Simplified',
-            'tc_min': None,
-            'tt_sheet_min': 0.0,
-            'tt_shallow_min': 0.0,
-            'tt_channel_min': 0.0,
-            'length_ft': total_length_ft,
-            'slope_pct': slope_pct,
-            'adjusted_slope': False,
-            'adjusted_tc': False,
-            'warnings': [],
-            'valid': True,
-        }
+        return self.compute_simplified(total_length_ft, slope_pct, cn, land_type,
+                                       p2_rainfall, apply_adjustments).to_dict()
+
+    def compute_simplified(self, total_length_ft: float, slope_pct: float, cn: float,
+                           land_type: str = 'rural', p2_rainfall: float = 3.5,
+                           apply_adjustments: bool = True) -> TCResult:
+        """Same as calculate_simplified() but returns a TCResult"""
+        result = TCResult('TR55_Simplified', total_length_ft, slope_pct, slope_pct)
         
         if total_length_ft <= 0:
-            result['valid'] = False
-            result['warnings'].append("Zero or negative length")
+            result.valid = False
+            result.warning_bits = int(TCWarning.ZERO_LENGTH)
             return result
         
-        # Apply slope adjustments
-        slope_ftft = slope_pct / 100.0
-        if apply_adjustments and slope_ftft < MIN_SLOPE_THRESHOLD:
-            adj_slope, was_adjusted, adj_warning = DEMFlowpathExtractor.apply_slope_adjustment(slope_ftft)
-            if was_adjusted:
-                result['adjusted_slope'] = True
-                result['warnings'].append(adj_warning)
-                slope_pct = adj_slope * 100.0
-        
         # Determine surface characteristics based on land type
-        if land_type.lower() in ['paved', 'urban', 'commercial']:
-            sheet_n = 0.011  # Smooth surface
-            shallow_type = 'paved'
-            land_category = 'paved'
-        elif land_type.lower() in ['residential', 'suburban']:
-            sheet_n = 0.24  # Dense grass
-            shallow_type = 'unpaved'
-            land_category = 'rural'
-        elif land_type.lower() in ['woods', 'forest']:
-            sheet_n = 0.80  # Dense woods
-            shallow_type = 'forest_heavy_litter'
-            land_category = 'rural'
-        else:  # rural, agricultural
-            sheet_n = 0.15  # Short grass
-            shallow_type = 'unpaved'
-            land_category = 'rural'
-        
-        # Calculate flow segments
-        sheet_length = min(100.0, total_length_ft)  # First 100 ft is sheet flow
-        remaining_length = total_length_ft - sheet_length
-        
-        # Assume 80% shallow concentrated, 20% channel for longer paths
-        if remaining_length > 1000:
-            shallow_length = remaining_length * 0.8
-            channel_length = remaining_length * 0.2
-        else:
-            shallow_length = remaining_length
-            channel_length = 0.0
-        
-        # Calculate travel times
-        tt_sheet = self.calculate_sheet_flow_time(sheet_length, slope_pct, sheet_n, p2_rainfall)
-        tt_shallow = self.calculate_shallow_conc_time(shallow_length, slope_pct, shallow_type)
-        
-        # Channel flow (use conservative n = 0.035)
-        if channel_length > 0:
-            tt_channel = self.calculate_channel_time(channel_length, slope_pct, 0.035, 1.0)
-        else:
-            tt_channel = 0.0
-        
-        tc_min = tt_sheet + tt_shallow + tt_channel
-        
-        result['tt_sheet_min'] = tt_sheet
-        result['tt_shallow_min'] = tt_shallow
-        result['tt_channel_min'] = tt_channel
-        result['sheet_length_ft'] = sheet_length
-        result['shallow_length_ft'] = shallow_length
-        result['channel_length_ft'] = channel_length
-        
-        # Apply minimum TC
-        if apply_adjustments:
-            adj_tc, tc_adjusted, tc_warning = DEMFlowpathExtractor.apply_tc_minimum(tc_min, land_category)
-            if tc_adjusted:
-                result['adjusted_tc'] = True
-                result['warnings'].append(tc_warning)
-                tc_min = adj_tc
-        
-        result['tc_min'] = tc_min
-        result['slope_pct'] = slope_pct
+        sheet_n, shallow_type, land_category = self.surface_parameters(land_type)
+        shallow_cp = SHALLOW_CONC_COEFFICIENTS.get(shallow_type, 16.1345)
+        min_tc = MIN_TC_PAVED if land_category == 'paved' else MIN_TC_RURAL
+        
+        (result.tt_sheet_min, result.tt_shallow_min, result.tt_channel_min,
+         result.sheet_length_ft, result.shallow_length_ft, result.channel_length_ft,
+         result.raw_tc_min, result.tc_min, result.slope_pct, result.warning_bits,
+         result.adjusted_slope, result.adjusted_tc) = _tr55_simplified_kernel(
+            float(total_length_ft), float(slope_pct), sheet_n, shallow_cp, min_tc,
+            float(p2_rainfall), int(apply_adjustments)
+        )
+        result.land_category = land_category
         
         return result
 
@@ -703,13 +1512,13 @@ def compare_tc_methods(length_ft: float, slope_pct: float, cn: float,
     
     # SCS Lag
     scs_calc = SCSLagDEMCalculator()
-    scs_result = scs_calc.calculate(length_ft, slope_pct, cn)
-    results['methods']['scs_lag'] = scs_result
+    scs_result = scs_calc.compute(length_ft, slope_pct, cn)
+    results['methods']['scs_lag'] = scs_result.to_dict()
     
     # TR-55 Simplified
     tr55_calc = TR55VelocityDEMCalculator()
-    tr55_result = tr55_calc.calculate_simplified(length_ft, slope_pct, cn, land_type, p2_rainfall)
-    results['methods']['tr55_simplified'] = tr55_result
+    tr55_result = tr55_calc.compute_simplified(length_ft, slope_pct, cn, land_type, p2_rainfall)
+    results['methods']['tr55_simplified'] = tr55_result.to_dict()
     
     # Kirpich (for comparison)
     if slope_pct > 0 and length_ft > 0:
@@ -721,7 +1530,7 @@ def compare_tc_methods(length_ft: float, slope_pct: float, cn: float,
     
     # Kerby (for short overland flow)
     if length_ft <= 1200:  # Kerby limit
-        n_kerby = 0.4 if land_type.lower() in ['rural', 'grass'] else 0.02
+        n_kerby = 0.4 if land_type.lower() in _KERBY_GRASS_TYPES else 0.02
         slope_ftft = slope_pct / 100.0
         if slope_ftft < MIN_SLOPE_THRESHOLD:
             slope_ftft = slope_ftft + LOW_SLOPE_ADJUSTMENT
@@ -732,17 +1541,300 @@ def compare_tc_methods(length_ft: float, slope_pct: float, cn: float,
     return results
 
 
+# Result layout of compare_tc_methods_batch (TC values in minutes, NaN = not applicable)
+TC_BATCH_DTYPE = np.dtype([
+    ('length_ft', 'f8'),
+    ('slope_pct', 'f8'),
+    ('cn', 'f8'),
+    ('scs_lag', 'f8'),
+    ('tr55_simplified', 'f8'),
+    ('kirpich', 'f8'),
+    ('kerby', 'f8'),
+    ('adjusted_slope', '?'),
+])
+
+
+def compare_tc_methods_batch(lengths_ft: Sequence[float], slopes_pct: Sequence[float],
+                             cns: Sequence[float],
+                             land_types: Union[str, Sequence[str]] = 'rural',
+                             p2_rainfall: float = 3.5) -> np.ndarray:
+    """
+    Vectorized compare_tc_methods for many subbasins at once
+
+    Applies the same adjustments as the scalar calculators (low-slope
+    adjustment, CN clamping, minimum TC) using NumPy array operations,
+    so results match compare_tc_methods row for row.
+
+    Args:
+        lengths_ft: Flow lengths in feet
+        slopes_pct: Average slopes in percent
+        cns: Curve numbers
+        land_types: One land type for all rows, or one per row
+        p2_rainfall: 2-yr 24-hr rainfall (in)
+
+    Returns:
+        Structured array with TC_BATCH_DTYPE fields, one row per subbasin.
+        TC columns are NaN where a method does not apply.
+    """
+    length, slope_pct, cn = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(lengths_ft, dtype=np.float64)),
+        np.atleast_1d(np.asarray(slopes_pct, dtype=np.float64)),
+        np.atleast_1d(np.asarray(cns, dtype=np.float64)),
+    )
+
+    if isinstance(land_types, str):
+        land_types = [land_types] * length.size
+    # Resolve each distinct land type once
+    surface_of = {lt: TR55VelocityDEMCalculator.surface_parameters(lt) for lt in set(land_types)}
+    surfaces = [surface_of[lt] for lt in land_types]
+    sheet_n = np.array([sf[0] for sf in surfaces], dtype=np.float64)
+    shallow_cp = np.array([SHALLOW_CONC_COEFFICIENTS.get(sf[1], 16.1345) for sf in surfaces],
+                          dtype=np.float64)
+    min_tc = np.array([MIN_TC_PAVED if sf[2] == 'paved' else MIN_TC_RURAL for sf in surfaces],
+                      dtype=np.float64)
+    kerby_n = np.array([0.4 if lt.lower() in _KERBY_GRASS_TYPES else 0.02 for lt in land_types],
+                       dtype=np.float64)
+
+    out = np.zeros(length.shape, dtype=TC_BATCH_DTYPE)
+    out['length_ft'] = length
+    out['slope_pct'] = slope_pct
+    out['cn'] = cn
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # TxDOT adjustment as in apply_slope_adjustment
+        slope_ftft = slope_pct / 100.0
+        adverse = slope_ftft < 0
+        low = ~adverse & (slope_ftft < MIN_SLOPE_THRESHOLD)
+        adj_pct = 100.0 * np.where(adverse, LOW_SLOPE_ADJUSTMENT,
+                                   np.where(low, slope_ftft + LOW_SLOPE_ADJUSTMENT, slope_ftft))
+        out['adjusted_slope'] = adverse | low
+
+        # SCS Lag
+        out['scs_lag'] = SCSLagDEMCalculator.compute_batch(length, slope_pct, cn)['tc_min']
+
+        # TR-55 Simplified (travel time kernel applies its own low-slope adjustment)
+        seg_ftft = adj_pct / 100.0
+        seg_ftft = np.where(seg_ftft < MIN_SLOPE_THRESHOLD, seg_ftft + LOW_SLOPE_ADJUSTMENT, seg_ftft)
+        sqrt_s = np.sqrt(seg_ftft)
+        sheet_len = np.minimum(100.0, length)
+        remaining = length - sheet_len
+        long_path = remaining > 1000
+        shallow_len = np.where(long_path, remaining * 0.8, remaining)
+        channel_len = np.where(long_path, remaining * 0.2, 0.0)
+
+        tt_sheet = np.where(sheet_len > 0,
+                            60.0 * 0.007 * ((sheet_n * sheet_len) ** 0.8) /
+                            ((p2_rainfall ** 0.5) * (seg_ftft ** 0.4)),
+                            0.0)
+        shallow_v = shallow_cp * sqrt_s
+        tt_shallow = np.where((shallow_len > 0) & (shallow_v > 0),
+                              shallow_len / shallow_v / 60.0, 0.0)
+        channel_v = (1.49 / 0.035) * sqrt_s
+        tt_channel = np.where((channel_len > 0) & (channel_v > 0),
+                              channel_len / channel_v / 60.0, 0.0)
+        tt_total = np.where(adj_pct > 0, tt_sheet + tt_shallow + tt_channel, 0.0)
+        out['tr55_simplified'] = np.where(length > 0, np.maximum(tt_total, min_tc), np.nan)
+
+        # Kirpich
+        kirpich_ftft = np.where(slope_ftft < MIN_SLOPE_THRESHOLD,
+                                slope_ftft + LOW_SLOPE_ADJUSTMENT, slope_ftft)
+        out['kirpich'] = np.where((slope_pct > 0) & (length > 0),
+                                  0.0078 * (length ** 0.77) / (kirpich_ftft ** 0.385),
+                                  np.nan)
+
+        # Kerby (short overland flow only)
+        out['kerby'] = np.where((length <= 1200) & (kirpich_ftft > 0),
+                                1.44 * ((kerby_n * length) ** 0.467) / (kirpich_ftft ** 0.235),
+                                np.nan)
+
+    return out
+
+
 # =============================================================================
 # WIDGET FOR DEM EXTRACTION MODE
 # =============================================================================
 
+# Per-subbasin summary kept alongside the results dict (TC NaN = not computed)
+EXTRACTION_SUMMARY_DTYPE = np.dtype([
+    ('adjusted', '?'),
+    ('warnings', 'u2'),
+    ('length_ft', 'f4'),
+    ('slope_pct', 'f4'),
+    ('tc_scs', 'f4'),
+    ('tc_tr55', 'f4'),
+])
+
+
+# Fallback methods reference table shown under the extraction controls
+_REF_HTML = """
+<table border="1" cellpadding="3" style="border-collapse: collapse; font-size: 10px;">
+<tr style="background-color: #f0f0f0;"><th>Condition</th><th>Action</th><th>Source</th></tr>
+<tr><td>S &lt; 0.2%</td><td>Add 0.0005 to slope</td><td>TxDOT/Cleveland 2012</td></tr>
+<tr><td>S between 0.2-0.3%</td><td>Transitional - flag for review</td><td>TxDOT</td></tr>
+<tr><td>Adverse slope (S &lt; 0)</td><td>Use minimum slope 0.05%</td><td>Engineering judgment</td></tr>
+<tr><td>TC &lt; 6 min</td><td>Use 6 min minimum</td><td>NRCS</td></tr>
+<tr><td>TC &lt; 5 min (paved)</td><td>Use 5 min minimum</td><td>Caltrans HDM</td></tr>
+<tr><td>TC &lt; 10 min (rural)</td><td>Use 10 min minimum</td><td>Caltrans HDM</td></tr>
+</table>
+"""
+
+
+def _new_extraction_summary(size: int) -> np.ndarray:
+    """Empty EXTRACTION_SUMMARY_DTYPE array with TC columns set to NaN"""
+    summary = np.zeros(size, dtype=EXTRACTION_SUMMARY_DTYPE)
+    summary['tc_scs'] = np.nan
+    summary['tc_tr55'] = np.nan
+    return summary
+
+
+class ExtractionWorker(QObject):
+    """
+    Runs the subbasin extraction loop off the GUI thread
+
+    Move to a QThread and connect the thread's started signal to run().
+    Features are read through a QgsVectorLayerFeatureSource, so the
+    subbasin layer itself is never touched from the worker thread.
+    """
+    
+    progress = pyqtSignal(int, str)  # (processed, current subbasin ID)
+    feature_processed = pyqtSignal(str, object)  # (subbasin_id, result)
+    finished = pyqtSignal(object, object, object)  # (results, summary, skipped IDs)
+    failed = pyqtSignal(str)
+    
+    def __init__(self, extractor: DEMFlowpathExtractor,
+                 source: QgsVectorLayerFeatureSource, total: int, id_field_idx: int,
+                 dem_rect: Optional[QgsRectangle], use_scs: bool, use_tr55: bool,
+                 p2_rainfall: float, apply_adjustments: bool):
+        super().__init__()
+        self.extractor = extractor
+        self.source = source
+        self.total = total
+        self.id_field_idx = id_field_idx
+        self.dem_rect = dem_rect
+        self.use_scs = use_scs
+        self.p2_rainfall = p2_rainfall
+        self.apply_adjustments = apply_adjustments
+        self.tr55_calc = TR55VelocityDEMCalculator() if use_tr55 else None
+        
+        # Get CN from subbasin params if available
+        self.cn = 75  # Default - would come from parameter table
+    
+    def run(self):
+        try:
+            results, summary, skipped = self._extract()
+        except Exception:
+            self.failed.emit(traceback.format_exc())
+            return
+        self.finished.emit(results, summary, skipped)
+    
+    def _extract(self) -> Tuple[Dict, np.ndarray, List[str]]:
+        """Process every subbasin; returns (results, summary, skipped IDs)"""
+        id_field_idx = self.id_field_idx
+        
+        # Stream features with only the ID attribute, limited to the DEM extent
+        request = QgsFeatureRequest().setSubsetOfAttributes([id_field_idx])
+        if self.dem_rect is not None:
+            request.setFilterRect(self.dem_rect)
+        seen_fids = set()
+        
+        # featureCount() may be an estimate (or -1); the summary grows if needed
+        results = {}
+        summary = _new_extraction_summary(max(self.total, 0))
+        processed = 0
+        features = self.source.getFeatures(request)
+        while True:
+            chunk = list(islice(features, EXTRACTION_CHUNK_SIZE))
+            if not chunk:
+                break
+            
+            # Extract flowpaths from DEM (parallel where the extractor allows it)
+            fp_results = self.extractor.extract_all(chunk)
+            
+            # SCS lag for the whole chunk in one vectorized pass
+            scs_rows = SCSLagDEMCalculator.compute_batch(
+                [r['length_ft'] for r in fp_results], [r['slope_pct'] for r in fp_results],
+                self.cn, self.apply_adjustments
+            ) if self.use_scs else None
+            
+            for k, (feature, fp_result) in enumerate(zip(chunk, fp_results)):
+                processed += 1
+                seen_fids.add(feature.id())
+                sb_id_val = self._process_extraction(
+                    feature.attribute(id_field_idx), fp_result, results,
+                    None if scs_rows is None else scs_rows[k]
+                )
+                if processed > len(summary):
+                    summary = np.concatenate(
+                        [summary, _new_extraction_summary(max(len(summary), EXTRACTION_CHUNK_SIZE))])
+                self.feature_processed.emit(sb_id_val, results[sb_id_val])
+                tc_methods = results[sb_id_val]['tc_methods']
+                summary[processed - 1] = (
+                    fp_result['adjusted'], len(fp_result['warnings']),
+                    fp_result['length_ft'], fp_result['slope_pct'],
+                    tc_methods['scs_lag']['tc_min'] if 'scs_lag' in tc_methods else np.nan,
+                    tc_methods['tr55']['tc_min'] if 'tr55' in tc_methods else np.nan,
+                )
+                
+                # Report only every PROGRESS_UPDATE_INTERVAL subbasins
+                if (processed & (PROGRESS_UPDATE_INTERVAL - 1)) == 0 or processed == self.total:
+                    self.progress.emit(processed, sb_id_val)
+        
+        # IDs of subbasins the extent filter left out (attributes only, no geometry)
+        skipped = []
+        if self.dem_rect is not None:
+            id_request = QgsFeatureRequest().setFlags(QgsFeatureRequest.NoGeometry)
+            id_request.setSubsetOfAttributes([id_field_idx])
+            skipped = [str(f.attribute(id_field_idx)) for f in self.source.getFeatures(id_request)
+                       if f.id() not in seen_fids]
+        
+        return results, summary[:processed], skipped
+    
+    def _process_extraction(self, sb_id_val, fp_result: Dict, results: Dict,
+                            scs_row: Optional[np.void]) -> str:
+        """Store one subbasin's extraction and compute its TC methods; returns the ID"""
+        sb_id_val = str(sb_id_val)
+        fp_result['subbasin_id'] = sb_id_val
+        results[sb_id_val] = {
+            'extraction': fp_result,
+            'tc_methods': {}
+        }
+        
+        # Calculate TC using selected methods
+        if fp_result['length_ft'] > 0 and fp_result['slope_pct'] > 0:
+            length = fp_result['length_ft']
+            slope = fp_result['slope_pct']
+            
+            if scs_row is not None:
+                scs_result = SCSLagDEMCalculator.result_from_batch(scs_row).to_dict()
+                results[sb_id_val]['tc_methods']['scs_lag'] = scs_result
+            
+            if self.tr55_calc is not None:
+                tr55_result = self.tr55_calc.calculate_simplified(
+                    length, slope, self.cn, 'rural', self.p2_rainfall, self.apply_adjustments
+                )
+                results[sb_id_val]['tc_methods']['tr55'] = tr55_result
+        
+        return sb_id_val
+
+
 class DEMExtractionWidget(QWidget):
     """Widget for DEM-based flowpath extraction in TC Calculator"""
     
     extraction_complete = pyqtSignal(dict)
+    feature_processed = pyqtSignal(str, dict)  # (subbasin_id, result) as each finishes
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # DEM metadata from earlier runs, keyed by (source, modification time)
+        self._dem_meta_cache: Dict[Tuple[str, float], Dict[str, Any]] = {}
+        # Objects of the current (or last) extraction run
+        self._extractor = None
+        self._worker = None
+        self._thread = None
+        # Layers listed in the combos (item data holds indices into this list)
+        self._layer_registry: List[Any] = []
+        # Field names per subbasin layer ID
+        self._fields_cache: Dict[str, List[str]] = {}
         self.setup_ui()
         
     def setup_ui(self):
@@ -892,17 +1984,7 @@ class DEMExtractionWidget(QWidget):
         ref_frame.setFrameStyle(QFrame.StyledPanel)
         ref_layout = QVBoxLayout(ref_frame)
         ref_layout.addWidget(QLabel("<b>Fallback Methods Reference</b>"))
-        ref_layout.addWidget(QLabel("""
-<table border="1" cellpadding="3" style="border-collapse: collapse; font-size: 10px;">
-<tr style="background-color: #f0f0f0;"><th>Condition</th><th>Action</th><th>Source</th></tr>
-<tr><td>S &lt; 0.2%</td><td>Add 0.0005 to slope</td><td>TxDOT/Cleveland 2012</td></tr>
-<tr><td>S between 0.2-0.3%</td><td>Transitional - flag for review</td><td>TxDOT</td></tr>
-<tr><td>Adverse slope (S &lt; 0)</td><td>Use minimum slope 0.05%</td><td>Engineering judgment</td></tr>
-<tr><td>TC &lt; 6 min</td><td>Use 6 min minimum</td><td>NRCS</td></tr>
-<tr><td>TC &lt; 5 min (paved)</td><td>Use 5 min minimum</td><td>Caltrans HDM</td></tr>
-<tr><td>TC &lt; 10 min (rural)</td><td>Use 10 min minimum</td><td>Caltrans HDM</td></tr>
-</table>
-        """))
+        ref_layout.addWidget(QLabel(_REF_HTML))
         layout.addWidget(ref_frame)
         
         # Connect signals
@@ -913,138 +1995,200 @@ class DEMExtractionWidget(QWidget):
         
     def refresh_layers(self):
         """Refresh available layers in combos"""
-        # Clear combos
-        self.dem_combo.clear()
-        self.subbasin_combo.clear()
-        self.outlet_combo.clear()
-        self.outlet_combo.addItem("-- None (auto-detect) --", None)
+        # Field lists may have changed since the last refresh
+        self._fields_cache.clear()
         
-        # Add raster layers to DEM combo
+        # Classify project layers in a single pass
+        rasters, polygons, points = [], [], []
         for layer in QgsProject.instance().mapLayers().values():
             if isinstance(layer, QgsRasterLayer):
-                self.dem_combo.addItem(layer.name(), layer.id())
-        
-        # Add polygon layers to subbasin combo
-        for layer in QgsProject.instance().mapLayers().values():
-            if isinstance(layer, QgsVectorLayer) and layer.geometryType() == QgsWkbTypes.PolygonGeometry:
-                self.subbasin_combo.addItem(layer.name(), layer.id())
-        
-        # Add point layers to outlet combo
-        for layer in QgsProject.instance().mapLayers().values():
-            if isinstance(layer, QgsVectorLayer) and layer.geometryType() == QgsWkbTypes.PointGeometry:
-                self.outlet_combo.addItem(layer.name(), layer.id())
+                rasters.append(layer)
+            elif isinstance(layer, QgsVectorLayer):
+                geom_type = layer.geometryType()
+                if geom_type == QgsWkbTypes.PolygonGeometry:
+                    polygons.append(layer)
+                elif geom_type == QgsWkbTypes.PointGeometry:
+                    points.append(layer)
+        
+        # Combo item data is an index into this list
+        self._layer_registry = rasters + polygons + points
+        
+        # Repopulate without per-item signals or repaints
+        combos = [
+            (self.dem_combo, rasters, None),
+            (self.subbasin_combo, polygons, None),
+            (self.outlet_combo, points, "-- None (auto-detect) --"),
+        ]
+        offset = 0
+        for combo, layers, none_item in combos:
+            combo.blockSignals(True)
+            combo.setUpdatesEnabled(False)
+            combo.clear()
+            if none_item:
+                combo.addItem(none_item, None)
+            for index, layer in enumerate(layers, offset):
+                combo.addItem(layer.name(), index)
+            combo.setUpdatesEnabled(True)
+            combo.blockSignals(False)
+            offset += len(layers)
         
         self.on_subbasin_changed()
+    
+    def _combo_layer(self, combo: QComboBox):
+        """Layer selected in a layer combo; None for no selection or a deleted layer"""
+        index = combo.currentData()
+        if index is None:
+            return None
+        layer = self._layer_registry[index]
+        try:
+            layer.id()
+        except RuntimeError:  # Removed from the project since the last refresh
+            return None
+        return layer
         
     def on_subbasin_changed(self):
         """Update field combo when subbasin layer changes"""
+        self.id_field_combo.blockSignals(True)
         self.id_field_combo.clear()
         
-        layer_id = self.subbasin_combo.currentData()
-        if layer_id:
-            layer = QgsProject.instance().mapLayer(layer_id)
-            if layer:
-                for field in layer.fields():
-                    self.id_field_combo.addItem(field.name(), field.name())
-                
-                # Try to auto-select ID field
-                for i in range(self.id_field_combo.count()):
-                    name = self.id_field_combo.itemText(i).upper()
-                    if 'ID' in name or 'NAME' in name:
-                        self.id_field_combo.setCurrentIndex(i)
-                        break
+        layer = self._combo_layer(self.subbasin_combo)
+        if layer:
+            names = self._fields_cache.get(layer.id())
+            if names is None:
+                names = self._fields_cache[layer.id()] = [f.name() for f in layer.fields()]
+            # Add fields, noting the first that looks like an ID for auto-select
+            id_index = None
+            for i, name in enumerate(names):
+                self.id_field_combo.addItem(name, name)
+                if id_index is None:
+                    upper = name.upper()
+                    if 'ID' in upper or 'NAME' in upper:
+                        id_index = i
+            if id_index is not None:
+                self.id_field_combo.setCurrentIndex(id_index)
+        
+        self.id_field_combo.blockSignals(False)
     
     def run_extraction(self):
         """Run DEM extraction for all subbasins"""
         # Get selected layers
-        dem_id = self.dem_combo.currentData()
-        sb_id = self.subbasin_combo.currentData()
+        has_dem = self.dem_combo.currentData() is not None
+        has_sb = self.subbasin_combo.currentData() is not None
         id_field = self.id_field_combo.currentData()
         
-        if not dem_id or not sb_id or not id_field:
+        if not has_dem or not has_sb or not id_field:
             QMessageBox.warning(self, "Missing Input", 
                                "Please select DEM layer, subbasin layer, and ID field.")
             return
         
-        dem_layer = QgsProject.instance().mapLayer(dem_id)
-        sb_layer = QgsProject.instance().mapLayer(sb_id)
+        dem_layer = self._combo_layer(self.dem_combo)
+        sb_layer = self._combo_layer(self.subbasin_combo)
         
         if not dem_layer or not sb_layer:
             QMessageBox.warning(self, "Invalid Layer", "Selected layers not found.")
             return
         
         # Get optional outlets layer
-        outlet_id = self.outlet_combo.currentData()
-        outlet_layer = QgsProject.instance().mapLayer(outlet_id) if outlet_id else None
-        
-        # Initialize extractor
-        extractor = DEMFlowpathExtractor(dem_layer, sb_layer, outlet_layer)
-        
-        # Get options
-        apply_adjustments = self.apply_slope_adj.isChecked()
-        use_scs = self.scs_lag_radio.isChecked() or self.both_radio.isChecked()
-        use_tr55 = self.tr55_radio.isChecked() or self.both_radio.isChecked()
-        p2_rainfall = self.p2_spin.value()
-        
-        # Process subbasins
-        results = {}
-        features = list(sb_layer.getFeatures())
-        total = len(features)
+        outlet_layer = self._combo_layer(self.outlet_combo)
         
+        # Initialize extractor (outlets are indexed once for the whole run)
+        outlet_index = DEMFlowpathExtractor.build_outlet_index(
+            outlet_layer, sb_layer.crs()) if outlet_layer else None
+        try:
+            dem_key = (dem_layer.source(), os.path.getmtime(dem_layer.source()))
+        except OSError:  # Not a plain file (e.g. a database or web source)
+            dem_key = None
+        extractor = DEMFlowpathExtractor(dem_layer, sb_layer, outlet_layer, outlet_index,
+                                         dem_meta=self._dem_meta_cache.get(dem_key))
+        if dem_key is not None:
+            self._dem_meta_cache[dem_key] = extractor.dem_meta
+        
+        # Only subbasins whose bounding box touches the DEM
+        dem_rect = self._dem_extent_in(dem_layer, sb_layer.crs())
+        
+        # The worker reads features through a thread-safe source, never the layer
+        if not extractor.direct_sampling:
+            extractor.clone_provider()
+        self._extractor = extractor
+        self._worker = ExtractionWorker(
+            extractor, QgsVectorLayerFeatureSource(sb_layer), sb_layer.featureCount(),
+            sb_layer.fields().indexOf(id_field), dem_rect,
+            use_scs=self.scs_lag_radio.isChecked() or self.both_radio.isChecked(),
+            use_tr55=self.tr55_radio.isChecked() or self.both_radio.isChecked(),
+            p2_rainfall=self.p2_spin.value(),
+            apply_adjustments=self.apply_slope_adj.isChecked(),
+        )
+        self._thread = QThread(self)
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.run)
+        self._worker.progress.connect(self._on_extraction_progress)
+        self._worker.feature_processed.connect(self.feature_processed.emit)
+        self._worker.finished.connect(self._on_extraction_finished)
+        self._worker.failed.connect(self._on_extraction_failed)
+        for signal in (self._worker.finished, self._worker.failed):
+            signal.connect(self._thread.quit)
+        self._thread.finished.connect(self._worker.deleteLater)
+        self._thread.finished.connect(self._thread.deleteLater)
+        
+        self.extract_btn.setEnabled(False)
         self.progress_bar.setVisible(True)
-        self.progress_bar.setMaximum(total)
-        
-        for i, feature in enumerate(features):
-            sb_id_val = str(feature[id_field])
-            
-            # Extract flowpath from DEM
-            fp_result = extractor.extract_flowpath_simple(feature)
-            fp_result['subbasin_id'] = sb_id_val
-            
-            results[sb_id_val] = {
-                'extraction': fp_result,
-                'tc_methods': {}
-            }
-            
-            # Calculate TC using selected methods
-            if fp_result['length_ft'] > 0 and fp_result['slope_pct'] > 0:
-                length = fp_result['length_ft']
-                slope = fp_result['slope_pct']
-                
-                # Get CN from subbasin params if available
-                cn = 75  # Default - would come from parameter table
-                
-                if use_scs:
-                    scs_calc = SCSLagDEMCalculator()
-                    scs_result = scs_calc.calculate(length, slope, cn, apply_adjustments)
-                    results[sb_id_val]['tc_methods']['scs_lag'] = scs_result
-                
-                if use_tr55:
-                    tr55_calc = TR55VelocityDEMCalculator()
-                    tr55_result = tr55_calc.calculate_simplified(
-                        length, slope, cn, 'rural', p2_rainfall, apply_adjustments
-                    )
-                    results[sb_id_val]['tc_methods']['tr55'] = tr55_result
-            
-            self.progress_bar.setValue(i + 1)
-            self.status_label.setText(f"Processing {sb_id_val}...")
-        
+        self.progress_bar.setMaximum(max(sb_layer.featureCount(), 0))
+        self.progress_bar.setValue(0)
+        self.status_label.setText("Extracting flowpaths...")
+        self._thread.start()
+    
+    def _on_extraction_progress(self, processed: int, sb_id_val: str):
+        self.progress_bar.setValue(processed)
+        self.status_label.setText(f"Processing {sb_id_val}...")
+    
+    def _end_extraction(self):
+        """Release the extractor and restore the controls after a run"""
+        self._extractor.close()
+        self._extractor = None
         self.progress_bar.setVisible(False)
-        self.status_label.setText(f"Completed: {total} subbasins processed")
+        self.extract_btn.setEnabled(True)
+    
+    def _on_extraction_finished(self, results: Dict, summary: np.ndarray, skipped: List[str]):
+        self._end_extraction()
+        self.status_label.setText(f"Completed: {len(summary)} subbasins processed")
         
         # Emit results
         self.extraction_complete.emit(results)
         
         # Show summary
-        self.show_extraction_summary(results)
+        self.show_extraction_summary(results, summary, skipped)
+    
+    def _on_extraction_failed(self, message: str):
+        self._end_extraction()
+        self.status_label.setText("Extraction failed")
+        QMessageBox.critical(self, "Extraction Failed", message)
     
-    def show_extraction_summary(self, results: Dict):
-        """Show summary of extraction results"""
-        total = len(results)
-        adjusted_count = sum(1 for r in results.values() 
-                           if r['extraction'].get('adjusted', False))
-        warning_count = sum(1 for r in results.values() 
-                          if r['extraction'].get('warnings', []))
+    @staticmethod
+    def _dem_extent_in(dem_layer: QgsRasterLayer,
+                       crs: QgsCoordinateReferenceSystem) -> Optional[QgsRectangle]:
+        """DEM extent in crs, or None if it cannot be transformed"""
+        extent = dem_layer.extent()
+        if dem_layer.crs() == crs:
+            return extent
+        xform = QgsCoordinateTransform(dem_layer.crs(), crs, QgsProject.instance().transformContext())
+        try:
+            return xform.transformBoundingBox(extent)
+        except QgsCsException:
+            return None
+    
+    def show_extraction_summary(self, results: Dict, summary: Optional[np.ndarray] = None,
+                                skipped: Optional[List[str]] = None):
+        """Show summary of extraction results (counts from summary when given)"""
+        if summary is not None:
+            total = len(summary)
+            adjusted_count = int(summary['adjusted'].sum())
+            warning_count = int((summary['warnings'] > 0).sum())
+        else:
+            total = len(results)
+            adjusted_count = sum(1 for r in results.values() 
+                               if r['extraction'].get('adjusted', False))
+            warning_count = sum(1 for r in results.values() 
+                              if r['extraction'].get('warnings', []))
         
         msg = f"""
 DEM Extraction Complete
@@ -1059,6 +2203,10 @@ Check the Results tab for detailed output.
         if adjusted_count > 0:
             msg += f"\nNote: {adjusted_count} subbasins had flat terrain adjustments applied per TxDOT guidance."
         
+        if skipped:
+            shown = ", ".join(skipped[:10]) + (", ..." if len(skipped) > 10 else "")
+            msg += f"\n\nSkipped {len(skipped)} subbasins outside the DEM extent: {shown}"
+        
         QMessageBox.information(self, "Extraction Complete", msg)
 
 
@@ -1070,8 +2218,12 @@ __all__ = [
     'DEMFlowpathExtractor',
     'SCSLagDEMCalculator', 
     'TR55VelocityDEMCalculator',
+    'TCResult',
+    'TCWarning',
     'DEMExtractionWidget',
+    'ExtractionWorker',
     'compare_tc_methods',
+    'compare_tc_methods_batch',
     'MIN_SLOPE_THRESHOLD',
     'LOW_SLOPE_ADJUSTMENT',
     'MIN_TC_DEFAULT',
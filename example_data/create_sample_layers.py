@@ -10,13 +10,388 @@ Date: January 2025
 """
 
 import os
+import sqlite3
+import struct
+from contextlib import closing
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from qgis.core import (
-    QgsVectorLayer, QgsFeature, QgsGeometry, QgsPointXY,
+    QgsVectorLayer, QgsFeature, QgsGeometry,
     QgsField, QgsFields, QgsProject, QgsCoordinateReferenceSystem,
-    QgsVectorFileWriter, QgsWkbTypes, Qgis
+    QgsWkbTypes, Qgis
 )
 from qgis.PyQt.QtCore import QVariant
+import numpy as np
+
+
+# Coordinate Reference System (SC State Plane - feet)
+# Change this to match your local CRS
+_SAMPLE_CRS = QgsCoordinateReferenceSystem.fromEpsgId(2273)  # SC State Plane South (feet)
+_SAMPLE_CRS_WKT = _SAMPLE_CRS.toWkt()
+
+# Sample coordinates are stored as offsets in feet from this base point
+# (around 2,100,000 E, 100,000 N - approximate Lowcountry SC) and shifted
+# in one array operation when a layer is built
+_SAMPLE_ORIGIN = np.array([2100000.0, 100000.0])
+
+# Progress messages are collected here and printed in one write at the end
+# of create_sample_data(); each print() is a console round trip in QGIS.
+_log_lines = []
+
+
+def _log(message: str):
+    """Queue a progress message for the next _flush_log()."""
+    _log_lines.append(message)
+
+
+def _flush_log():
+    """Print and clear all queued progress messages."""
+    if _log_lines:
+        print("\n".join(_log_lines))
+        _log_lines.clear()
+
+
+# Attribute schema per sample layer: (name, type, length, precision)
+_FIELD_SPECS = {
+    "subbasins": [
+        ("Subbasin_ID", QVariant.String, 20, 0),
+        ("Name", QVariant.String, 50, 0),
+        ("Area_Acres", QVariant.Double, 10, 2),
+        ("Slope_Pct", QVariant.Double, 6, 2),
+        ("Tc_min", QVariant.Double, 8, 1),
+        ("CN", QVariant.Int, 0, 0),
+        ("C_Value", QVariant.Double, 4, 2),
+        ("Description", QVariant.String, 100, 0),
+    ],
+    "landuse": [
+        ("LU_ID", QVariant.Int, 0, 0),
+        ("Land_Use", QVariant.String, 30, 0),
+        ("Description", QVariant.String, 100, 0),
+        ("Imperv_Pct", QVariant.Double, 5, 1),
+    ],
+    "soils": [  # similar to SSURGO format
+        ("MUKEY", QVariant.String, 20, 0),
+        ("MUSYM", QVariant.String, 10, 0),
+        ("MUNAME", QVariant.String, 100, 0),
+        ("HSG", QVariant.String, 5, 0),
+        ("Hydric_Pct", QVariant.Int, 0, 0),
+        ("Ksat_um_s", QVariant.Double, 8, 2),
+    ],
+    "flowpaths": [
+        ("FP_ID", QVariant.String, 20, 0),
+        ("Subbasin_ID", QVariant.String, 20, 0),
+        ("Segment", QVariant.Int, 0, 0),
+        ("Flow_Type", QVariant.String, 20, 0),
+        ("Length_ft", QVariant.Double, 10, 1),
+        ("Slope_Pct", QVariant.Double, 6, 2),
+        ("Mannings_n", QVariant.Double, 6, 3),
+        ("Description", QVariant.String, 100, 0),
+    ],
+    "channels": [
+        ("Channel_ID", QVariant.String, 20, 0),
+        ("Name", QVariant.String, 50, 0),
+        ("Bottom_W_ft", QVariant.Double, 8, 2),
+        ("Side_Slope", QVariant.Double, 6, 2),
+        ("Depth_ft", QVariant.Double, 6, 2),
+        ("Mannings_n", QVariant.Double, 6, 3),
+        ("Slope_ftft", QVariant.Double, 8, 5),
+        ("Lining", QVariant.String, 30, 0),
+        ("Q_Design_cfs", QVariant.Double, 10, 2),
+    ],
+    "outlets": [
+        ("Outlet_ID", QVariant.String, 20, 0),
+        ("Subbasin_ID", QVariant.String, 20, 0),
+        ("Name", QVariant.String, 50, 0),
+        ("Type", QVariant.String, 20, 0),
+        ("Invert_Elev", QVariant.Double, 10, 2),
+    ],
+}
+
+
+def _build_fields(spec) -> QgsFields:
+    """Build a QgsFields schema from (name, type, length, precision) tuples."""
+    fields = QgsFields()
+    for name, field_type, length, precision in spec:
+        fields.append(QgsField(name, field_type, len=length, prec=precision))
+    return fields
+
+
+_FIELDS_CACHE = {name: _build_fields(spec) for name, spec in _FIELD_SPECS.items()}
+
+
+def _row_getter(keys):
+    """Return an itemgetter that yields a tuple even for zero or one key."""
+    if len(keys) > 1:
+        return itemgetter(*keys)
+    return lambda record: tuple(record[k] for k in keys)
+
+
+def _split_records(records, text_keys, numeric_keys):
+    """
+    Convert a list of sample record dicts into column arrays.
+    
+    Returns:
+        tuple: (text, numeric, coords, offsets) - text attributes as an
+        (N, t) object array, numeric attributes as (N, k) float64, every
+        vertex in one (M, 2) float64 buffer and (N + 1,) offsets into it;
+        the record coordinates are offsets from _SAMPLE_ORIGIN
+    """
+    get_text = _row_getter(text_keys)
+    get_numeric = _row_getter(numeric_keys)
+    text = np.array([get_text(r) for r in records], dtype=object)
+    numeric = np.array([get_numeric(r) for r in records], dtype=np.float64)
+    numeric = numeric.reshape(len(records), len(numeric_keys))
+    rings = [np.asarray(r["coords"], dtype=np.float64).reshape(-1, 2) for r in records]
+    offsets = np.zeros(len(records) + 1, dtype=np.int64)
+    np.cumsum([len(ring) for ring in rings], out=offsets[1:])
+    return text, numeric, np.concatenate(rings) + _SAMPLE_ORIGIN, offsets
+
+
+# WKB header: byte order (1 = little-endian), geometry type (1 = Point,
+# 2 = LineString, 3 = Polygon), then the ring or vertex count if any
+def _polygon_wkb(rings) -> bytes:
+    """Encode a polygon given as a list of (x, y) rings as little-endian WKB."""
+    buf = bytearray(struct.pack("<BII", 1, 3, len(rings)))
+    for ring in rings:
+        buf += struct.pack("<I", len(ring))
+        buf += np.asarray(ring, dtype="<f8").tobytes()
+    return bytes(buf)
+
+
+def _linestring_wkb(coords) -> bytes:
+    """Encode a list of (x, y) vertices as a little-endian WKB linestring."""
+    return (struct.pack("<BII", 1, 2, len(coords))
+            + np.asarray(coords, dtype="<f8").tobytes())
+
+
+def _point_wkb(x: float, y: float) -> bytes:
+    """Encode a single vertex as a little-endian WKB point."""
+    return struct.pack("<BIdd", 1, 1, x, y)
+
+
+def polygon_geometry(coords) -> QgsGeometry:
+    """Build a single-ring polygon from an (N, 2) vertex array."""
+    geom = QgsGeometry()
+    geom.fromWkb(_polygon_wkb([coords]))
+    return geom
+
+
+def line_geometry(coords) -> QgsGeometry:
+    """Build a linestring from an (N, 2) vertex array."""
+    geom = QgsGeometry()
+    geom.fromWkb(_linestring_wkb(coords))
+    return geom
+
+
+def point_geometry(x: float, y: float) -> QgsGeometry:
+    """Build a point geometry."""
+    geom = QgsGeometry()
+    geom.fromWkb(_point_wkb(x, y))
+    return geom
+
+
+# GeoPackage column types for the QVariant types used by the sample layers
+_GPKG_FIELD_TYPES = {
+    QVariant.String: "TEXT",
+    QVariant.Double: "REAL",
+    QVariant.Int: "MEDIUMINT",
+}
+
+_WGS84_WKT = (
+    'GEOGCS["WGS 84",DATUM["WGS_1984",SPHEROID["WGS 84",6378137,298.257223563,'
+    'AUTHORITY["EPSG","7030"]],AUTHORITY["EPSG","6326"]],PRIMEM["Greenwich",0,'
+    'AUTHORITY["EPSG","8901"]],UNIT["degree",0.0174532925199433,'
+    'AUTHORITY["EPSG","9122"]],AUTHORITY["EPSG","4326"]]'
+)
+
+# The file is freshly created and rebuilt from scratch on every run, so
+# durability is not needed while it is being filled
+_GPKG_BULK_LOAD_PRAGMAS = """
+PRAGMA synchronous = OFF;
+PRAGMA journal_mode = MEMORY;
+PRAGMA temp_store = MEMORY;
+"""
+
+# Core GeoPackage 1.2 metadata tables and the three mandatory SRS rows
+_GPKG_SCHEMA_SQL = f"""
+PRAGMA application_id = 1196444487;
+PRAGMA user_version = 10200;
+CREATE TABLE gpkg_spatial_ref_sys (
+    srs_name TEXT NOT NULL, srs_id INTEGER PRIMARY KEY,
+    organization TEXT NOT NULL, organization_coordsys_id INTEGER NOT NULL,
+    definition TEXT NOT NULL, description TEXT
+);
+CREATE TABLE gpkg_contents (
+    table_name TEXT NOT NULL PRIMARY KEY, data_type TEXT NOT NULL,
+    identifier TEXT UNIQUE, description TEXT DEFAULT '',
+    last_change DATETIME NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now')),
+    min_x DOUBLE, min_y DOUBLE, max_x DOUBLE, max_y DOUBLE,
+    srs_id INTEGER REFERENCES gpkg_spatial_ref_sys(srs_id)
+);
+CREATE TABLE gpkg_geometry_columns (
+    table_name TEXT NOT NULL UNIQUE REFERENCES gpkg_contents(table_name),
+    column_name TEXT NOT NULL, geometry_type_name TEXT NOT NULL,
+    srs_id INTEGER NOT NULL REFERENCES gpkg_spatial_ref_sys(srs_id),
+    z TINYINT NOT NULL, m TINYINT NOT NULL,
+    PRIMARY KEY (table_name, column_name)
+);
+CREATE TABLE gpkg_extensions (
+    table_name TEXT, column_name TEXT, extension_name TEXT NOT NULL,
+    definition TEXT NOT NULL, scope TEXT NOT NULL,
+    UNIQUE (table_name, column_name, extension_name)
+);
+INSERT INTO gpkg_spatial_ref_sys VALUES
+    ('Undefined cartesian SRS', -1, 'NONE', -1, 'undefined',
+     'undefined cartesian coordinate reference system'),
+    ('Undefined geographic SRS', 0, 'NONE', 0, 'undefined',
+     'undefined geographic coordinate reference system'),
+    ('WGS 84 geodetic', 4326, 'EPSG', 4326, '{_WGS84_WKT}',
+     'longitude/latitude coordinates in decimal degrees on the WGS 84 spheroid');
+"""
+
+# Spatial index maintenance triggers from the gpkg_rtree_index extension.
+# They are only installed after the bulk insert, so loading never fires them.
+_GPKG_RTREE_TRIGGERS_SQL = """
+CREATE TRIGGER rtree_{t}_geom_insert AFTER INSERT ON {t}
+WHEN (new.geom NOT NULL AND NOT ST_IsEmpty(NEW.geom))
+BEGIN
+    INSERT OR REPLACE INTO rtree_{t}_geom VALUES (NEW.fid,
+        ST_MinX(NEW.geom), ST_MaxX(NEW.geom), ST_MinY(NEW.geom), ST_MaxY(NEW.geom));
+END;
+CREATE TRIGGER rtree_{t}_geom_update1 AFTER UPDATE OF geom ON {t}
+WHEN OLD.fid = NEW.fid AND (NEW.geom NOTNULL AND NOT ST_IsEmpty(NEW.geom))
+BEGIN
+    INSERT OR REPLACE INTO rtree_{t}_geom VALUES (NEW.fid,
+        ST_MinX(NEW.geom), ST_MaxX(NEW.geom), ST_MinY(NEW.geom), ST_MaxY(NEW.geom));
+END;
+CREATE TRIGGER rtree_{t}_geom_update2 AFTER UPDATE OF geom ON {t}
+WHEN OLD.fid = NEW.fid AND (NEW.geom ISNULL OR ST_IsEmpty(NEW.geom))
+BEGIN
+    DELETE FROM rtree_{t}_geom WHERE id = OLD.fid;
+END;
+CREATE TRIGGER rtree_{t}_geom_update3 AFTER UPDATE ON {t}
+WHEN OLD.fid != NEW.fid AND (NEW.geom NOTNULL AND NOT ST_IsEmpty(NEW.geom))
+BEGIN
+    DELETE FROM rtree_{t}_geom WHERE id = OLD.fid;
+    INSERT OR REPLACE INTO rtree_{t}_geom VALUES (NEW.fid,
+        ST_MinX(NEW.geom), ST_MaxX(NEW.geom), ST_MinY(NEW.geom), ST_MaxY(NEW.geom));
+END;
+CREATE TRIGGER rtree_{t}_geom_update4 AFTER UPDATE ON {t}
+WHEN OLD.fid != NEW.fid AND (NEW.geom ISNULL OR ST_IsEmpty(NEW.geom))
+BEGIN
+    DELETE FROM rtree_{t}_geom WHERE id IN (OLD.fid, NEW.fid);
+END;
+CREATE TRIGGER rtree_{t}_geom_delete AFTER DELETE ON {t}
+WHEN old.geom NOT NULL
+BEGIN
+    DELETE FROM rtree_{t}_geom WHERE id = OLD.fid;
+END;
+"""
+
+
+def gpkg_geometry_blob(wkb: bytes, srs_id: int, envelope) -> bytes:
+    """
+    Wrap little-endian WKB in a GeoPackage geometry header.
+    
+    Header layout: magic "GP", version 0, flags (little-endian, XY envelope),
+    srs_id, then the envelope as minx, maxx, miny, maxy.
+    """
+    return struct.pack("<2sBBi4d", b"GP", 0, 0x03, srs_id, *envelope) + wkb
+
+
+def write_gpkg_layer(output_path: str, fields, geometry_type, crs, features) -> str:
+    """
+    Write features to a new single-layer GeoPackage with sqlite3.
+    
+    The GeoPackage metadata tables, feature rows and RTree entries are
+    written directly in one transaction; the RTree triggers are added
+    after the rows so the bulk insert never fires them.
+    
+    Returns:
+        str: output_path on success, None on failure
+    """
+    table = os.path.splitext(os.path.basename(output_path))[0]
+    geometry_name = QgsWkbTypes.displayString(geometry_type).upper()
+    srs_id = crs.postgisSrid()
+    organization, _, coordsys_id = crs.authid().partition(":")
+    if srs_id <= 0 or not organization or not coordsys_id.isdigit():
+        # A custom CRS has no authority code to register, and an SRID of 0
+        # would silently tag the layer as the undefined geographic SRS
+        _log(f"Error writing {os.path.basename(output_path)}: "
+             f"CRS '{crs.authid() or crs.description()}' has no numeric authority code")
+        return None
+    
+    columns = []
+    for field in fields:
+        sql_type = _GPKG_FIELD_TYPES[field.type()]
+        if sql_type == "TEXT" and field.length() > 0:
+            sql_type = f"TEXT({field.length()})"
+        columns.append(f'"{field.name()}" {sql_type}')
+    
+    rows = []
+    envelopes = []
+    for fid, feat in enumerate(features, start=1):
+        bbox = feat.geometry().boundingBox()
+        envelope = (bbox.xMinimum(), bbox.xMaximum(), bbox.yMinimum(), bbox.yMaximum())
+        wkb = bytes(feat.geometry().asWkb())
+        rows.append((fid, gpkg_geometry_blob(wkb, srs_id, envelope), *feat.attributes()))
+        envelopes.append((fid, *envelope))
+    
+    if os.path.exists(output_path):
+        os.remove(output_path)
+    
+    try:
+        # Close the handle deterministically, even on error, so the layer can
+        # be reopened by QGIS straight away (and deleted again on Windows)
+        with closing(sqlite3.connect(output_path, isolation_level=None)) as conn:
+            conn.executescript(_GPKG_BULK_LOAD_PRAGMAS)
+            conn.executescript(_GPKG_SCHEMA_SQL)
+            conn.execute("BEGIN")
+            if srs_id != 4326:
+                conn.execute(
+                    "INSERT INTO gpkg_spatial_ref_sys VALUES (?, ?, ?, ?, ?, ?)",
+                    (crs.description(), srs_id, organization.upper(), int(coordsys_id),
+                     crs.toWkt(), crs.description())
+                )
+            conn.execute(
+                f'CREATE TABLE "{table}" (fid INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL, '
+                f'geom {geometry_name}, {", ".join(columns)})'
+            )
+            placeholders = ", ".join("?" * (len(fields) + 2))
+            conn.executemany(f'INSERT INTO "{table}" VALUES ({placeholders})', rows)
+            
+            min_x = min(e[1] for e in envelopes)
+            max_x = max(e[2] for e in envelopes)
+            min_y = min(e[3] for e in envelopes)
+            max_y = max(e[4] for e in envelopes)
+            conn.execute(
+                "INSERT INTO gpkg_contents (table_name, data_type, identifier, "
+                "min_x, min_y, max_x, max_y, srs_id) VALUES (?, 'features', ?, ?, ?, ?, ?, ?)",
+                (table, table, min_x, min_y, max_x, max_y, srs_id)
+            )
+            conn.execute(
+                "INSERT INTO gpkg_geometry_columns VALUES (?, 'geom', ?, ?, 0, 0)",
+                (table, geometry_name, srs_id)
+            )
+            
+            # Build the spatial index once, now that all rows are in
+            conn.execute(
+                f'CREATE VIRTUAL TABLE "rtree_{table}_geom" USING rtree(id, minx, maxx, miny, maxy)'
+            )
+            conn.executemany(f'INSERT INTO "rtree_{table}_geom" VALUES (?, ?, ?, ?, ?)', envelopes)
+            conn.execute(
+                "INSERT INTO gpkg_extensions VALUES (?, 'geom', 'gpkg_rtree_index', "
+                "'http://www.geopackage.org/spec120/#extension_rtree', 'write-only')",
+                (table,)
+            )
+            conn.execute("COMMIT")
+            conn.executescript(_GPKG_RTREE_TRIGGERS_SQL.format(t=table))
+    except sqlite3.Error as e:
+        _log(f"Error writing {os.path.basename(output_path)}: {e}")
+        return None
+    
+    return output_path
 
 
 def create_sample_data(output_folder: str = None):
@@ -37,41 +412,47 @@ def create_sample_data(output_folder: str = None):
     # Create output folder
     os.makedirs(output_folder, exist_ok=True)
     
-    print(f"Creating sample data in: {output_folder}")
-    print("=" * 60)
-    
-    # Coordinate Reference System (SC State Plane - feet)
-    # Change this to match your local CRS
-    crs = QgsCoordinateReferenceSystem("EPSG:2273")  # SC State Plane South (feet)
-    
-    created_files = {}
-    
-    # Create each layer
-    created_files['subbasins'] = create_subbasins_layer(output_folder, crs)
-    created_files['landuse'] = create_landuse_layer(output_folder, crs)
-    created_files['soils'] = create_soils_layer(output_folder, crs)
-    created_files['flowpaths'] = create_flowpaths_layer(output_folder, crs)
-    created_files['channels'] = create_channels_layer(output_folder, crs)
-    created_files['outlets'] = create_outlets_layer(output_folder, crs)
-    
-    print("=" * 60)
-    print("Sample data creation complete!")
-    print(f"\nFiles created in: {output_folder}")
-    print("\nTo load in QGIS:")
-    print("  Layer > Add Layer > Add Vector Layer")
-    print(f"  Browse to: {output_folder}")
+    _log(f"Creating sample data in: {output_folder}")
+    _log("=" * 60)
+    
+    layer_builders = {
+        'subbasins': create_subbasins_layer,
+        'landuse': create_landuse_layer,
+        'soils': create_soils_layer,
+        'flowpaths': create_flowpaths_layer,
+        'channels': create_channels_layer,
+        'outlets': create_outlets_layer,
+    }
+    
+    # Create each layer. Every layer goes to its own GeoPackage, so the
+    # writes can overlap; threads are used because the QGIS console cannot
+    # spawn worker processes. Each worker gets its own CRS instance.
+    with ThreadPoolExecutor(max_workers=len(layer_builders)) as executor:
+        futures = {
+            name: executor.submit(build, output_folder, QgsCoordinateReferenceSystem.fromWkt(_SAMPLE_CRS_WKT))
+            for name, build in layer_builders.items()
+        }
+    created_files = {name: future.result() for name, future in futures.items()}
+    
+    _log("=" * 60)
+    _log("Sample data creation complete!")
+    _log(f"\nFiles created in: {output_folder}")
+    _log("\nTo load in QGIS:")
+    _log("  Layer > Add Layer > Add Vector Layer")
+    _log(f"  Browse to: {output_folder}")
     
     # Optionally add to current QGIS project
     add_to_project = True
     if add_to_project:
-        print("\nAdding layers to current QGIS project...")
+        _log("\nAdding layers to current QGIS project...")
         for name, path in created_files.items():
-            if path and os.path.exists(path):
+            if path is not None:
                 layer = QgsVectorLayer(path, f"Sample_{name}", "ogr")
                 if layer.isValid():
                     QgsProject.instance().addMapLayer(layer)
-                    print(f"  Added: Sample_{name}")
+                    _log(f"  Added: Sample_{name}")
     
+    _flush_log()
     return created_files
 
 
@@ -80,33 +461,17 @@ def create_subbasins_layer(output_folder: str, crs) -> str:
     
     output_path = os.path.join(output_folder, "sample_subbasins.gpkg")
     
-    # Define fields
-    fields = QgsFields()
-    fields.append(QgsField("Subbasin_ID", QVariant.String, len=20))
-    fields.append(QgsField("Name", QVariant.String, len=50))
-    fields.append(QgsField("Area_Acres", QVariant.Double, len=10, prec=2))
-    fields.append(QgsField("Slope_Pct", QVariant.Double, len=6, prec=2))
-    fields.append(QgsField("Tc_min", QVariant.Double, len=8, prec=1))
-    fields.append(QgsField("CN", QVariant.Int))
-    fields.append(QgsField("C_Value", QVariant.Double, len=4, prec=2))
-    fields.append(QgsField("Description", QVariant.String, len=100))
-    
-    # Create layer
-    writer = QgsVectorFileWriter(
-        output_path, "UTF-8", fields, QgsWkbTypes.Polygon, crs, "GPKG"
-    )
+    fields = _FIELDS_CACHE["subbasins"]
     
-    # Sample subbasin polygons (coordinates in feet, SC State Plane)
-    # Base point around 2,100,000 E, 100,000 N (approximate Lowcountry SC)
-    base_x, base_y = 2100000, 100000
+    # Sample subbasin polygons (feet, relative to _SAMPLE_ORIGIN)
     
     subbasins_data = [
         {
             "id": "SB-001", "name": "North Residential",
             "coords": [
-                (base_x, base_y + 3000), (base_x + 2000, base_y + 3000),
-                (base_x + 2500, base_y + 2000), (base_x + 2000, base_y + 1500),
-                (base_x, base_y + 1500), (base_x, base_y + 3000)
+                (0, 3000), (2000, 3000),
+                (2500, 2000), (2000, 1500),
+                (0, 1500), (0, 3000)
             ],
             "area": 16.5, "slope": 3.2, "tc": 18.5, "cn": 75, "c": 0.42,
             "desc": "Single family residential - 1/4 acre lots"
@@ -114,9 +479,9 @@ def create_subbasins_layer(output_folder: str, crs) -> str:
         {
             "id": "SB-002", "name": "Commercial Center",
             "coords": [
-                (base_x + 2000, base_y + 3000), (base_x + 4000, base_y + 3000),
-                (base_x + 4000, base_y + 1500), (base_x + 2500, base_y + 2000),
-                (base_x + 2000, base_y + 3000)
+                (2000, 3000), (4000, 3000),
+                (4000, 1500), (2500, 2000),
+                (2000, 3000)
             ],
             "area": 13.3, "slope": 1.5, "tc": 12.0, "cn": 92, "c": 0.78,
             "desc": "Strip mall and retail with parking"
@@ -124,10 +489,10 @@ def create_subbasins_layer(output_folder: str, crs) -> str:
         {
             "id": "SB-003", "name": "South Woods",
             "coords": [
-                (base_x, base_y + 1500), (base_x + 2000, base_y + 1500),
-                (base_x + 2500, base_y + 2000), (base_x + 4000, base_y + 1500),
-                (base_x + 4000, base_y), (base_x + 2000, base_y),
-                (base_x, base_y + 500), (base_x, base_y + 1500)
+                (0, 1500), (2000, 1500),
+                (2500, 2000), (4000, 1500),
+                (4000, 0), (2000, 0),
+                (0, 500), (0, 1500)
             ],
             "area": 60.8, "slope": 8.5, "tc": 35.0, "cn": 55, "c": 0.12,
             "desc": "Undeveloped forested area with wetlands"
@@ -135,9 +500,9 @@ def create_subbasins_layer(output_folder: str, crs) -> str:
         {
             "id": "SB-004", "name": "Industrial Park",
             "coords": [
-                (base_x + 4000, base_y + 3000), (base_x + 6000, base_y + 3000),
-                (base_x + 6000, base_y + 1500), (base_x + 4000, base_y + 1500),
-                (base_x + 4000, base_y + 3000)
+                (4000, 3000), (6000, 3000),
+                (6000, 1500), (4000, 1500),
+                (4000, 3000)
             ],
             "area": 23.6, "slope": 2.1, "tc": 15.0, "cn": 88, "c": 0.68,
             "desc": "Light industrial warehouse district"
@@ -145,27 +510,30 @@ def create_subbasins_layer(output_folder: str, crs) -> str:
         {
             "id": "SB-005", "name": "East Farms",
             "coords": [
-                (base_x + 4000, base_y + 1500), (base_x + 6000, base_y + 1500),
-                (base_x + 6000, base_y), (base_x + 4000, base_y),
-                (base_x + 4000, base_y + 1500)
+                (4000, 1500), (6000, 1500),
+                (6000, 0), (4000, 0),
+                (4000, 1500)
             ],
             "area": 110.5, "slope": 4.5, "tc": 42.0, "cn": 74, "c": 0.35,
             "desc": "Cultivated farmland - row crops"
         },
     ]
     
-    for sb in subbasins_data:
+    text, numeric, coords, offsets = _split_records(
+        subbasins_data, ("id", "name", "desc"), ("area", "slope", "tc", "cn", "c")
+    )
+    features = []
+    for i in range(len(subbasins_data)):
         feat = QgsFeature()
-        points = [QgsPointXY(x, y) for x, y in sb["coords"]]
-        feat.setGeometry(QgsGeometry.fromPolygonXY([points]))
-        feat.setAttributes([
-            sb["id"], sb["name"], sb["area"], sb["slope"],
-            sb["tc"], sb["cn"], sb["c"], sb["desc"]
-        ])
-        writer.addFeature(feat)
-    
-    del writer
-    print(f"Created: sample_subbasins.gpkg ({len(subbasins_data)} features)")
+        feat.setGeometry(polygon_geometry(coords[offsets[i]:offsets[i + 1]]))
+        sb_id, name, desc = text[i]
+        area, slope, tc, cn, c = numeric[i].tolist()
+        feat.setAttributes([sb_id, name, area, slope, tc, int(cn), c, desc])
+        features.append(feat)
+    
+    if write_gpkg_layer(output_path, fields, QgsWkbTypes.Polygon, crs, features) is None:
+        return None
+    _log(f"Created: sample_subbasins.gpkg ({len(features)} features)")
     return output_path
 
 
@@ -174,18 +542,7 @@ def create_landuse_layer(output_folder: str, crs) -> str:
     
     output_path = os.path.join(output_folder, "sample_landuse.gpkg")
     
-    # Define fields
-    fields = QgsFields()
-    fields.append(QgsField("LU_ID", QVariant.Int))
-    fields.append(QgsField("Land_Use", QVariant.String, len=30))
-    fields.append(QgsField("Description", QVariant.String, len=100))
-    fields.append(QgsField("Imperv_Pct", QVariant.Double, len=5, prec=1))
-    
-    writer = QgsVectorFileWriter(
-        output_path, "UTF-8", fields, QgsWkbTypes.Polygon, crs, "GPKG"
-    )
-    
-    base_x, base_y = 2100000, 100000
+    fields = _FIELDS_CACHE["landuse"]
     
     # Land use polygons that overlap subbasins
     landuse_data = [
@@ -193,103 +550,109 @@ def create_landuse_layer(output_folder: str, crs) -> str:
         {
             "id": 1, "lu": "RES_1_4_AC", "desc": "Residential 1/4 acre lots", "imperv": 38.0,
             "coords": [
-                (base_x, base_y + 3000), (base_x + 1800, base_y + 3000),
-                (base_x + 1800, base_y + 1600), (base_x, base_y + 1600),
-                (base_x, base_y + 3000)
+                (0, 3000), (1800, 3000),
+                (1800, 1600), (0, 1600),
+                (0, 3000)
             ]
         },
         # Streets in residential
         {
             "id": 2, "lu": "STREETS_PAVED", "desc": "Paved streets with curbs", "imperv": 100.0,
             "coords": [
-                (base_x + 800, base_y + 3000), (base_x + 1000, base_y + 3000),
-                (base_x + 1000, base_y + 1600), (base_x + 800, base_y + 1600),
-                (base_x + 800, base_y + 3000)
+                (800, 3000), (1000, 3000),
+                (1000, 1600), (800, 1600),
+                (800, 3000)
             ]
         },
         # Open space in residential
         {
             "id": 3, "lu": "OPEN_SPACE_GOOD", "desc": "Park/common area", "imperv": 5.0,
             "coords": [
-                (base_x + 1800, base_y + 2800), (base_x + 2400, base_y + 2200),
-                (base_x + 2000, base_y + 1600), (base_x + 1800, base_y + 1600),
-                (base_x + 1800, base_y + 2800)
+                (1800, 2800), (2400, 2200),
+                (2000, 1600), (1800, 1600),
+                (1800, 2800)
             ]
         },
         # Commercial buildings
         {
             "id": 4, "lu": "COMMERCIAL", "desc": "Strip mall retail", "imperv": 85.0,
             "coords": [
-                (base_x + 2400, base_y + 3000), (base_x + 3800, base_y + 3000),
-                (base_x + 3800, base_y + 2200), (base_x + 2400, base_y + 2200),
-                (base_x + 2400, base_y + 3000)
+                (2400, 3000), (3800, 3000),
+                (3800, 2200), (2400, 2200),
+                (2400, 3000)
             ]
         },
         # Commercial parking
         {
             "id": 5, "lu": "PARKING_PAVED", "desc": "Paved parking lots", "imperv": 100.0,
             "coords": [
-                (base_x + 2400, base_y + 2200), (base_x + 3800, base_y + 2200),
-                (base_x + 3800, base_y + 1600), (base_x + 2600, base_y + 2000),
-                (base_x + 2400, base_y + 2200)
+                (2400, 2200), (3800, 2200),
+                (3800, 1600), (2600, 2000),
+                (2400, 2200)
             ]
         },
         # Woods - good condition
         {
             "id": 6, "lu": "WOODS_GOOD", "desc": "Undeveloped forest", "imperv": 0.0,
             "coords": [
-                (base_x, base_y + 1600), (base_x + 1500, base_y + 1600),
-                (base_x + 2000, base_y + 800), (base_x + 2000, base_y),
-                (base_x, base_y + 500), (base_x, base_y + 1600)
+                (0, 1600), (1500, 1600),
+                (2000, 800), (2000, 0),
+                (0, 500), (0, 1600)
             ]
         },
         # Wetland
         {
             "id": 7, "lu": "WETLAND", "desc": "Riparian wetland", "imperv": 0.0,
             "coords": [
-                (base_x + 1500, base_y + 1600), (base_x + 2600, base_y + 2000),
-                (base_x + 3800, base_y + 1600), (base_x + 3800, base_y + 800),
-                (base_x + 2000, base_y + 800), (base_x + 1500, base_y + 1600)
+                (1500, 1600), (2600, 2000),
+                (3800, 1600), (3800, 800),
+                (2000, 800), (1500, 1600)
             ]
         },
         # Industrial
         {
             "id": 8, "lu": "INDUSTRIAL", "desc": "Light industrial", "imperv": 72.0,
             "coords": [
-                (base_x + 4000, base_y + 3000), (base_x + 5800, base_y + 3000),
-                (base_x + 5800, base_y + 1600), (base_x + 4000, base_y + 1600),
-                (base_x + 4000, base_y + 3000)
+                (4000, 3000), (5800, 3000),
+                (5800, 1600), (4000, 1600),
+                (4000, 3000)
             ]
         },
         # Row crops
         {
             "id": 9, "lu": "ROW_CROP_GOOD_SR", "desc": "Row crops - corn/soybeans", "imperv": 0.0,
             "coords": [
-                (base_x + 4000, base_y + 1600), (base_x + 5800, base_y + 1600),
-                (base_x + 5800, base_y + 400), (base_x + 4000, base_y + 400),
-                (base_x + 4000, base_y + 1600)
+                (4000, 1600), (5800, 1600),
+                (5800, 400), (4000, 400),
+                (4000, 1600)
             ]
         },
         # Pasture
         {
             "id": 10, "lu": "PASTURE_GOOD", "desc": "Grazing pasture", "imperv": 0.0,
             "coords": [
-                (base_x + 4000, base_y + 400), (base_x + 5800, base_y + 400),
-                (base_x + 5800, base_y), (base_x + 4000, base_y),
-                (base_x + 4000, base_y + 400)
+                (4000, 400), (5800, 400),
+                (5800, 0), (4000, 0),
+                (4000, 400)
             ]
         },
     ]
     
-    for lu in landuse_data:
+    text, numeric, coords, offsets = _split_records(
+        landuse_data, ("lu", "desc"), ("id", "imperv")
+    )
+    features = []
+    for i in range(len(landuse_data)):
         feat = QgsFeature()
-        points = [QgsPointXY(x, y) for x, y in lu["coords"]]
-        feat.setGeometry(QgsGeometry.fromPolygonXY([points]))
-        feat.setAttributes([lu["id"], lu["lu"], lu["desc"], lu["imperv"]])
-        writer.addFeature(feat)
-    
-    del writer
-    print(f"Created: sample_landuse.gpkg ({len(landuse_data)} features)")
+        feat.setGeometry(polygon_geometry(coords[offsets[i]:offsets[i + 1]]))
+        lu, desc = text[i]
+        lu_id, imperv = numeric[i].tolist()
+        feat.setAttributes([int(lu_id), lu, desc, imperv])
+        features.append(feat)
+    
+    if write_gpkg_layer(output_path, fields, QgsWkbTypes.Polygon, crs, features) is None:
+        return None
+    _log(f"Created: sample_landuse.gpkg ({len(features)} features)")
     return output_path
 
 
@@ -298,20 +661,7 @@ def create_soils_layer(output_folder: str, crs) -> str:
     
     output_path = os.path.join(output_folder, "sample_soils.gpkg")
     
-    # Define fields (similar to SSURGO format)
-    fields = QgsFields()
-    fields.append(QgsField("MUKEY", QVariant.String, len=20))
-    fields.append(QgsField("MUSYM", QVariant.String, len=10))
-    fields.append(QgsField("MUNAME", QVariant.String, len=100))
-    fields.append(QgsField("HSG", QVariant.String, len=5))
-    fields.append(QgsField("Hydric_Pct", QVariant.Int))
-    fields.append(QgsField("Ksat_um_s", QVariant.Double, len=8, prec=2))
-    
-    writer = QgsVectorFileWriter(
-        output_path, "UTF-8", fields, QgsWkbTypes.Polygon, crs, "GPKG"
-    )
-    
-    base_x, base_y = 2100000, 100000
+    fields = _FIELDS_CACHE["soils"]
     
     soils_data = [
         # Well-drained sandy loam (HSG A)
@@ -319,9 +669,9 @@ def create_soils_layer(output_folder: str, crs) -> str:
             "mukey": "123456", "musym": "LaB", "muname": "Lakeland sand, 0-6% slopes",
             "hsg": "A", "hydric": 0, "ksat": 42.0,
             "coords": [
-                (base_x, base_y + 3000), (base_x + 2000, base_y + 3000),
-                (base_x + 2000, base_y + 2000), (base_x, base_y + 2000),
-                (base_x, base_y + 3000)
+                (0, 3000), (2000, 3000),
+                (2000, 2000), (0, 2000),
+                (0, 3000)
             ]
         },
         # Moderately well-drained loam (HSG B)
@@ -329,9 +679,9 @@ def create_soils_layer(output_folder: str, crs) -> str:
             "mukey": "234567", "musym": "NoB", "muname": "Norfolk loamy sand, 2-6% slopes",
             "hsg": "B", "hydric": 0, "ksat": 14.0,
             "coords": [
-                (base_x + 2000, base_y + 3000), (base_x + 6000, base_y + 3000),
-                (base_x + 6000, base_y + 2000), (base_x + 2000, base_y + 2000),
-                (base_x + 2000, base_y + 3000)
+                (2000, 3000), (6000, 3000),
+                (6000, 2000), (2000, 2000),
+                (2000, 3000)
             ]
         },
         # Somewhat poorly drained (HSG C)
@@ -339,9 +689,9 @@ def create_soils_layer(output_folder: str, crs) -> str:
             "mukey": "345678", "musym": "GoA", "muname": "Goldsboro sandy loam, 0-2% slopes",
             "hsg": "C", "hydric": 15, "ksat": 4.0,
             "coords": [
-                (base_x, base_y + 2000), (base_x + 3000, base_y + 2000),
-                (base_x + 3000, base_y + 1000), (base_x, base_y + 1000),
-                (base_x, base_y + 2000)
+                (0, 2000), (3000, 2000),
+                (3000, 1000), (0, 1000),
+                (0, 2000)
             ]
         },
         # Poorly drained clay (HSG D)
@@ -349,9 +699,9 @@ def create_soils_layer(output_folder: str, crs) -> str:
             "mukey": "456789", "musym": "Ly", "muname": "Lynn Haven fine sand",
             "hsg": "D", "hydric": 85, "ksat": 1.0,
             "coords": [
-                (base_x + 3000, base_y + 2000), (base_x + 6000, base_y + 2000),
-                (base_x + 6000, base_y + 1000), (base_x + 3000, base_y + 1000),
-                (base_x + 3000, base_y + 2000)
+                (3000, 2000), (6000, 2000),
+                (6000, 1000), (3000, 1000),
+                (3000, 2000)
             ]
         },
         # Dual HSG (B/D) - coastal plain
@@ -359,9 +709,9 @@ def create_soils_layer(output_folder: str, crs) -> str:
             "mukey": "567890", "musym": "BaA", "muname": "Bayboro mucky loam",
             "hsg": "B/D", "hydric": 95, "ksat": 10.0,
             "coords": [
-                (base_x, base_y + 1000), (base_x + 3000, base_y + 1000),
-                (base_x + 3000, base_y), (base_x, base_y),
-                (base_x, base_y + 1000)
+                (0, 1000), (3000, 1000),
+                (3000, 0), (0, 0),
+                (0, 1000)
             ]
         },
         # Dual HSG (A/D) - sandy with high water table
@@ -369,25 +719,27 @@ def create_soils_layer(output_folder: str, crs) -> str:
             "mukey": "678901", "musym": "MuA", "muname": "Mulat fine sand",
             "hsg": "A/D", "hydric": 80, "ksat": 35.0,
             "coords": [
-                (base_x + 3000, base_y + 1000), (base_x + 6000, base_y + 1000),
-                (base_x + 6000, base_y), (base_x + 3000, base_y),
-                (base_x + 3000, base_y + 1000)
+                (3000, 1000), (6000, 1000),
+                (6000, 0), (3000, 0),
+                (3000, 1000)
             ]
         },
     ]
     
-    for soil in soils_data:
+    text, numeric, coords, offsets = _split_records(
+        soils_data, ("mukey", "musym", "muname", "hsg"), ("hydric", "ksat")
+    )
+    features = []
+    for i in range(len(soils_data)):
         feat = QgsFeature()
-        points = [QgsPointXY(x, y) for x, y in soil["coords"]]
-        feat.setGeometry(QgsGeometry.fromPolygonXY([points]))
-        feat.setAttributes([
-            soil["mukey"], soil["musym"], soil["muname"],
-            soil["hsg"], soil["hydric"], soil["ksat"]
-        ])
-        writer.addFeature(feat)
-    
-    del writer
-    print(f"Created: sample_soils.gpkg ({len(soils_data)} features)")
+        feat.setGeometry(polygon_geometry(coords[offsets[i]:offsets[i + 1]]))
+        hydric, ksat = numeric[i].tolist()
+        feat.setAttributes([*text[i], int(hydric), ksat])
+        features.append(feat)
+    
+    if write_gpkg_layer(output_path, fields, QgsWkbTypes.Polygon, crs, features) is None:
+        return None
+    _log(f"Created: sample_soils.gpkg ({len(features)} features)")
     return output_path
 
 
@@ -396,22 +748,7 @@ def create_flowpaths_layer(output_folder: str, crs) -> str:
     
     output_path = os.path.join(output_folder, "sample_flowpaths.gpkg")
     
-    # Define fields
-    fields = QgsFields()
-    fields.append(QgsField("FP_ID", QVariant.String, len=20))
-    fields.append(QgsField("Subbasin_ID", QVariant.String, len=20))
-    fields.append(QgsField("Segment", QVariant.Int))
-    fields.append(QgsField("Flow_Type", QVariant.String, len=20))
-    fields.append(QgsField("Length_ft", QVariant.Double, len=10, prec=1))
-    fields.append(QgsField("Slope_Pct", QVariant.Double, len=6, prec=2))
-    fields.append(QgsField("Mannings_n", QVariant.Double, len=6, prec=3))
-    fields.append(QgsField("Description", QVariant.String, len=100))
-    
-    writer = QgsVectorFileWriter(
-        output_path, "UTF-8", fields, QgsWkbTypes.LineString, crs, "GPKG"
-    )
-    
-    base_x, base_y = 2100000, 100000
+    fields = _FIELDS_CACHE["flowpaths"]
     
     flowpaths_data = [
         # SB-001: Residential - Sheet flow to shallow concentrated to channel
@@ -419,72 +756,75 @@ def create_flowpaths_layer(output_folder: str, crs) -> str:
             "fp_id": "FP-001-1", "sb_id": "SB-001", "seg": 1,
             "type": "SHEET", "length": 100, "slope": 2.0, "n": 0.24,
             "desc": "Sheet flow over lawn",
-            "coords": [(base_x + 500, base_y + 2800), (base_x + 600, base_y + 2750)]
+            "coords": [(500, 2800), (600, 2750)]
         },
         {
             "fp_id": "FP-001-2", "sb_id": "SB-001", "seg": 2,
             "type": "SHALLOW_CONC", "length": 800, "slope": 3.0, "n": 0.05,
             "desc": "Shallow concentrated - paved",
-            "coords": [(base_x + 600, base_y + 2750), (base_x + 1200, base_y + 2200)]
+            "coords": [(600, 2750), (1200, 2200)]
         },
         {
             "fp_id": "FP-001-3", "sb_id": "SB-001", "seg": 3,
             "type": "CHANNEL", "length": 1200, "slope": 1.5, "n": 0.035,
             "desc": "Grass channel to outfall",
-            "coords": [(base_x + 1200, base_y + 2200), (base_x + 2000, base_y + 1600)]
+            "coords": [(1200, 2200), (2000, 1600)]
         },
         # SB-002: Commercial - mostly impervious
         {
             "fp_id": "FP-002-1", "sb_id": "SB-002", "seg": 1,
             "type": "SHEET", "length": 50, "slope": 1.0, "n": 0.011,
             "desc": "Sheet flow over parking",
-            "coords": [(base_x + 3000, base_y + 2800), (base_x + 3050, base_y + 2770)]
+            "coords": [(3000, 2800), (3050, 2770)]
         },
         {
             "fp_id": "FP-002-2", "sb_id": "SB-002", "seg": 2,
             "type": "SHALLOW_CONC", "length": 600, "slope": 1.5, "n": 0.013,
             "desc": "Gutter flow",
-            "coords": [(base_x + 3050, base_y + 2770), (base_x + 3200, base_y + 2000)]
+            "coords": [(3050, 2770), (3200, 2000)]
         },
         {
             "fp_id": "FP-002-3", "sb_id": "SB-002", "seg": 3,
             "type": "PIPE", "length": 400, "slope": 0.8, "n": 0.013,
             "desc": "Storm pipe to outfall",
-            "coords": [(base_x + 3200, base_y + 2000), (base_x + 3000, base_y + 1600)]
+            "coords": [(3200, 2000), (3000, 1600)]
         },
         # SB-003: Woods - natural flow path
         {
             "fp_id": "FP-003-1", "sb_id": "SB-003", "seg": 1,
             "type": "SHEET", "length": 100, "slope": 8.0, "n": 0.80,
             "desc": "Sheet flow through forest litter",
-            "coords": [(base_x + 500, base_y + 1200), (base_x + 550, base_y + 1150)]
+            "coords": [(500, 1200), (550, 1150)]
         },
         {
             "fp_id": "FP-003-2", "sb_id": "SB-003", "seg": 2,
             "type": "SHALLOW_CONC", "length": 1500, "slope": 6.0, "n": 0.15,
             "desc": "Natural swale through woods",
-            "coords": [(base_x + 550, base_y + 1150), (base_x + 1500, base_y + 600)]
+            "coords": [(550, 1150), (1500, 600)]
         },
         {
             "fp_id": "FP-003-3", "sb_id": "SB-003", "seg": 3,
             "type": "CHANNEL", "length": 2000, "slope": 2.0, "n": 0.045,
             "desc": "Natural stream channel",
-            "coords": [(base_x + 1500, base_y + 600), (base_x + 3000, base_y + 200)]
+            "coords": [(1500, 600), (3000, 200)]
         },
     ]
     
-    for fp in flowpaths_data:
+    text, numeric, coords, offsets = _split_records(
+        flowpaths_data, ("fp_id", "sb_id", "type", "desc"), ("seg", "length", "slope", "n")
+    )
+    features = []
+    for i in range(len(flowpaths_data)):
         feat = QgsFeature()
-        points = [QgsPointXY(x, y) for x, y in fp["coords"]]
-        feat.setGeometry(QgsGeometry.fromPolylineXY(points))
-        feat.setAttributes([
-            fp["fp_id"], fp["sb_id"], fp["seg"], fp["type"],
-            fp["length"], fp["slope"], fp["n"], fp["desc"]
-        ])
-        writer.addFeature(feat)
-    
-    del writer
-    print(f"Created: sample_flowpaths.gpkg ({len(flowpaths_data)} features)")
+        feat.setGeometry(line_geometry(coords[offsets[i]:offsets[i + 1]]))
+        fp_id, sb_id, flow_type, desc = text[i]
+        seg, length, slope, n = numeric[i].tolist()
+        feat.setAttributes([fp_id, sb_id, int(seg), flow_type, length, slope, n, desc])
+        features.append(feat)
+    
+    if write_gpkg_layer(output_path, fields, QgsWkbTypes.LineString, crs, features) is None:
+        return None
+    _log(f"Created: sample_flowpaths.gpkg ({len(features)} features)")
     return output_path
 
 
@@ -493,23 +833,7 @@ def create_channels_layer(output_folder: str, crs) -> str:
     
     output_path = os.path.join(output_folder, "sample_channels.gpkg")
     
-    # Define fields
-    fields = QgsFields()
-    fields.append(QgsField("Channel_ID", QVariant.String, len=20))
-    fields.append(QgsField("Name", QVariant.String, len=50))
-    fields.append(QgsField("Bottom_W_ft", QVariant.Double, len=8, prec=2))
-    fields.append(QgsField("Side_Slope", QVariant.Double, len=6, prec=2))
-    fields.append(QgsField("Depth_ft", QVariant.Double, len=6, prec=2))
-    fields.append(QgsField("Mannings_n", QVariant.Double, len=6, prec=3))
-    fields.append(QgsField("Slope_ftft", QVariant.Double, len=8, prec=5))
-    fields.append(QgsField("Lining", QVariant.String, len=30))
-    fields.append(QgsField("Q_Design_cfs", QVariant.Double, len=10, prec=2))
-    
-    writer = QgsVectorFileWriter(
-        output_path, "UTF-8", fields, QgsWkbTypes.LineString, crs, "GPKG"
-    )
-    
-    base_x, base_y = 2100000, 100000
+    fields = _FIELDS_CACHE["channels"]
     
     channels_data = [
         {
@@ -518,10 +842,10 @@ def create_channels_layer(output_folder: str, crs) -> str:
             "n": 0.035, "slope": 0.005, "lining": "Grass-lined",
             "q_design": 125.0,
             "coords": [
-                (base_x + 2000, base_y + 1600),
-                (base_x + 2500, base_y + 1200),
-                (base_x + 3000, base_y + 800),
-                (base_x + 3500, base_y + 400)
+                (2000, 1600),
+                (2500, 1200),
+                (3000, 800),
+                (3500, 400)
             ]
         },
         {
@@ -530,9 +854,9 @@ def create_channels_layer(output_folder: str, crs) -> str:
             "n": 0.030, "slope": 0.008, "lining": "Grass-lined",
             "q_design": 45.0,
             "coords": [
-                (base_x + 1200, base_y + 2200),
-                (base_x + 1600, base_y + 1900),
-                (base_x + 2000, base_y + 1600)
+                (1200, 2200),
+                (1600, 1900),
+                (2000, 1600)
             ]
         },
         {
@@ -541,9 +865,9 @@ def create_channels_layer(output_folder: str, crs) -> str:
             "n": 0.015, "slope": 0.010, "lining": "Concrete",
             "q_design": 85.0,
             "coords": [
-                (base_x + 3200, base_y + 2000),
-                (base_x + 3000, base_y + 1600),
-                (base_x + 2800, base_y + 1200)
+                (3200, 2000),
+                (3000, 1600),
+                (2800, 1200)
             ]
         },
         {
@@ -552,10 +876,10 @@ def create_channels_layer(output_folder: str, crs) -> str:
             "n": 0.040, "slope": 0.012, "lining": "Rip-rap",
             "q_design": 95.0,
             "coords": [
-                (base_x + 5000, base_y + 2500),
-                (base_x + 4800, base_y + 2000),
-                (base_x + 4500, base_y + 1500),
-                (base_x + 4200, base_y + 1000)
+                (5000, 2500),
+                (4800, 2000),
+                (4500, 1500),
+                (4200, 1000)
             ]
         },
         {
@@ -564,26 +888,30 @@ def create_channels_layer(output_folder: str, crs) -> str:
             "n": 0.045, "slope": 0.003, "lining": "Natural",
             "q_design": 200.0,
             "coords": [
-                (base_x + 3500, base_y + 400),
-                (base_x + 4000, base_y + 200),
-                (base_x + 4500, base_y + 100),
-                (base_x + 5500, base_y + 50)
+                (3500, 400),
+                (4000, 200),
+                (4500, 100),
+                (5500, 50)
             ]
         },
     ]
     
-    for ch in channels_data:
+    text, numeric, coords, offsets = _split_records(
+        channels_data, ("id", "name", "lining"),
+        ("bottom_w", "side_slope", "depth", "n", "slope", "q_design")
+    )
+    features = []
+    for i in range(len(channels_data)):
         feat = QgsFeature()
-        points = [QgsPointXY(x, y) for x, y in ch["coords"]]
-        feat.setGeometry(QgsGeometry.fromPolylineXY(points))
-        feat.setAttributes([
-            ch["id"], ch["name"], ch["bottom_w"], ch["side_slope"],
-            ch["depth"], ch["n"], ch["slope"], ch["lining"], ch["q_design"]
-        ])
-        writer.addFeature(feat)
-    
-    del writer
-    print(f"Created: sample_channels.gpkg ({len(channels_data)} features)")
+        feat.setGeometry(line_geometry(coords[offsets[i]:offsets[i + 1]]))
+        ch_id, name, lining = text[i]
+        bottom_w, side_slope, depth, n, slope, q_design = numeric[i].tolist()
+        feat.setAttributes([ch_id, name, bottom_w, side_slope, depth, n, slope, lining, q_design])
+        features.append(feat)
+    
+    if write_gpkg_layer(output_path, fields, QgsWkbTypes.LineString, crs, features) is None:
+        return None
+    _log(f"Created: sample_channels.gpkg ({len(features)} features)")
     return output_path
 
 
@@ -592,43 +920,36 @@ def create_outlets_layer(output_folder: str, crs) -> str:
     
     output_path = os.path.join(output_folder, "sample_outlets.gpkg")
     
-    # Define fields
-    fields = QgsFields()
-    fields.append(QgsField("Outlet_ID", QVariant.String, len=20))
-    fields.append(QgsField("Subbasin_ID", QVariant.String, len=20))
-    fields.append(QgsField("Name", QVariant.String, len=50))
-    fields.append(QgsField("Type", QVariant.String, len=20))
-    fields.append(QgsField("Invert_Elev", QVariant.Double, len=10, prec=2))
-    
-    writer = QgsVectorFileWriter(
-        output_path, "UTF-8", fields, QgsWkbTypes.Point, crs, "GPKG"
-    )
-    
-    base_x, base_y = 2100000, 100000
+    fields = _FIELDS_CACHE["outlets"]
     
     outlets_data = [
         {"id": "OUT-001", "sb_id": "SB-001", "name": "North Residential Outfall",
-         "type": "Channel", "elev": 28.5, "coords": (base_x + 2000, base_y + 1600)},
+         "type": "Channel", "elev": 28.5, "coords": (2000, 1600)},
         {"id": "OUT-002", "sb_id": "SB-002", "name": "Commercial Pipe Outfall",
-         "type": "Pipe", "elev": 26.0, "coords": (base_x + 3000, base_y + 1600)},
+         "type": "Pipe", "elev": 26.0, "coords": (3000, 1600)},
         {"id": "OUT-003", "sb_id": "SB-003", "name": "Woods Stream Confluence",
-         "type": "Natural", "elev": 18.0, "coords": (base_x + 3000, base_y + 200)},
+         "type": "Natural", "elev": 18.0, "coords": (3000, 200)},
         {"id": "OUT-004", "sb_id": "SB-004", "name": "Industrial Outfall",
-         "type": "Channel", "elev": 22.0, "coords": (base_x + 4200, base_y + 1000)},
+         "type": "Channel", "elev": 22.0, "coords": (4200, 1000)},
         {"id": "OUT-005", "sb_id": "SB-005", "name": "Farm Ditch Outlet",
-         "type": "Ditch", "elev": 15.0, "coords": (base_x + 5500, base_y + 50)},
+         "type": "Ditch", "elev": 15.0, "coords": (5500, 50)},
         {"id": "OUT-MAIN", "sb_id": "ALL", "name": "Main Watershed Outlet",
-         "type": "Stream", "elev": 12.0, "coords": (base_x + 5500, base_y + 50)},
+         "type": "Stream", "elev": 12.0, "coords": (5500, 50)},
     ]
     
-    for out in outlets_data:
+    text, numeric, coords, offsets = _split_records(
+        outlets_data, ("id", "sb_id", "name", "type"), ("elev",)
+    )
+    features = []
+    for i in range(len(outlets_data)):
         feat = QgsFeature()
-        feat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(*out["coords"])))
-        feat.setAttributes([out["id"], out["sb_id"], out["name"], out["type"], out["elev"]])
-        writer.addFeature(feat)
+        feat.setGeometry(point_geometry(*coords[i].tolist()))
+        feat.setAttributes([*text[i], *numeric[i].tolist()])
+        features.append(feat)
     
-    del writer
-    print(f"Created: sample_outlets.gpkg ({len(outlets_data)} features)")
+    if write_gpkg_layer(output_path, fields, QgsWkbTypes.Point, crs, features) is None:
+        return None
+    _log(f"Created: sample_outlets.gpkg ({len(features)} features)")
     return output_path
 
 
@@ -7,11 +7,88 @@ Repository: https://github.com/Joeywoody124/hydro-suite-standalone
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Callable, Any, Dict
+from typing import Optional, Tuple, Callable, Any, Dict, FrozenSet
 from qgis.PyQt.QtWidgets import QWidget
 from qgis.core import QgsVectorLayer, QgsProject
 
 
+# Field names per layer id as (ordered tuple, frozenset). Entries are dropped
+# when the layer's fields change or the layer is deleted.
+_field_name_cache: Dict[str, Tuple[Tuple[str, ...], FrozenSet[str]]] = {}
+_field_cache_watched = set()
+
+
+def _layer_field_names(layer: QgsVectorLayer) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+    """Return the cached (names, name set) pair for a layer"""
+    layer_id = layer.id()
+    entry = _field_name_cache.get(layer_id)
+    if entry is None:
+        fields = layer.fields()
+        try:
+            names = tuple(fields.names())
+        except AttributeError:  # QgsFields.names() is missing on older QGIS builds
+            names = tuple(field.name() for field in fields)
+        entry = (names, frozenset(names))
+        _field_name_cache[layer_id] = entry
+        
+        if layer_id not in _field_cache_watched:
+            _field_cache_watched.add(layer_id)
+            layer.updatedFields.connect(lambda: _field_name_cache.pop(layer_id, None))
+            layer.willBeDeleted.connect(lambda: _forget_layer_fields(layer_id))
+    return entry
+
+
+def _forget_layer_fields(layer_id: str) -> None:
+    """Drop cached field names for a deleted layer"""
+    _field_name_cache.pop(layer_id, None)
+    _field_cache_watched.discard(layer_id)
+
+
+# Default help page for tools that do not override get_help_content()
+_HELP_TEMPLATE = """
+        <h2>{name}</h2>
+        <p><b>Version:</b> {version}</p>
+        <p><b>Author:</b> {author}</p>
+        <p><b>Description:</b> {description}</p>
+        <p>No additional help available.</p>
+        """
+
+
+class _LayerIndex:
+    """Project vector layers bucketed by geometry type, kept current via project signals"""
+    
+    _instance = None
+    
+    @classmethod
+    def instance(cls) -> "_LayerIndex":
+        """Return the shared index, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self):
+        self.layers: Dict[str, QgsVectorLayer] = {}
+        self.buckets: Dict[int, Dict[str, QgsVectorLayer]] = {}
+        
+        project = QgsProject.instance()
+        self._on_added(project.mapLayers().values())
+        project.layersAdded.connect(self._on_added)
+        project.layersRemoved.connect(self._on_removed)
+    
+    def _on_added(self, layers):
+        for layer in layers:
+            if isinstance(layer, QgsVectorLayer):
+                layer_id = layer.id()
+                self.layers[layer_id] = layer
+                self.buckets.setdefault(layer.geometryType(), {})[layer_id] = layer
+    
+    def _on_removed(self, layer_ids):
+        for layer_id in layer_ids:
+            if self.layers.pop(layer_id, None) is not None:
+                for bucket in self.buckets.values():
+                    bucket.pop(layer_id, None)
+
+
 class HydroToolInterface(ABC):
     """Base interface for all Hydro Suite tools"""
     
@@ -74,13 +151,12 @@ class HydroToolInterface(ABC):
         Returns:
             str: HTML-formatted help content
         """
-        return f"""
-        <h2>{self.name}</h2>
-        <p><b>Version:</b> {self.version}</p>
-        <p><b>Author:</b> {self.author}</p>
-        <p><b>Description:</b> {self.description}</p>
-        <p>No additional help available.</p>
-        """
+        return _HELP_TEMPLATE.format(
+            name=self.name,
+            version=self.version,
+            author=self.author,
+            description=self.description
+        )
     
     def get_settings(self) -> Dict[str, Any]:
         """
@@ -135,12 +211,10 @@ class LayerSelectionMixin:
         Returns:
             list: List of QgsVectorLayer objects
         """
-        layers = []
-        for layer in QgsProject.instance().mapLayers().values():
-            if isinstance(layer, QgsVectorLayer):
-                if geometry_type is None or layer.geometryType() == geometry_type:
-                    layers.append(layer)
-        return layers
+        index = _LayerIndex.instance()
+        if geometry_type is None:
+            return list(index.layers.values())
+        return list(index.buckets.get(geometry_type, {}).values())
     
     @staticmethod
     def get_layer_fields(layer: QgsVectorLayer) -> list:
@@ -153,7 +227,7 @@ class LayerSelectionMixin:
         Returns:
             list: List of field names
         """
-        return [field.name() for field in layer.fields()]
+        return list(_layer_field_names(layer)[0])
     
     @staticmethod
     def validate_field_exists(layer: QgsVectorLayer, field_name: str) -> bool:
@@ -167,7 +241,7 @@ class LayerSelectionMixin:
         Returns:
             bool: True if field exists
         """
-        return field_name in [field.name() for field in layer.fields()]
+        return field_name in _layer_field_names(layer)[1]
 
 
 class ProgressReporter:
@@ -185,20 +259,36 @@ class ProgressReporter:
         self.callback = callback
         self.total_steps = total_steps
         self.current_step = 0
+        self._last_pct = None
+    
+    @property
+    def total_steps(self) -> int:
+        """Total number of steps"""
+        return self._total_steps
+    
+    @total_steps.setter
+    def total_steps(self, value: int):
+        self._total_steps = value
+        self._pct_per_step = 100.0 / max(value, 1)
         
     def start(self, message: str = "Starting..."):
         """Start progress reporting"""
         self.current_step = 0
+        self._last_pct = None
         self.update(0, message)
     
     def step(self, message: str = ""):
-        """Increment progress by one step"""
+        """Increment progress by one step (skipped when neither percent nor message changes)"""
         self.current_step += 1
-        progress = int((self.current_step / self.total_steps) * 100)
-        self.update(progress, message)
+        # The epsilon keeps exact multiples (e.g. the last of 97 steps) from
+        # truncating to one percent short
+        progress = int(self.current_step * self._pct_per_step + 1e-9)
+        if progress != self._last_pct or message:
+            self.update(progress, message)
     
     def update(self, progress: int, message: str = ""):
         """Update progress"""
+        self._last_pct = progress
         if self.callback:
             self.callback(progress, message)
     
@@ -22,18 +22,25 @@ import os
 import sys
 import importlib
 import json
+from collections import deque
+from functools import partial
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Optional, Any
 
 from qgis.PyQt.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QListWidget, QListWidgetItem, QStackedWidget,
+    QListView, QAbstractItemView, QStackedWidget,
     QLabel, QPushButton, QProgressBar, QMessageBox,
     QFrame, QSplitter, QTextEdit, QToolBar, QAction,
     QMenuBar, QMenu, QStatusBar, QComboBox
 )
-from qgis.PyQt.QtCore import Qt, QSettings, pyqtSignal, QThread
-from qgis.PyQt.QtGui import QIcon, QFont, QPixmap
+from qgis.PyQt.QtCore import (
+    Qt, QSettings, pyqtSignal, pyqtSlot, QThread, QTimer, QMetaObject, Q_ARG
+)
+from qgis.PyQt.QtGui import (
+    QIcon, QFont, QPixmap, QStandardItemModel, QStandardItem, QTextCursor
+)
 from qgis.core import QgsProject, QgsMessageLog, Qgis
 from qgis.gui import QgsGui
 
@@ -44,11 +51,98 @@ from hydro_suite_interface import HydroToolInterface
 from style_loader import StyleLoader, STYLE_MAP
 
 
+# Log panel colors per level
+_LOG_COLORS = MappingProxyType({
+    "info": "#888888",
+    "warning": "#ff9800",
+    "error": "#f44336",
+    "success": "#4caf50"
+})
+
+_LOG_TEMPLATE = '<span style="color: {color}">[{level}] {message}</span>'
+
+_TOOL_INFO_TEMPLATE = """
+<h3>{name}</h3>
+<p><b>Category:</b> {category}</p>
+<p><b>Description:</b> {description}</p>
+"""
+
+_ABOUT_TEMPLATE = """
+<h2>Hydro Suite - Standalone Scripts</h2>
+<p>Version 1.1 - 2025</p>
+<p>A comprehensive QGIS toolbox for hydrological and stormwater analysis.</p>
+
+<p><b>This is the Standalone Scripts Version</b></p>
+<p>Runs directly in QGIS Python Console without plugin installation.</p>
+
+<p><b>Repository:</b> github.com/Joeywoody124/hydro-suite-standalone</p>
+
+<p><b>Features:</b></p>
+<ul>
+<li>Multi-Style GUI Theming ({style_count} styles)</li>
+<li>Curve Number Calculator</li>
+<li>Rational Method C Calculator</li>
+<li>Time of Concentration (Multi-Method)</li>
+<li>Trapezoidal Channel Designer</li>
+</ul>
+
+<p><b>Current Style:</b> {current_style}</p>
+
+<p><b>Author:</b> Joey Woody, PE</p>
+<p><b>Company:</b> J. Bragg Consulting Inc.</p>
+"""
+
+
+class _ToolPreloader(QThread):
+    """Imports the tool modules in the background so the first click only instantiates"""
+    
+    loaded = pyqtSignal(str, object)
+    
+    def __init__(self, tool_configs: Dict[str, Dict[str, Any]], parent=None):
+        super().__init__(parent)
+        self.tool_configs = tool_configs
+    
+    def run(self):
+        for tool_id, config in self.tool_configs.items():
+            try:
+                module = importlib.import_module(config["module"])
+                self.loaded.emit(tool_id, getattr(module, config["class"]))
+            except Exception:
+                # Leave it to create_tool_wrapper to import and report on click
+                pass
+
+
+class MockTool(HydroToolInterface):
+    """Placeholder for tools that are registered but not implemented yet"""
+    
+    def __init__(self, name: str, description: str, category: str):
+        super().__init__()
+        self.name = name
+        self.description = description
+        self.category = category
+    
+    def create_gui(self, parent_widget):
+        widget = QWidget(parent_widget)
+        layout = QVBoxLayout(widget)
+        layout.addWidget(QLabel(f"<h2>{self.name}</h2>"))
+        layout.addWidget(QLabel("Tool under development"))
+        layout.addStretch()
+        return widget
+    
+    def validate_inputs(self):
+        return True, ""
+    
+    def run(self, progress_callback):
+        return True
+
+
 class HydroSuiteController:
     """Main controller for the Hydro Suite toolbox"""
     
     def __init__(self):
         self.tools_registry = {}
+        self._category_cache: Optional[Dict[str, list]] = None
+        self._preloader = None
         self.settings = QSettings("HydroSuite", "MainController")
         self.components_path = Path(__file__).parent / "Components"
         self.resources_path = Path(__file__).parent / "Resources"
@@ -106,6 +200,21 @@ class HydroSuiteController:
             "HydroSuite", 
             Qgis.Info
         )
+        
+        # Import the tool modules while the main window is being built
+        self._preloader = _ToolPreloader(tool_configs)
+        self._preloader.loaded.connect(self._on_tool_class_loaded)
+        self._preloader.start()
+    
+    def _on_tool_class_loaded(self, tool_id: str, tool_class):
+        """Store a tool class imported by the preloader"""
+        if tool_id in self.tools_registry:
+            self.tools_registry[tool_id]["class"] = tool_class
+    
+    def shutdown(self):
+        """Wait for background tool imports before the controller goes away"""
+        if self._preloader is not None:
+            self._preloader.wait()
     
     def register_tool(self, tool_id: str, config: Dict[str, Any]):
         """Register a tool in the registry"""
@@ -113,8 +222,10 @@ class HydroSuiteController:
             "id": tool_id,
             "config": config,
             "instance": None,
-            "loaded": False
+            "loaded": False,
+            "class": None
         }
+        self._category_cache = None
     
     def load_tool(self, tool_id: str) -> Optional[HydroToolInterface]:
         """Load a tool instance (lazy loading)"""
@@ -154,52 +265,28 @@ class HydroSuiteController:
     def create_tool_wrapper(self, tool_id: str, config: Dict[str, Any]) -> HydroToolInterface:
         """Create a wrapper for tools"""
         
-        # Import actual tools
-        if tool_id == "cn_calculator":
-            from cn_calculator_tool import CNCalculatorTool
-            return CNCalculatorTool()
-        elif tool_id == "c_calculator":
-            from rational_c_tool import RationalCTool
-            return RationalCTool()
-        elif tool_id == "tc_calculator":
-            from tc_calculator_tool import TCCalculatorTool
-            return TCCalculatorTool()
-        elif tool_id == "channel_designer":
-            from channel_designer_tool import ChannelDesignerTool
-            return ChannelDesignerTool()
+        # Use the class imported by the preloader, or import it now if the
+        # tool was picked before the background import got to it
+        tool_class = self.tools_registry[tool_id].get("class")
+        if tool_class is None and "module" in config:
+            module = importlib.import_module(config["module"])
+            tool_class = getattr(module, config["class"])
+            self.tools_registry[tool_id]["class"] = tool_class
+        if tool_class is not None:
+            return tool_class()
         
         # Return mock for unimplemented tools
-        class MockTool(HydroToolInterface):
-            def __init__(self):
-                super().__init__()
-                self.name = config["name"]
-                self.description = config["description"]
-                self.category = config["category"]
-            
-            def create_gui(self, parent_widget):
-                widget = QWidget(parent_widget)
-                layout = QVBoxLayout(widget)
-                layout.addWidget(QLabel(f"<h2>{self.name}</h2>"))
-                layout.addWidget(QLabel("Tool under development"))
-                layout.addStretch()
-                return widget
-            
-            def validate_inputs(self):
-                return True, ""
-            
-            def run(self, progress_callback):
-                return True
-        
-        return MockTool()
+        return MockTool(config["name"], config["description"], config["category"])
     
     def get_tool_categories(self) -> Dict[str, list]:
-        """Get tools organized by category"""
+        """Get tools organized by category (cached until the registry changes)"""
+        if self._category_cache is not None:
+            return self._category_cache
+        
         categories = {}
         for tool_id, tool_info in self.tools_registry.items():
-            category = tool_info["config"]["category"]
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(tool_id)
+            categories.setdefault(tool_info["config"]["category"], []).append(tool_id)
+        self._category_cache = categories
         return categories
 
 
@@ -214,10 +301,37 @@ class HydroSuiteMainWindow(QMainWindow):
         # Initialize style system
         self.style_loader = StyleLoader()
         self.current_style_name = "Normal (Default)"
+        self._status_prefix = f"Style: {self.current_style_name} | "
+        self._styles = {
+            name: self.style_loader.load_style(name)
+            for name in self.style_loader.get_available_styles()
+        }
+        self._stylesheet_cache: Dict[str, str] = {}
+        self._applied_style: Optional[str] = None
+        self._about_html_cache: Optional[str] = None
+        self._tool_info_cache: Dict[str, str] = {}
+        self._tool_id_to_index: Dict[str, int] = {}
         
         self.setWindowTitle("Hydro Suite - Standalone Scripts for QGIS")
         self.setMinimumSize(1000, 700)
         
+        self._settings = QSettings("HydroSuite", "MainWindow")
+        
+        # Log panel messages are batched and rendered on a short timer
+        self._log_buffer = deque(maxlen=1000)
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_log)
+        
+        # Style combo changes are debounced so scrolling through the list
+        # only restyles the window for the final selection
+        self._pending_style = None
+        self._style_apply_timer = QTimer(self)
+        self._style_apply_timer.setSingleShot(True)
+        self._style_apply_timer.setInterval(150)
+        self._style_apply_timer.timeout.connect(self._apply_pending_style)
+        
         self.setup_ui()
         self.setup_menu()
         self.setup_toolbar()
@@ -225,15 +339,15 @@ class HydroSuiteMainWindow(QMainWindow):
         self.load_settings()
         
         # Apply initial style (use saved preference or default)
-        saved_style = QSettings("HydroSuite", "MainWindow").value("gui_style", "Kinetic (Dark)")
+        saved_style = self._settings.value("gui_style", "Kinetic (Dark)")
         if saved_style in self.style_loader.get_available_styles():
             self.style_combo.setCurrentText(saved_style)
             self._apply_style(saved_style)
         else:
             self._apply_style("Kinetic (Dark)")
         
-        if self.tool_list.count() > 0:
-            self.tool_list.setCurrentRow(0)
+        if self.tool_model.rowCount() > 0:
+            self.tool_list.setCurrentIndex(self.tool_model.index(0, 0))
     
     def setup_ui(self):
         """Setup the main UI layout"""
@@ -275,22 +389,29 @@ class HydroSuiteMainWindow(QMainWindow):
         """)
         layout.addWidget(self.tools_title)
         
-        self.tool_list = QListWidget()
-        
+        # Build all rows first and hand them to the model in one call
+        items = []
         categories = self.controller.get_tool_categories()
         for category, tool_ids in categories.items():
-            category_item = QListWidgetItem(f"-- {category} --")
+            category_item = QStandardItem(f"-- {category} --")
             category_item.setFlags(Qt.NoItemFlags)
             category_item.setFont(QFont("Arial", 10, QFont.Bold))
-            self.tool_list.addItem(category_item)
+            items.append(category_item)
             
             for tool_id in tool_ids:
                 tool_info = self.controller.tools_registry[tool_id]
-                tool_item = QListWidgetItem(f"  > {tool_info['config']['name']}")
-                tool_item.setData(Qt.UserRole, tool_id)
-                self.tool_list.addItem(tool_item)
-        
-        self.tool_list.currentItemChanged.connect(self.on_tool_selected)
+                tool_item = QStandardItem(f"  > {tool_info['config']['name']}")
+                tool_item.setData(tool_id, Qt.UserRole)
+                items.append(tool_item)
+        
+        self.tool_model = QStandardItemModel(self)
+        self.tool_model.invisibleRootItem().appendRows(items)
+        
+        self.tool_list = QListView()
+        self.tool_list.setObjectName("toolList")
+        self.tool_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tool_list.setModel(self.tool_model)
+        self.tool_list.selectionModel().currentChanged.connect(self.on_tool_selected)
         layout.addWidget(self.tool_list)
         
         self.info_btn = QPushButton("About Selected Tool")
@@ -329,6 +450,8 @@ class HydroSuiteMainWindow(QMainWindow):
         
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
+        # Keep long sessions from growing the log document without bound
+        self.log_text.document().setMaximumBlockCount(500)
         log_layout.addWidget(self.log_text)
         
         v_splitter.addWidget(log_frame)
@@ -399,11 +522,12 @@ class HydroSuiteMainWindow(QMainWindow):
         style_menu = view_menu.addMenu("GUI Style")
         for style_name in self.style_loader.get_available_styles():
             action = QAction(style_name, self)
-            action.triggered.connect(lambda checked, s=style_name: self._apply_style(s))
+            action.triggered.connect(partial(self._on_style_action, style_name))
             style_menu.addAction(action)
         
         # Tools menu
         tools_menu = menubar.addMenu("&Tools")
+        menubar.setUpdatesEnabled(False)
         categories = self.controller.get_tool_categories()
         for category, tool_ids in categories.items():
             category_menu = tools_menu.addMenu(category)
@@ -411,8 +535,9 @@ class HydroSuiteMainWindow(QMainWindow):
                 tool_info = self.controller.tools_registry[tool_id]
                 action = QAction(tool_info['config']['name'], self)
                 action.setData(tool_id)
-                action.triggered.connect(lambda checked, tid=tool_id: self.select_tool(tid))
+                action.triggered.connect(partial(self._on_tool_action, tool_id))
                 category_menu.addAction(action)
+        menubar.setUpdatesEnabled(True)
         
         # Help menu
         help_menu = menubar.addMenu("&Help")
@@ -421,6 +546,14 @@ class HydroSuiteMainWindow(QMainWindow):
         about.triggered.connect(self.show_about)
         help_menu.addAction(about)
     
+    def _on_style_action(self, style_name: str, checked: bool = False):
+        """Apply a style picked from the View menu"""
+        self._apply_style(style_name)
+    
+    def _on_tool_action(self, tool_id: str, checked: bool = False):
+        """Select a tool picked from the Tools menu"""
+        self.select_tool(tool_id)
+    
     def setup_toolbar(self):
         """Setup the toolbar with style selector"""
         toolbar = QToolBar("Main Toolbar")
@@ -462,20 +595,36 @@ class HydroSuiteMainWindow(QMainWindow):
     
     def _on_style_change(self, style_name: str):
         """Handle style dropdown change"""
-        self._apply_style(style_name)
+        self._pending_style = style_name
+        self._style_apply_timer.start()
+    
+    def _apply_pending_style(self):
+        """Apply the last style picked in the dropdown"""
+        if self._pending_style:
+            self._apply_style(self._pending_style)
     
     def _apply_style(self, style_name: str):
         """Apply selected style to the entire application"""
-        style = self.style_loader.load_style(style_name)
+        # Re-setting the same stylesheet still restyles every child widget
+        if style_name == self._applied_style:
+            return
+        
+        style = self._styles.get(style_name) or self.style_loader.load_style(style_name)
         if not style:
             self.log(f"Failed to load style: {style_name}", level="error")
             return
         
         self.current_style_name = style_name
-        
-        # Generate and apply stylesheet
-        stylesheet = self.style_loader.generate_stylesheet(style)
+        self._status_prefix = f"Style: {style_name} | "
+        self._about_html_cache = None
+        
+        # Generate (once per style) and apply stylesheet
+        stylesheet = self._stylesheet_cache.get(style_name)
+        if stylesheet is None:
+            stylesheet = self.style_loader.generate_stylesheet(style)
+            self._stylesheet_cache[style_name] = stylesheet
         self.setStyleSheet(stylesheet)
+        self._applied_style = style_name
         
         # Update style combo if called from menu
         if self.style_combo.currentText() != style_name:
@@ -484,7 +633,7 @@ class HydroSuiteMainWindow(QMainWindow):
             self.style_combo.blockSignals(False)
         
         # Save preference
-        QSettings("HydroSuite", "MainWindow").setValue("gui_style", style_name)
+        self._settings.setValue("gui_style", style_name)
         
         # Update status bar
         self.status_bar.showMessage(f"Style: {style['name']} | Ready")
@@ -494,7 +643,7 @@ class HydroSuiteMainWindow(QMainWindow):
     
     def on_tool_selected(self, current, previous):
         """Handle tool selection change"""
-        if not current:
+        if not current.isValid():
             return
         
         tool_id = current.data(Qt.UserRole)
@@ -512,19 +661,16 @@ class HydroSuiteMainWindow(QMainWindow):
             self.log(f"Failed to load {tool_id}", level="error")
             return
         
-        if tool_id not in [self.tool_stack.widget(i).property("tool_id") 
-                          for i in range(self.tool_stack.count())]:
+        index = self._tool_id_to_index.get(tool_id)
+        if index is None:
             tool_widget = tool.create_gui(self.tool_stack)
             tool_widget.setProperty("tool_id", tool_id)
-            self.tool_stack.addWidget(tool_widget)
-        
-        for i in range(self.tool_stack.count()):
-            if self.tool_stack.widget(i).property("tool_id") == tool_id:
-                self.tool_stack.setCurrentIndex(i)
-                break
+            index = self.tool_stack.addWidget(tool_widget)
+            self._tool_id_to_index[tool_id] = index
+        self.tool_stack.setCurrentIndex(index)
         
         self.current_tool = tool
-        self.status_bar.showMessage(f"Style: {self.current_style_name} | Loaded: {tool.name}")
+        self.status_bar.showMessage(self._status_prefix + f"Loaded: {tool.name}")
         self.log(f"Tool {tool.name} ready")
     
     def run_current_tool(self):
@@ -543,9 +689,15 @@ class HydroSuiteMainWindow(QMainWindow):
         self.progress_bar.setValue(0)
         
         def progress_callback(value, message=""):
-            self.progress_bar.setValue(value)
-            if message:
-                self.status_bar.showMessage(f"Style: {self.current_style_name} | {message}")
+            # Tools may report from a worker thread; widgets are only
+            # touched on the GUI thread
+            if QThread.currentThread() is self.thread():
+                self._update_progress(value, message)
+            else:
+                QMetaObject.invokeMethod(
+                    self, "_update_progress", Qt.QueuedConnection,
+                    Q_ARG(int, value), Q_ARG(str, message)
+                )
         
         try:
             self.log(f"Running {self.current_tool.name}...")
@@ -556,88 +708,96 @@ class HydroSuiteMainWindow(QMainWindow):
             QMessageBox.critical(self, "Execution Error", str(e))
         finally:
             self.progress_bar.setVisible(False)
-            self.status_bar.showMessage(f"Style: {self.current_style_name} | Ready")
+            self.status_bar.showMessage(self._status_prefix + "Ready")
+    
+    @pyqtSlot(int, str)
+    def _update_progress(self, value: int, message: str):
+        """Show tool progress in the progress bar and status bar"""
+        self.progress_bar.setValue(value)
+        if message:
+            self.status_bar.showMessage(self._status_prefix + message)
     
     def show_tool_info(self):
         """Show information about the selected tool"""
-        current = self.tool_list.currentItem()
-        if not current:
+        current = self.tool_list.currentIndex()
+        if not current.isValid():
             return
         
         tool_id = current.data(Qt.UserRole)
         if not tool_id:
             return
         
-        tool_info = self.controller.tools_registry[tool_id]
-        config = tool_info['config']
-        
-        info_text = f"""
-<h3>{config['name']}</h3>
-<p><b>Category:</b> {config['category']}</p>
-<p><b>Description:</b> {config['description']}</p>
-"""
+        info_text = self._tool_info_cache.get(tool_id)
+        if info_text is None:
+            config = self.controller.tools_registry[tool_id]['config']
+            info_text = _TOOL_INFO_TEMPLATE.format(
+                name=config['name'],
+                category=config['category'],
+                description=config['description']
+            )
+            self._tool_info_cache[tool_id] = info_text
         
         QMessageBox.information(self, "Tool Information", info_text)
     
     def show_about(self):
         """Show about dialog"""
-        about_text = f"""
-<h2>Hydro Suite - Standalone Scripts</h2>
-<p>Version 1.1 - 2025</p>
-<p>A comprehensive QGIS toolbox for hydrological and stormwater analysis.</p>
-
-<p><b>This is the Standalone Scripts Version</b></p>
-<p>Runs directly in QGIS Python Console without plugin installation.</p>
-
-<p><b>Repository:</b> github.com/Joeywoody124/hydro-suite-standalone</p>
-
-<p><b>Features:</b></p>
-<ul>
-<li>Multi-Style GUI Theming ({len(self.style_loader.get_available_styles())} styles)</li>
-<li>Curve Number Calculator</li>
-<li>Rational Method C Calculator</li>
-<li>Time of Concentration (Multi-Method)</li>
-<li>Trapezoidal Channel Designer</li>
-</ul>
-
-<p><b>Current Style:</b> {self.current_style_name}</p>
-
-<p><b>Author:</b> Joey Woody, PE</p>
-<p><b>Company:</b> J. Bragg Consulting Inc.</p>
-"""
-        QMessageBox.about(self, "About Hydro Suite", about_text)
+        if self._about_html_cache is None:
+            self._about_html_cache = _ABOUT_TEMPLATE.format(
+                style_count=len(self.style_loader.get_available_styles()),
+                current_style=self.current_style_name
+            )
+        QMessageBox.about(self, "About Hydro Suite", self._about_html_cache)
     
     def log(self, message: str, level: str = "info"):
         """Add message to log"""
         QgsMessageLog.logMessage(message, "HydroSuite", 
                                 getattr(Qgis, level.capitalize(), Qgis.Info))
         
-        colors = {
-            "info": "#888888",
-            "warning": "#ff9800",
-            "error": "#f44336",
-            "success": "#4caf50"
-        }
-        color = colors.get(level, "#888888")
-        
-        self.log_text.append(f'<span style="color: {color}">[{level.upper()}] {message}</span>')
+        self._log_buffer.append((level, message))
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def _flush_log(self):
+        """Render all buffered log messages in one update"""
+        if not self._log_buffer:
+            return
+        parts = [
+            _LOG_TEMPLATE.format(
+                color=_LOG_COLORS.get(level, "#888888"), level=level.upper(), message=message
+            )
+            for level, message in self._log_buffer
+        ]
+        self._log_buffer.clear()
+        
+        # One block per line so setMaximumBlockCount can trim old lines
+        # and only the new blocks need laying out
+        document = self.log_text.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for part in parts:
+            if not document.isEmpty():
+                cursor.insertBlock()
+            cursor.insertHtml(part)
+        cursor.endEditBlock()
+        self.log_text.setTextCursor(cursor)
+        self.log_text.ensureCursorVisible()
     
     def load_settings(self):
         """Load saved settings"""
-        settings = QSettings("HydroSuite", "MainWindow")
-        geometry = settings.value("geometry")
+        geometry = self._settings.value("geometry")
         if geometry:
             self.restoreGeometry(geometry)
     
     def save_settings(self):
         """Save current settings"""
-        settings = QSettings("HydroSuite", "MainWindow")
-        settings.setValue("geometry", self.saveGeometry())
-        settings.setValue("gui_style", self.current_style_name)
+        self._settings.setValue("geometry", self.saveGeometry())
+        self._settings.setValue("gui_style", self.current_style_name)
     
     def closeEvent(self, event):
         """Handle window close event"""
         self.save_settings()
+        self.controller.shutdown()
         event.accept()
 
 
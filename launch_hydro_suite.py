@@ -13,6 +13,32 @@ Example:
 
 This launcher auto-detects its location and loads all required modules.
 
+RELOADING AFTER EDITS:
+----------------------
+Rerunning the launcher in the same QGIS session reuses the modules it
+already loaded. After editing the suite's files, either set the
+HYDRO_SUITE_RELOAD environment variable to 1 before running the exec()
+line above, or call the launcher again with:
+
+    launch_hydro_suite(reload=True)
+
+INSTALL LOCATION:
+-----------------
+The installation directory is looked up in this order:
+
+    1. The HYDRO_SUITE_HOME environment variable
+    2. A hydro_suite.pth file in your home directory whose first line
+       is the installation path
+    3. The directory of this file, when __file__ is available
+    4. The directory found by the last successful launch, remembered in
+       %APPDATA%\hydro_suite\path.txt (~/.config/hydro_suite/path.txt
+       outside Windows)
+    5. The common locations listed in '_POSSIBLE'
+
+Setting HYDRO_SUITE_HOME or writing hydro_suite.pth skips the search.
+Delete path.txt to forget a remembered location; it is also removed
+automatically when loading from that location fails.
+
 Version: 1.0.0
 Repository: https://github.com/Joeywoody124/hydro-suite-standalone
 Author: Joey Woody, PE - J. Bragg Consulting Inc.
@@ -21,12 +47,149 @@ Author: Joey Woody, PE - J. Bragg Consulting Inc.
 import sys
 import os
 import importlib.util
+import pkgutil
+import py_compile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+
+# Modules to load, in stages of dependency order; modules within a
+# stage don't import each other and are loaded concurrently
+_MODULES = tuple(
+    tuple((sys.intern(module_name), file_name) for module_name, file_name in stage)
+    for stage in (
+        (
+            ('shared_widgets', 'shared_widgets.py'),
+            ('hydro_suite_interface', 'hydro_suite_interface.py'),
+            ('style_loader', 'style_loader.py'),  # GUI theming system
+        ),
+        (
+            ('hydro_suite_main', 'hydro_suite_main.py'),
+        ),
+    )
+)
+
+# Windows and macOS file systems match names regardless of case by default
+_CASE_INSENSITIVE_FS = os.name == 'nt' or sys.platform == 'darwin'
+
+# Expanded once when the launcher is read
+_HOME = os.path.expanduser('~')
+
+# Common install locations searched when nothing else finds the suite
+# Add your installation path here if auto-detection fails
+_POSSIBLE = (
+    # GitHub repository locations
+    r'E:\GitHub\hydro-suite-standalone',
+    r'C:\Users\Public\Documents\hydro-suite-standalone',
+    # Development locations
+    r'E:\CLAUDE_Workspace\Claude\Report_Files\Finished_Code\Hydro_Suite_Data_Backup_v1\github_standalone',
+    # User-specific locations
+    os.path.join(_HOME, 'Documents', 'hydro-suite-standalone'),
+    os.path.join(_HOME, 'GitHub', 'hydro-suite-standalone'),
+)
+
+# Tool modules are not loaded by the launcher: HydroSuiteController imports
+# them from sys.path in the background and on first selection of the tool
+_TOOL_FILES = (
+    'cn_calculator_tool.py',
+    'rational_c_tool.py',
+    'tc_calculator_tool.py',
+    'channel_designer_tool.py',
+)
+
+
+@lru_cache(maxsize=256)
+def _dir_entries(path):
+    """Return the set of file names in path, or None if it can't be listed"""
+    try:
+        return frozenset(entry.name for entry in os.scandir(path))
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _folded_dir_entries(path):
+    """Case-folded _dir_entries, for case-insensitive file systems"""
+    entries = _dir_entries(path)
+    return None if entries is None else frozenset(name.casefold() for name in entries)
+
+
+def _has_main(path):
+    """Check for hydro_suite_main.py in path with a single stat"""
+    try:
+        os.stat(os.path.join(path, 'hydro_suite_main.py'))
+        return True
+    except OSError:
+        return False
+
+
+def _configured_home():
+    """Return the install path from HYDRO_SUITE_HOME or ~/hydro_suite.pth, if any"""
+    env = os.environ.get('HYDRO_SUITE_HOME')
+    if env:
+        return env
+    try:
+        with open(os.path.join(_HOME, 'hydro_suite.pth')) as f:
+            return f.readline().strip() or None
+    except OSError:
+        return None
+
+
+def _cached_path_file():
+    """Return the file that remembers the last discovered install directory"""
+    base = os.environ.get('APPDATA') or os.path.join(_HOME, '.config')
+    return os.path.join(base, 'hydro_suite', 'path.txt')
+
+
+def _read_cached_path():
+    """Return the remembered install directory, or None"""
+    try:
+        with open(_cached_path_file()) as f:
+            return f.readline().strip() or None
+    except OSError:
+        return None
 
 
-def launch_hydro_suite():
+def _write_cached_path(script_dir):
+    """Remember script_dir so the next launch can skip discovery"""
+    path_file = _cached_path_file()
+    try:
+        os.makedirs(os.path.dirname(path_file), exist_ok=True)
+        with open(path_file, 'w') as f:
+            f.write(script_dir + '\n')
+    except OSError:
+        pass
+
+
+def _clear_cached_path():
+    """Forget the remembered install directory"""
+    try:
+        os.remove(_cached_path_file())
+    except OSError:
+        pass
+
+
+def _warm_pyc(script_dir, file_names):
+    """Byte-compile the suite's modules once per install so later imports use __pycache__"""
+    sentinel = os.path.join(script_dir, '.hydro_suite_pyc_warmed')
+    if os.path.exists(sentinel):
+        return
+    for file_name in file_names:
+        py_compile.compile(os.path.join(script_dir, file_name), cfile=None, doraise=False, quiet=1)
+    try:
+        open(sentinel, 'w').close()
+    except OSError:
+        pass
+
+
+def launch_hydro_suite(reload=False):
     """
     Main launcher function for Hydro Suite standalone scripts.
     Auto-detects the script directory and loads all modules.
+    With reload=True, modules already loaded in this session are
+    re-executed so edits to the files are picked up.
     """
     print("=" * 60)
     print("HYDRO SUITE - Standalone Scripts for QGIS")
@@ -35,44 +198,72 @@ def launch_hydro_suite():
     print("Repository: https://github.com/Joeywoody124/hydro-suite-standalone")
     print("-" * 60)
     
+    # Drop listings cached by a previous launch in this QGIS session
+    _dir_entries.cache_clear()
+    _folded_dir_entries.cache_clear()
+    
     # Auto-detect script directory
     # When using exec(open(...).read()), __file__ isn't available
     # So we need to find it from the call stack or use a known location
     
     script_dir = None
+    found = False
+    from_cache = False
+    
+    # Method 0: Explicit HYDRO_SUITE_HOME or hydro_suite.pth setting
+    configured = _configured_home()
+    if configured:
+        if _has_main(configured):
+            script_dir = configured
+            found = True
+            print(f"Using configured installation: {script_dir}")
+        else:
+            print(f"Configured path has no hydro_suite_main.py: {configured}")
     
     # Method 1: Check if __file__ is defined (won't work with exec)
-    try:
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        print(f"Detected directory from __file__: {script_dir}")
-    except NameError:
-        pass
+    if not found:
+        this_file = globals().get('__file__')
+        if this_file:
+            script_dir = os.path.dirname(os.path.abspath(this_file))
+            print(f"Detected directory from __file__: {script_dir}")
+            found = _has_main(script_dir)
+    
+    # Method 1b: Directory remembered from the last successful discovery,
+    # only when this file's own location didn't identify the install
+    if not found:
+        cached = _read_cached_path()
+        if cached and _has_main(cached):
+            script_dir = cached
+            found = from_cache = True
+            print(f"Using remembered installation: {script_dir}")
     
     # Method 2: Check common locations if Method 1 failed
-    if script_dir is None or not os.path.exists(os.path.join(script_dir, 'hydro_suite_main.py')):
-        # List of possible locations to check
-        # Add your installation path here if auto-detection fails
-        possible_locations = [
-            # GitHub repository locations
-            r'E:\GitHub\hydro-suite-standalone',
-            r'C:\Users\Public\Documents\hydro-suite-standalone',
-            # Development locations
-            r'E:\CLAUDE_Workspace\Claude\Report_Files\Finished_Code\Hydro_Suite_Data_Backup_v1\github_standalone',
-            # User-specific locations
-            os.path.expanduser('~/Documents/hydro-suite-standalone'),
-            os.path.expanduser('~/GitHub/hydro-suite-standalone'),
-        ]
-        
-        for loc in possible_locations:
-            if os.path.exists(loc) and os.path.exists(os.path.join(loc, 'hydro_suite_main.py')):
+    if not found:
+        for loc in _POSSIBLE:
+            # Candidates sharing a parent reuse one cached listing of it, so
+            # absent directories cost no stat; unlistable parents fall
+            # back to stat
+            if _CASE_INSENSITIVE_FS:
+                siblings = _folded_dir_entries(os.path.dirname(loc))
+                name = os.path.basename(loc).casefold()
+            else:
+                siblings = _dir_entries(os.path.dirname(loc))
+                name = os.path.basename(loc)
+            if siblings is not None and name not in siblings:
+                continue
+            if _has_main(loc):
                 script_dir = loc
+                found = True
                 print(f"Found installation at: {script_dir}")
                 break
     
+    # The chosen directory is listed once for all later presence checks
+    entries = _dir_entries(script_dir) if found else None
+    
     # If still not found, prompt user
-    if script_dir is None or not os.path.exists(os.path.join(script_dir, 'hydro_suite_main.py')):
+    if entries is None:
         print("\nERROR: Could not find Hydro Suite installation directory.")
-        print("\nPlease edit this file and add your installation path to 'possible_locations'")
+        print("\nPlease edit this file and add your installation path to '_POSSIBLE'")
         print("Or use the manual launcher below:\n")
         print("    script_dir = r'YOUR_PATH_HERE'")
         print("    exec(open(os.path.join(script_dir, 'launch_hydro_suite.py')).read())")
@@ -85,41 +276,91 @@ def launch_hydro_suite():
         sys.path.insert(0, script_dir)
         print("Added to Python path")
     
+    # One path-entry finder for the install directory, shared by every load
+    finder = pkgutil.get_importer(script_dir)
+    
     # Helper function to load modules from file
-    def load_module_from_file(module_name, file_path):
-        """Load a module directly from file path"""
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Module file not found: {file_path}")
-        
-        spec = importlib.util.spec_from_file_location(module_name, file_path)
-        if spec is None:
-            raise ImportError(f"Could not load spec for {module_name}")
+    # Milliseconds spent in load_module_from_file, per module
+    load_times = {}
+    
+    def load_module_from_file(module_name, file_path, force_reload=False):
+        """Load a module directly from file path
         
-        module = importlib.util.module_from_spec(spec)
-        sys.modules[module_name] = module
-        spec.loader.exec_module(module)
-        return module
-    
-    # List of modules to load in dependency order
-    modules_to_load = [
-        ('shared_widgets', 'shared_widgets.py'),
-        ('hydro_suite_interface', 'hydro_suite_interface.py'),
-        ('style_loader', 'style_loader.py'),  # GUI theming system
-        ('cn_calculator_tool', 'cn_calculator_tool.py'),
-        ('rational_c_tool', 'rational_c_tool.py'),
-        ('tc_calculator_tool', 'tc_calculator_tool.py'),
-        ('channel_designer_tool', 'channel_designer_tool.py'),
-        ('hydro_suite_main', 'hydro_suite_main.py'),
-    ]
+        A module already imported from the same file is reused unless
+        force_reload is set (useful while editing tool files).
+        """
+        t_start = time.perf_counter()
+        try:
+            if not force_reload:
+                module = sys.modules.get(module_name)
+                if module is not None and getattr(module, '__file__', None) == file_path:
+                    return module
+            
+            spec = finder.find_spec(module_name) if finder is not None else None
+            if spec is None:
+                spec = importlib.util.spec_from_file_location(module_name, file_path)
+            if spec is None:
+                raise ImportError(f"Could not load spec for {module_name}")
+            
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            spec.loader.exec_module(module)
+            return module
+        finally:
+            load_times[module_name] = (time.perf_counter() - t_start) * 1000
+    
+    # Join each module path once
+    resolved = [[(module_name, file_name, os.path.join(script_dir, file_name))
+                 for module_name, file_name in stage]
+                for stage in _MODULES]
+    
+    # The controller imports the tools by name, so forget them to have
+    # edited tool files imported afresh
+    if reload:
+        for file_name in _TOOL_FILES:
+            sys.modules.pop(os.path.splitext(file_name)[0], None)
     
     print("\nLoading modules...")
     
     try:
-        for module_name, file_name in modules_to_load:
-            file_path = os.path.join(script_dir, file_name)
-            print(f"   Loading {module_name}...", end=" ")
-            load_module_from_file(module_name, file_path)
-            print("OK")
+        # Each console print repaints the QGIS console, so status lines are
+        # printed together unless loading is slow enough to need feedback
+        status_lines = []
+        t0 = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=len(resolved[0])) as pool:
+                for stage in resolved:
+                    for module_name, file_name, file_path in stage:
+                        if file_name not in entries:
+                            status_lines.append(f"   {module_name}: MISSING")
+                            raise FileNotFoundError(f"Module file not found: {file_path}")
+                    
+                    futures = [(module_name, pool.submit(load_module_from_file, module_name, file_path, reload))
+                               for module_name, _, file_path in stage]
+                    for module_name, future in futures:
+                        try:
+                            future.result()
+                        except Exception:
+                            status_lines.append(f"   {module_name}: FAIL")
+                            raise
+                        ms = load_times[module_name]
+                        slow = "  (slow)" if ms > 50 else ""
+                        status_lines.append(f"   {module_name}: OK {ms:.0f} ms{slow}")
+                        if time.perf_counter() - t0 > 0.25:
+                            print("\n".join(status_lines))
+                            status_lines.clear()
+        finally:
+            if status_lines:
+                print("\n".join(status_lines))
+        
+        slowest = max(load_times, key=load_times.get)
+        print(f"   Loaded {len(load_times)} modules in "
+              f"{(time.perf_counter() - t0) * 1000:.0f} ms "
+              f"(slowest: {slowest} {load_times[slowest]:.0f} ms)")
+        
+        for file_name in _TOOL_FILES:
+            if file_name not in entries:
+                print(f"   WARNING: {file_name} is missing, its tool will not load")
         
         print("\nLaunching Hydro Suite GUI...")
         
@@ -139,6 +380,14 @@ def launch_hydro_suite():
         hydro_suite_window = HydroSuiteMainWindow()
         hydro_suite_window.show()
         
+        # Compile the modules not imported yet (mostly tools) in the background
+        compile_files = [f for stage in resolved for _, f, _ in stage] + list(_TOOL_FILES)
+        threading.Thread(
+            target=_warm_pyc,
+            args=(script_dir, [f for f in compile_files if f in entries]),
+            daemon=True
+        ).start()
+        
         print("\n" + "=" * 60)
         print("HYDRO SUITE LAUNCHED SUCCESSFULLY!")
         print("=" * 60)
@@ -150,18 +399,24 @@ def launch_hydro_suite():
         print("Issues: https://github.com/Joeywoody124/hydro-suite-standalone/issues")
         print("-" * 60)
         
+        if configured != script_dir and not from_cache:
+            _write_cached_path(script_dir)
+        
         return hydro_suite_window
         
     except FileNotFoundError as e:
+        if from_cache:
+            _clear_cached_path()
         print(f"\nFILE NOT FOUND: {e}")
         print("\nMake sure all required files are in the same directory:")
-        for _, file_name in modules_to_load:
-            file_path = os.path.join(script_dir, file_name)
-            status = "OK" if os.path.exists(file_path) else "MISSING"
+        for file_name in [f for stage in resolved for _, f, _ in stage] + list(_TOOL_FILES):
+            status = "OK" if file_name in entries else "MISSING"
             print(f"   [{status}] {file_name}")
         return None
         
     except Exception as e:
+        if from_cache:
+            _clear_cached_path()
         print(f"\nERROR: {e}")
         import traceback
         print(f"\nFull traceback:\n{traceback.format_exc()}")
@@ -171,4 +426,4 @@ def launch_hydro_suite():
 # ============================================================
 # LAUNCH THE APPLICATION
 # ============================================================
-launch_hydro_suite()
+launch_hydro_suite(reload=os.environ.get('HYDRO_SUITE_RELOAD') == '1')
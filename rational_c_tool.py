@@ -7,11 +7,15 @@ Repository: https://github.com/Joeywoody124/hydro-suite-standalone
 """
 
 import os
+import re
 import csv
+import zlib
 import traceback
 from pathlib import Path
 from typing import Optional, Tuple, Callable, Dict, Any
 
+import numpy as np
+
 from qgis.PyQt.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QMessageBox, QScrollArea, QFrame, QGroupBox, QRadioButton,
@@ -21,11 +25,30 @@ from qgis.PyQt.QtCore import Qt, pyqtSignal
 
 from qgis.core import (
     QgsCoordinateReferenceSystem, QgsProcessingFeedback, QgsProject,
-    QgsVectorFileWriter, QgsVectorLayer, QgsField, QgsFeature,
-    QgsWkbTypes, Qgis, QgsMessageLog
+    QgsVectorFileWriter, QgsVectorLayer, QgsField, QgsFields, QgsFeature,
+    QgsFeatureRequest, QgsFeatureSink, QgsWkbTypes, Qgis, QgsMessageLog
 )
 from qgis import processing
 
+try:
+    import shapely
+    # The vectorized STRtree/WKB API used for the overlay is Shapely 2.x only
+    HAS_SHAPELY = hasattr(shapely, 'from_wkb')
+except ImportError:
+    HAS_SHAPELY = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 # Import our shared components
 from hydro_suite_interface import HydroToolInterface, LayerSelectionMixin
 from shared_widgets import (
@@ -33,6 +56,32 @@ from shared_widgets import (
     ProgressLogger, ValidationPanel
 )
 
+# Soil group columns of RationalCTool.c_table, in order
+SOIL_GROUPS = np.array(['a', 'b', 'c', 'd'])
+
+# Features handed to the shapefile writer per addFeatures call
+OUTPUT_BATCH_SIZE = 1000
+
+
+@njit(cache=True)
+def _aggregate_c(codes, c_values, area_acres, n_catchments):
+    """
+    Sum area and C x area per catchment code in one pass
+    
+    Returns (total_area, c_area_sum, c_area) where c_area holds each
+    record's C x area product. Records are summed in input order, so the
+    totals match a plain running sum.
+    """
+    total_area = np.zeros(n_catchments)
+    c_area_sum = np.zeros(n_catchments)
+    c_area = np.empty(len(codes))
+    for i in range(len(codes)):
+        product = c_values[i] * area_acres[i]
+        c_area[i] = product
+        total_area[codes[i]] += area_acres[i]
+        c_area_sum[codes[i]] += product
+    return total_area, c_area_sum, c_area
+
 
 class RationalCTool(HydroToolInterface, LayerSelectionMixin):
     """Rational Method C Calculator tool with full GUI integration"""
@@ -48,6 +97,8 @@ class RationalCTool(HydroToolInterface, LayerSelectionMixin):
         # Tool-specific properties
         self.target_crs = QgsCoordinateReferenceSystem("EPSG:3361")
         self.lookup_data = {}
+        self.landuse_codes = {}
+        self.c_table = np.empty((0, 4))
         self.selected_slope = "0-2%"  # Default slope category
         
         # GUI components
@@ -356,20 +407,24 @@ class RationalCTool(HydroToolInterface, LayerSelectionMixin):
                 f"Expected format: landuse, a_0-2%, a_2-6%, a_6%+, b_0-2%, b_2-6%, b_6%+, etc."
             )
             
-        # Convert to lookup dictionary for current slope
-        self.lookup_data = {}
+        # Convert to a land use x soil group table for current slope: row
+        # codes from landuse_codes, columns a-d, NaN where there is no value
         suffix = f"_{self.selected_slope}"
-        
-        for _, row in df.iterrows():
-            landuse_key = str(row['landuse']).strip().lower()
-            for soil_group in ['a', 'b', 'c', 'd']:
-                col_name = f"{soil_group}{suffix}"
-                if col_name in df.columns:
-                    try:
-                        c_value = float(row[col_name])
-                        self.lookup_data[(landuse_key, soil_group)] = c_value
-                    except (ValueError, TypeError):
-                        pass  # Skip invalid values
+        landuse_keys = df['landuse'].map(str).str.strip().str.lower()
+        self.landuse_codes = {name: i for i, name in enumerate(sorted(set(landuse_keys)))}
+        row_codes = landuse_keys.map(self.landuse_codes).to_numpy()
+        
+        self.c_table = np.full((len(self.landuse_codes), 4), np.nan)
+        for soil_idx, soil_group in enumerate(SOIL_GROUPS):
+            values = pd.to_numeric(df[f"{soil_group}{suffix}"], errors='coerce').to_numpy(dtype=float)
+            valid = ~np.isnan(values)  # Skip invalid values
+            self.c_table[row_codes[valid], soil_idx] = values[valid]
+            
+        self.lookup_data = {
+            (landuse_key, str(SOIL_GROUPS[soil_idx])): float(self.c_table[code, soil_idx])
+            for landuse_key, code in self.landuse_codes.items()
+            for soil_idx in np.flatnonzero(~np.isnan(self.c_table[code]))
+        }
                         
         if not self.lookup_data:
             raise ValueError(f"No valid C values found for slope category '{self.selected_slope}'")
@@ -435,20 +490,28 @@ class RationalCTool(HydroToolInterface, LayerSelectionMixin):
             feedback = QgsProcessingFeedback()
             
             progress_callback(20, "Reprojecting layers...")
-            catchment_reproj = self.reproject_layer(catchment_layer, feedback)
-            landuse_reproj = self.reproject_layer(landuse_layer, feedback)
-            soils_reproj = self.reproject_layer(soils_layer, feedback)
-            
-            progress_callback(40, "Intersecting land use with soils...")
-            lu_soil = self.intersect_layers(landuse_reproj, soils_reproj, feedback)
-            
-            progress_callback(60, "Intersecting catchments with land use/soils...")
-            final_intersection = self.intersect_layers(catchment_reproj, lu_soil, feedback)
+            catchment_reproj = self.reproject_layer(catchment_layer, feedback, output_dir)
+            landuse_reproj = self.reproject_layer(landuse_layer, feedback, output_dir)
+            soils_reproj = self.reproject_layer(soils_layer, feedback, output_dir)
+            
+            if HAS_SHAPELY:
+                progress_callback(40, "Intersecting catchments with land use/soils...")
+                columns = self.overlay_columns(
+                    catchment_reproj, landuse_reproj, soils_reproj,
+                    catchment_field, landuse_field, soils_field
+                )
+            else:
+                progress_callback(40, "Intersecting land use with soils...")
+                lu_soil = self.intersect_layers(landuse_reproj, soils_reproj, feedback)
+                
+                progress_callback(60, "Intersecting catchments with land use/soils...")
+                final_intersection = self.intersect_layers(catchment_reproj, lu_soil, feedback)
+                columns = self.intersection_columns(
+                    final_intersection, catchment_field, landuse_field, soils_field
+                )
             
             progress_callback(80, "Calculating composite C values...")
-            results = self.calculate_composite_c(
-                final_intersection, catchment_field, landuse_field, soils_field
-            )
+            results = self.calculate_composite_c(columns)
             
             progress_callback(90, "Creating output files...")
             self.create_outputs(catchment_reproj, results, catchment_field, output_dir)
@@ -466,14 +529,67 @@ class RationalCTool(HydroToolInterface, LayerSelectionMixin):
         finally:
             self.progress_logger.show_progress(False)
             
-    def reproject_layer(self, layer: QgsVectorLayer, feedback) -> QgsVectorLayer:
-        """Reproject layer to target CRS if needed"""
+    def reproject_layer(self, layer: QgsVectorLayer, feedback,
+                        cache_dir: Optional[str] = None) -> QgsVectorLayer:
+        """Reproject layer to target CRS if needed
+        
+        File-based layers without unsaved edits are reprojected into a
+        GeoPackage in cache_dir (which gets an R-tree spatial index) and
+        reused on later runs while it is newer than every file of the source
+        and has the same feature count.
+        """
         if layer.crs() == self.target_crs:
             return layer
+            
+        source_uri = layer.dataProvider().dataSourceUri()
+        source_path = source_uri.split('|')[0]
+        if not cache_dir or not os.path.isfile(source_path) or layer.isModified():
+            self.progress_logger.log(f"Reprojecting {layer.name()}")
+            params = {'INPUT': layer, 'TARGET_CRS': self.target_crs, 'OUTPUT': 'memory:'}
+            result = processing.run("native:reprojectlayer", params, feedback=feedback)
+            return result['OUTPUT']
+            
+        # Key on the full source (sublayer included) and any filter, so
+        # different layers or subsets of one file never share a cache
+        safe_name = re.sub(r'[^\w-]', '_', layer.name())
+        source_key = zlib.crc32(
+            f"{os.path.abspath(source_path)}|{source_uri}|{layer.subsetString()}".encode('utf-8')
+        )
+        cache_path = os.path.join(
+            cache_dir, f"_cache_{safe_name}_{source_key:08x}_{self.target_crs.postgisSrid()}.gpkg"
+        )
+        if (os.path.exists(cache_path)
+                and os.path.getmtime(cache_path) >= self._source_mtime(source_path)):
+            cached = QgsVectorLayer(cache_path, layer.name(), "ogr")
+            if (cached.isValid() and cached.crs() == self.target_crs
+                    and cached.featureCount() == layer.featureCount()):
+                self.progress_logger.log(f"Using cached reprojection of {layer.name()}")
+                return cached
+            # Release the file before removing it (Windows keeps it locked)
+            del cached
+                
         self.progress_logger.log(f"Reprojecting {layer.name()}")
-        params = {'INPUT': layer, 'TARGET_CRS': self.target_crs, 'OUTPUT': 'memory:'}
-        result = processing.run("native:reprojectlayer", params, feedback=feedback)
-        return result['OUTPUT']
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+        params = {'INPUT': layer, 'TARGET_CRS': self.target_crs, 'OUTPUT': cache_path}
+        processing.run("native:reprojectlayer", params, feedback=feedback)
+        return QgsVectorLayer(cache_path, layer.name(), "ogr")
+        
+    @staticmethod
+    def _source_mtime(source_path: str) -> float:
+        """Latest modification time of a data file and its sidecars
+        
+        Covers e.g. the .dbf/.shx/.prj of a shapefile and the -wal journal
+        of a GeoPackage, so attribute-only edits invalidate the cache too.
+        """
+        folder, file_name = os.path.split(os.path.abspath(source_path))
+        stem = os.path.splitext(file_name)[0]
+        mtime = os.path.getmtime(source_path)
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.name.startswith(stem + '.') or entry.name.startswith(file_name + '-'):
+                    mtime = max(mtime, entry.stat().st_mtime)
+        return mtime
         
     def intersect_layers(self, layer1: QgsVectorLayer, layer2: QgsVectorLayer, feedback) -> QgsVectorLayer:
         """Perform intersection between two layers"""
@@ -485,111 +601,277 @@ class RationalCTool(HydroToolInterface, LayerSelectionMixin):
             raise ValueError(f"Intersection resulted in no features")
         return intersection
         
-    def calculate_composite_c(self, intersection_layer: QgsVectorLayer, 
-                            catchment_field: str, landuse_field: str, soils_field: str) -> Dict:
-        """Calculate composite C values for each catchment"""
-        catchment_data = {}
-        detailed_records = []
+    def intersection_columns(self, intersection_layer: QgsVectorLayer, catchment_field: str,
+                             landuse_field: str, soils_field: str) -> Tuple[np.ndarray, ...]:
+        """Read catchment_id, landuse, soil group and area_sqft arrays from an intersection layer"""
+        request = QgsFeatureRequest().setSubsetOfAttributes(
+            [catchment_field, landuse_field, soils_field], intersection_layer.fields()
+        )
+        catchment_ids, landuse_values, soil_values, areas = [], [], [], []
+        for feature in intersection_layer.getFeatures(request):
+            catchment_ids.append(feature[catchment_field])
+            landuse_values.append(feature[landuse_field])
+            soil_values.append(feature[soils_field])
+            areas.append(feature.geometry().area())
+        return (np.array(catchment_ids, dtype=object), np.array(landuse_values, dtype=object),
+                np.array(soil_values, dtype=object), np.asarray(areas, dtype=float))
+            
+    def overlay_columns(self, catchment_layer: QgsVectorLayer, landuse_layer: QgsVectorLayer,
+                        soils_layer: QgsVectorLayer, catchment_field: str, landuse_field: str,
+                        soils_field: str) -> Tuple[np.ndarray, ...]:
+        """Intersect catchments, land use and soils with a shapely STRtree join
+        
+        Returns the same catchment_id, landuse, soil group and area_sqft
+        arrays as intersection_columns without building intermediate QGIS
+        layers.
+        """
+        self.progress_logger.log(f"Intersecting {landuse_layer.name()} with {soils_layer.name()}")
+        lu_geoms, lu_attrs = self._load_layer_arrays(landuse_layer, [landuse_field])
+        soil_geoms, soil_attrs = self._load_layer_arrays(soils_layer, [soils_field])
+        lu_idx, soil_idx, lu_soil, lu_soil_areas = self.overlay_geometries(lu_geoms, soil_geoms)
+        if len(lu_soil) == 0:
+            raise ValueError("Intersection resulted in no features")
+            
+        self.progress_logger.log(f"Intersecting {catchment_layer.name()} with land use/soils")
+        catchment_geoms, catchment_attrs = self._load_layer_arrays(catchment_layer, [catchment_field])
+        catchment_idx, piece_idx, pieces, areas = self.overlay_geometries(
+            catchment_geoms, lu_soil, areas2=lu_soil_areas
+        )
+        if len(pieces) == 0:
+            raise ValueError("Intersection resulted in no features")
+            
+        return (
+            catchment_attrs[catchment_field][catchment_idx],
+            lu_attrs[landuse_field][lu_idx[piece_idx]],
+            soil_attrs[soils_field][soil_idx[piece_idx]],
+            areas
+        )
         
-        for feature in intersection_layer.getFeatures():
-            catchment_id = feature[catchment_field]
-            landuse_code = str(feature[landuse_field]).strip().lower()
-            soil_group_raw = str(feature[soils_field]).strip()
-            
-            soil_group = self.parse_soil_group(soil_group_raw)
-            
-            area_sqft = feature.geometry().area()
-            area_acres = area_sqft / 43560.0
-            
-            if soil_group is None:
-                c_value = 0.95
-                self.progress_logger.log(f"Using default C=0.95 for unrecognized soil group: {soil_group_raw}")
-            else:
-                c_key = (landuse_code, soil_group)
-                if c_key not in self.lookup_data:
-                    self.progress_logger.log(f"Warning: No C value for '{landuse_code}' / '{soil_group}'", "warning")
-                    continue
-                c_value = self.lookup_data[c_key]
-            
-            if catchment_id not in catchment_data:
-                catchment_data[catchment_id] = {'total_area': 0.0, 'c_area_sum': 0.0, 'details': []}
+    @staticmethod
+    def _load_layer_arrays(layer: QgsVectorLayer, field_names: list) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Read a layer's non-empty features into a shapely array and per-field value arrays
+        
+        Only the requested attributes are fetched, and all the WKB is
+        decoded by a single shapely.from_wkb call.
+        """
+        request = QgsFeatureRequest().setSubsetOfAttributes(field_names, layer.fields())
+        wkbs = []
+        columns = {name: [] for name in field_names}
+        for feature in layer.getFeatures(request):
+            geom = feature.geometry()
+            if geom.isEmpty():
+                continue
+            wkbs.append(bytes(geom.asWkb()))
+            for name in field_names:
+                columns[name].append(feature[name])
+        attrs = {name: np.array(values, dtype=object) for name, values in columns.items()}
+        return shapely.from_wkb(wkbs), attrs
+        
+    @classmethod
+    def overlay_geometries(cls, geoms1: np.ndarray, geoms2: np.ndarray,
+                           areas1: Optional[np.ndarray] = None,
+                           areas2: Optional[np.ndarray] = None) -> Tuple[np.ndarray, ...]:
+        """Intersect two geometry arrays for every overlapping pair
+        
+        Returns (index1, index2, pieces, areas). Candidate pairs come from
+        one bulk STRtree query, so only geometries whose bounding boxes
+        overlap are considered. When one geometry lies wholly inside the
+        other the piece is that geometry and its known area is reused, so
+        only partial overlaps are clipped. Pairs that only touch along an
+        edge or at a point are dropped, as native:intersection does.
+        """
+        if areas1 is None:
+            areas1 = shapely.area(geoms1)
+        if areas2 is None:
+            areas2 = shapely.area(geoms2)
+            
+        # Each geometry is tested against many candidates, so prepare both
+        # sides once; the vectorized predicates then use the prepared form
+        shapely.prepare(geoms1)
+        shapely.prepare(geoms2)
+        
+        tree = shapely.STRtree(geoms2)
+        idx1, idx2 = tree.query(geoms1, predicate="intersects")
+        first, second = geoms1[idx1], geoms2[idx2]
+        
+        second_inside = shapely.contains_properly(first, second)
+        first_inside = ~second_inside & shapely.contains_properly(second, first)
+        clip = ~(second_inside | first_inside)
+        
+        pieces = second.copy()
+        pieces[first_inside] = first[first_inside]
+        pieces[clip] = shapely.intersection(first[clip], second[clip])
+        
+        areas = np.empty(len(idx1))
+        areas[second_inside] = areas2[idx2[second_inside]]
+        areas[first_inside] = areas1[idx1[first_inside]]
+        areas[clip] = shapely.area(pieces[clip])
+        
+        keep = areas > 0
+        return idx1[keep], idx2[keep], cls._polygonal_parts(pieces[keep]), areas[keep]
+        
+    @staticmethod
+    def _polygonal_parts(geoms: np.ndarray) -> np.ndarray:
+        """Reduce any GeometryCollection in geoms to a MultiPolygon of its polygonal parts
+        
+        A clip that overlaps in one place and touches along an edge
+        elsewhere comes back as POLYGON + LINESTRING. Dropping the
+        non-polygonal parts matches native:intersection and keeps the
+        pieces usable in relate predicates, which reject collections on
+        older GEOS. Every geometry passed in must have a non-zero area.
+        """
+        mixed = np.flatnonzero(shapely.get_type_id(geoms) == shapely.GeometryType.GEOMETRYCOLLECTION)
+        if len(mixed) == 0:
+            return geoms
+        parts, owner = shapely.get_parts(geoms[mixed], return_index=True)
+        polygonal = np.isin(shapely.get_type_id(parts),
+                            [shapely.GeometryType.POLYGON, shapely.GeometryType.MULTIPOLYGON])
+        polygons, sub_owner = shapely.get_parts(parts[polygonal], return_index=True)
+        geoms = geoms.copy()
+        geoms[mixed] = shapely.multipolygons(polygons, indices=owner[polygonal][sub_owner])
+        return geoms
+        
+    def calculate_composite_c(self, columns: Tuple[np.ndarray, ...]) -> Dict:
+        """Calculate composite C values for each catchment
+        
+        columns holds the catchment_id, landuse, soil group and area_sqft
+        arrays from intersection_columns or overlay_columns.
+        """
+        import pandas as pd
+        
+        catchment_ids, landuse_values, soil_values, areas_sqft = columns
+        landuse = pd.Series(landuse_values, dtype=object).map(str).str.strip().str.lower()
+        soil_raw = pd.Series(soil_values, dtype=object).map(str).str.strip()
+        soil = self.parse_soil_groups(soil_raw)
+        area_acres = np.asarray(areas_sqft, dtype=float) / 43560.0
+        
+        recognized = soil.notna().to_numpy()
+        lu_idx = landuse.map(self.landuse_codes).to_numpy(dtype=float)
+        soil_idx = np.searchsorted(SOIL_GROUPS, soil.fillna('').to_numpy(dtype=str))
+        known = recognized & ~np.isnan(lu_idx)
+        c_values = np.full(len(landuse), np.nan)
+        c_values[known] = self.c_table[lu_idx[known].astype(np.intp), soil_idx[known]]
+        
+        # Unrecognized soil groups get the default C; recognized ones without
+        # a lookup entry are left out of the composite
+        for raw, count in soil_raw[~recognized].value_counts(sort=False).items():
+            self.progress_logger.log(f"Using default C=0.95 for unrecognized soil group: {raw} ({count} areas)")
+        c_values[~recognized] = 0.95
+        missing = recognized & np.isnan(c_values)
+        if missing.any():
+            missing_pairs = pd.DataFrame({'landuse': landuse[missing], 'soil': soil[missing]}).drop_duplicates()
+            for landuse_code, soil_group in missing_pairs.itertuples(index=False):
+                self.progress_logger.log(f"Warning: No C value for '{landuse_code}' / '{soil_group}'", "warning")
                 
-            catchment_data[catchment_id]['total_area'] += area_acres
-            catchment_data[catchment_id]['c_area_sum'] += c_value * area_acres
-            
-            detail_record = {
+        keep = ~missing
+        catchment_ids = catchment_ids[keep]
+        landuse = landuse.to_numpy()[keep]
+        soil = soil.to_numpy()[keep]
+        soil_raw = soil_raw.to_numpy()[keep]
+        area_acres = area_acres[keep]
+        c_values = c_values[keep]
+        
+        # Per-catchment sums, keyed in order of first appearance. The codes
+        # come from a dict so IDs keep their exact values (NULL included)
+        code_of = {}
+        codes = np.fromiter(
+            (code_of.setdefault(catchment_id, len(code_of)) for catchment_id in catchment_ids),
+            dtype=np.intp, count=len(catchment_ids)
+        )
+        if HAS_NUMBA:
+            total_area, c_area_sum, c_area = _aggregate_c(codes, c_values, area_acres, len(code_of))
+        else:
+            c_area = c_values * area_acres
+            total_area = np.bincount(codes, weights=area_acres, minlength=len(code_of))
+            c_area_sum = np.bincount(codes, weights=c_area, minlength=len(code_of))
+        catchment_data = {
+            catchment_id: {'total_area': float(total_area[i]), 'c_area_sum': float(c_area_sum[i]), 'details': []}
+            for catchment_id, i in code_of.items()
+        }
+        
+        detailed_records = [
+            {
                 'catchment_id': catchment_id, 'landuse_code': landuse_code,
                 'soil_group': soil_group or 'N/A', 'soil_group_original': soil_group_raw,
-                'area_acres': area_acres, 'c_value': c_value, 'c_area_product': c_value * area_acres
+                'area_acres': area, 'c_value': c_value, 'c_area_product': product
             }
-            catchment_data[catchment_id]['details'].append(detail_record)
-            detailed_records.append(detail_record)
+            for catchment_id, landuse_code, soil_group, soil_group_raw, area, c_value, product in zip(
+                catchment_ids, landuse, soil, soil_raw,
+                area_acres.tolist(), c_values.tolist(), c_area.tolist()
+            )
+        ]
+        for record in detailed_records:
+            catchment_data[record['catchment_id']]['details'].append(record)
             
         return {'catchment_data': catchment_data, 'detailed_records': detailed_records}
         
-    def parse_soil_group(self, soil_group_raw: str) -> Optional[str]:
-        """Parse soil group, handling split HSGs"""
-        if not soil_group_raw or str(soil_group_raw).strip() == '':
-            return None
-        soil_group = str(soil_group_raw).strip().upper()
-        if '/' in soil_group:
-            parts = soil_group.split('/')
-            if len(parts) >= 2:
-                soil_group = parts[1].strip()
-        if soil_group in ['A', 'B', 'C', 'D']:
-            return soil_group.lower()
-        return None
+    @staticmethod
+    def parse_soil_groups(soil_groups_raw):
+        """
+        Parse a pandas Series of stripped soil group strings, handling split HSGs
+        
+        Split groups such as 'A/D' use the part after the slash. Returns
+        lower-case 'a'-'d', or None where the group isn't A-D.
+        """
+        upper = soil_groups_raw.str.upper()
+        split = upper.str.contains('/', regex=False)
+        soil = upper.where(~split, upper.str.split('/').str[1].str.strip())
+        return soil.str.lower().astype(object).where(soil.isin(['A', 'B', 'C', 'D']), None)
             
     def create_outputs(self, catchment_layer: QgsVectorLayer, results: Dict, 
                       catchment_field: str, output_dir: str):
         """Create output files"""
         from qgis.PyQt.QtCore import QVariant
         
-        output_layer = QgsVectorLayer(f"Polygon?crs={self.target_crs.authid()}", "catchments_c_value", "memory")
-        output_provider = output_layer.dataProvider()
-        
-        original_fields = catchment_layer.fields()
-        new_fields = [field for field in original_fields]
-        new_fields.append(QgsField("C_Comp", QVariant.Double, "double", 10, 3))
-        new_fields.append(QgsField("Area_acres", QVariant.Double, "double", 15, 2))
-        
-        output_provider.addAttributes(new_fields)
-        output_layer.updateFields()
-        
-        output_features = []
-        catchment_data = results['catchment_data']
-        
-        for orig_feature in catchment_layer.getFeatures():
-            catchment_id = orig_feature[catchment_field]
-            new_feature = QgsFeature()
-            new_feature.setGeometry(orig_feature.geometry())
-            attributes = list(orig_feature.attributes())
-            
-            if catchment_id in catchment_data and catchment_data[catchment_id]['total_area'] > 0:
-                data = catchment_data[catchment_id]
-                c_comp = data['c_area_sum'] / data['total_area']
-                total_area = data['total_area']
-            else:
-                c_comp = None
-                total_area = None
-                
-            attributes.extend([c_comp, total_area])
-            new_feature.setAttributes(attributes)
-            output_features.append(new_feature)
-            
-        output_provider.addFeatures(output_features)
+        fields = QgsFields(catchment_layer.fields())
+        fields.append(QgsField("C_Comp", QVariant.Double, "double", 10, 3))
+        fields.append(QgsField("Area_acres", QVariant.Double, "double", 15, 2))
         
         shp_path = os.path.join(output_dir, "catchments_with_c_value.shp")
         write_options = QgsVectorFileWriter.SaveVectorOptions()
         write_options.driverName = "ESRI Shapefile"
         write_options.fileEncoding = "UTF-8"
         
-        error = QgsVectorFileWriter.writeAsVectorFormatV3(
-            output_layer, shp_path, QgsProject.instance().transformContext(), write_options
+        # Stream straight into the shapefile instead of building a memory layer first
+        writer = QgsVectorFileWriter.create(
+            shp_path, fields, catchment_layer.wkbType(), self.target_crs,
+            QgsProject.instance().transformContext(), write_options
         )
+        if writer.hasError() != QgsVectorFileWriter.NoError:
+            raise ValueError(f"Error saving shapefile: {writer.errorMessage()}")
+            
+        catchment_data = results['catchment_data']
+        batch = []
         
-        if error[0] != QgsVectorFileWriter.NoError:
-            raise ValueError(f"Error saving shapefile: {error[1]}")
+        try:
+            for orig_feature in catchment_layer.getFeatures():
+                catchment_id = orig_feature[catchment_field]
+                new_feature = QgsFeature(fields)
+                new_feature.setGeometry(orig_feature.geometry())
+                attributes = list(orig_feature.attributes())
+                
+                if catchment_id in catchment_data and catchment_data[catchment_id]['total_area'] > 0:
+                    data = catchment_data[catchment_id]
+                    c_comp = data['c_area_sum'] / data['total_area']
+                    total_area = data['total_area']
+                else:
+                    c_comp = None
+                    total_area = None
+                    
+                attributes.extend([c_comp, total_area])
+                new_feature.setAttributes(attributes)
+                batch.append(new_feature)
+                
+                if len(batch) >= OUTPUT_BATCH_SIZE:
+                    if not writer.addFeatures(batch, QgsFeatureSink.FastInsert):
+                        raise ValueError(f"Error saving shapefile: {writer.errorMessage()}")
+                    batch = []
+                    
+            if batch and not writer.addFeatures(batch, QgsFeatureSink.FastInsert):
+                raise ValueError(f"Error saving shapefile: {writer.errorMessage()}")
+        finally:
+            # Deleting the writer flushes and closes the file
+            del writer
             
         self.save_detailed_csv(results['detailed_records'], catchment_data, output_dir)
         self.save_summary_csv(catchment_data, output_dir)
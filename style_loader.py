@@ -408,8 +408,8 @@ class StyleLoader:
             selection-color: {btn_fg};
         }}
         
-        /* List Widget */
-        QListWidget {{
+        /* List Widget (and the main window's tool list view) */
+        QListWidget, QListView#toolList {{
             background-color: {card};
             color: {fg};
             border: 1px solid {border};
@@ -417,17 +417,17 @@ class StyleLoader:
             outline: none;
         }}
         
-        QListWidget::item {{
+        QListWidget::item, QListView#toolList::item {{
             padding: 10px 12px;
             border-bottom: 1px solid {border};
         }}
         
-        QListWidget::item:selected {{
+        QListWidget::item:selected, QListView#toolList::item:selected {{
             background-color: {accent};
             color: {btn_fg};
         }}
         
-        QListWidget::item:hover:!selected {{
+        QListWidget::item:hover:!selected, QListView#toolList::item:hover:!selected {{
             background-color: {muted};
         }}
         